@@ -9,17 +9,106 @@ Phase 1.2: Physics-Agent
 """
 
 import subprocess
+import atexit
+import copy
 import logging
+import logging.handlers
 import time
 import json
 import os
+import re
 import shlex
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 from datetime import datetime
 from enum import Enum
 
 
+# Section delimiter for the batched remote probe. It is printed on its own
+# line (with a leading newline, since a probe's output may not end in one):
+# on stdout followed by the section's exit code, and bare on stderr.
+_PROBE_DELIM = "@@@POLARIS_PROBE"
+_PROBE_SPLIT_RE = re.compile(rf"\n{_PROBE_DELIM}(\d+)\n")
+_PROBE_ERR_DELIM = f"\n{_PROBE_DELIM}\n"
+_PROBE_SECTIONS = ("heartbeat", "queue", "outcar", "oszicar", "convergence")
+
+# Ionic-step line: "  12 F= -.12345678E+02 E0= ..." -> (step, F energy)
+_OSZICAR_STEP_RE = re.compile(r"^\s*(\d+)\s+\S+\s+(\S+)")
+
+# Bytes read from the end of OSZICAR (an ionic-step line is ~80 bytes)
+_OSZICAR_TAIL_BYTES = 512
+
+# SSH stderr fragments that indicate an expired MFA session (single C-level scan)
+_MFA_RE = re.compile(
+    r"permission denied|publickey|authentication failed|connection closed by remote host",
+    re.IGNORECASE,
+)
+
+
+_LOGGER_LOCK = threading.Lock()
+
+
+def _decode(data: Optional[bytes]) -> str:
+    """Decode subprocess output; empty/None stays cheap."""
+    if not data:
+        return ""
+    return data.decode("utf-8", "replace")
+
+
+def _vasp_paths(path: str) -> Tuple[str, str, str]:
+    """Normalize a VASP run directory once -> (directory, OUTCAR path, OSZICAR path)."""
+    directory = path.rstrip("/") or "/"
+    base = directory.rstrip("/")
+    return directory, f"{base}/OUTCAR", f"{base}/OSZICAR"
+
+
+def _convergence_command(outcar_path: str) -> str:
+    """grep -q stops at the first match; the exit code (0/1/2) is echoed back."""
+    return f'grep -q "reached required accuracy" {outcar_path}; echo $?'
+
+
+def _get_monitor_logger(log_path: Path) -> logging.Logger:
+    """
+    Return the shared 'physics_monitor' logger, attaching handlers only once.
+
+    Creating several monitors must not stack duplicate handlers (each record
+    would otherwise be written N times).
+    """
+    logger = logging.getLogger('physics_monitor')
+    with _LOGGER_LOCK:
+        if logger.handlers:
+            return logger
+
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+        # Ensure log directory exists
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # File handler: rotating file behind a memory buffer. Records are
+        # written in batches of 256; ERROR and above flush immediately.
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path, maxBytes=10 * 1024 * 1024, backupCount=5
+        )
+        file_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        )
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=256, flushLevel=logging.ERROR, target=file_handler
+        )
+        logger.addHandler(buffered_handler)
+        atexit.register(buffered_handler.flush)
+
+        # Console handler for debugging
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(
+            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        )
+        logger.addHandler(console_handler)
+    return logger
+
+
 class JobStatus(Enum):
     """VASP job status states"""
     RUNNING = "RUNNING"
@@ -41,32 +130,24 @@ class HPCMonitor:
     - Crash-safe logging
     """
 
+    # Queue listings shared by all monitors: (host, queue_cmd) -> (monotonic ts, stdout).
+    # One qstat/squeue lists every job of the user, so a sweep over K jobs
+    # only needs to fetch it once.
+    _queue_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+    _queue_ttl: float = float(os.getenv("HPC_QUEUE_CACHE_TTL", "3.0"))
+
     def __init__(self, log_path: Optional[Path] = None):
         """Initialize Physics Monitor"""
         if log_path is None:
             project_dir = Path(__file__).parent
             log_path = project_dir / "logs" / "physics.log"
 
-        # Ensure log directory exists
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        # Set up logging (handlers are attached once per process)
+        self.logger = _get_monitor_logger(log_path)
 
-        # Set up logging
-        self.logger = logging.getLogger('physics_monitor')
-        self.logger.setLevel(logging.INFO)
-
-        # File handler
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        )
-        self.logger.addHandler(file_handler)
-
-        # Console handler for debugging
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        )
-        self.logger.addHandler(console_handler)
+        # Short-lived monitor_job results keyed by (profile, job_id, path)
+        self._status_cache: Dict[Tuple[str, str, str], Tuple[float, Dict]] = {}
+        self._status_ttl = float(os.getenv("HPC_STATUS_CACHE_TTL", "2.0"))
 
         self.hpc_profiles = self._load_profiles()
         requested = os.getenv("HPC_ACTIVE_PROFILE", "").strip()
@@ -107,6 +188,7 @@ class HPCMonitor:
                 "remote_path": os.getenv("HPC_REMOTE_PATH", ""),
                 "pbs_qstat_path": os.getenv("PBS_QSTAT_PATH", "/opt/pbs/bin/qstat"),
                 "slurm_squeue_path": os.getenv("SLURM_SQUEUE_PATH", "/usr/bin/squeue"),
+                "ssh_control_path": os.getenv("HPC_SSH_CONTROL_PATH", ""),
             }
         }
 
@@ -122,6 +204,10 @@ class HPCMonitor:
         self.hpc_remote_path = str(cfg.get("remote_path", "")).strip()
         self.pbs_qstat_path = str(cfg.get("pbs_qstat_path", "/opt/pbs/bin/qstat")).strip()
         self.slurm_squeue_path = str(cfg.get("slurm_squeue_path", "/usr/bin/squeue")).strip()
+        self.ssh_control_path = str(
+            cfg.get("ssh_control_path", os.getenv("HPC_SSH_CONTROL_PATH", ""))
+        ).strip()
+        self.ssh_control_persist = os.getenv("HPC_SSH_CONTROL_PERSIST", "600").strip() or "600"
         self.hpc_username = self._resolve_hpc_username(
             host=self.hpc_host,
             explicit_user=str(cfg.get("username", "")).strip(),
@@ -150,7 +236,7 @@ class HPCMonitor:
 
         try:
             result = subprocess.run(
-                ['ssh', '-o', 'ConnectTimeout=10', host, 'whoami'],
+                self._ssh_argv(host, 'whoami'),
                 capture_output=True,
                 text=True,
                 timeout=10
@@ -185,6 +271,63 @@ class HPCMonitor:
 
         return command
 
+    def _ssh_options(self) -> list[str]:
+        """
+        Common ssh options.
+
+        When ssh_control_path is set, OpenSSH connection multiplexing is used:
+        the first successful call becomes the master and later calls reuse it
+        without a new handshake. Authentication itself is still whatever the
+        user's ssh setup does (no credentials are supplied here).
+        """
+        options = ['-o', 'ConnectTimeout=10']
+        if self.ssh_control_path:
+            options += [
+                '-o', 'ControlMaster=auto',
+                '-o', f'ControlPath={self.ssh_control_path}',
+                '-o', f'ControlPersist={self.ssh_control_persist}',
+            ]
+        return options
+
+    def _ssh_argv(self, host: str, command: str) -> list[str]:
+        """Build the ssh argv shared by every remote call (single place for connection options)."""
+        return ['ssh', *self._ssh_options(), host, command]
+
+    def close(self):
+        """Stop the multiplexed master connection for the active host, if any."""
+        if not self.ssh_control_path:
+            return
+        try:
+            subprocess.run(
+                ['ssh', '-o', f'ControlPath={self.ssh_control_path}', '-O', 'exit', self.hpc_host],
+                capture_output=True,
+                timeout=5
+            )
+        except Exception as e:
+            self.logger.debug("SSH control master exit failed: %s", e)
+
+    def _get_cached_queue(self, queue_cmd: str) -> Optional[str]:
+        """Return a recent queue listing for this host/command, if any."""
+        entry = self._queue_cache.get((self.hpc_host, queue_cmd))
+        if entry and time.monotonic() - entry[0] < self._queue_ttl:
+            return entry[1]
+        return None
+
+    def _store_queue(self, queue_cmd: str, stdout: str):
+        """Remember a successful queue listing."""
+        self._queue_cache[(self.hpc_host, queue_cmd)] = (time.monotonic(), stdout)
+
+    def _run_queue_command(self, queue_cmd: str) -> Tuple[bool, str, str]:
+        """Run the queue command, serving a recent cached listing when possible."""
+        cached = self._get_cached_queue(queue_cmd)
+        if cached is not None:
+            return True, cached, ""
+
+        success, stdout, stderr = self.run_ssh_command(queue_cmd)
+        if success:
+            self._store_queue(queue_cmd, stdout)
+        return success, stdout, stderr
+
     def zombie_guard(self) -> bool:
         """
         Probe SSH connection with 10s timeout
@@ -194,24 +337,23 @@ class HPCMonitor:
         """
         try:
             result = subprocess.run(
-                ['ssh', '-o', 'ConnectTimeout=10', self.hpc_host, 'echo heartbeat'],
+                self._ssh_argv(self.hpc_host, 'echo heartbeat'),
                 capture_output=True,
-                text=True,
                 timeout=10
             )
 
-            if result.returncode == 0 and 'heartbeat' in result.stdout:
+            if result.returncode == 0 and b'heartbeat' in result.stdout:
                 self.logger.debug("Zombie guard: Connection alive")
                 return True
             else:
-                self.logger.warning(f"Zombie guard: Connection failed (code {result.returncode})")
+                self.logger.warning("Zombie guard: Connection failed (code %s)", result.returncode)
                 return False
 
         except subprocess.TimeoutExpired:
             self.logger.error("Zombie guard: SSH timeout (10s)")
             return False
         except Exception as e:
-            self.logger.error(f"Zombie guard: Exception - {e}")
+            self.logger.error("Zombie guard: Exception - %s", e)
             return False
 
     def check_mfa_session(self, stderr: str) -> bool:
@@ -224,17 +366,10 @@ class HPCMonitor:
         Returns:
             True if MFA expired
         """
-        mfa_indicators = [
-            'Permission denied',
-            'publickey',
-            'Authentication failed',
-            'Connection closed by remote host'
-        ]
-
-        for indicator in mfa_indicators:
-            if indicator.lower() in stderr.lower():
-                self.logger.warning(f"MFA indicator detected: {indicator}")
-                return True
+        match = _MFA_RE.search(stderr)
+        if match:
+            self.logger.warning("MFA indicator detected: %s", match.group(0))
+            return True
 
         return False
 
@@ -250,21 +385,23 @@ class HPCMonitor:
             (success, stdout, stderr)
         """
         try:
+            # Raw bytes from the pipe; decoded once here (no universal-newlines pass)
             result = subprocess.run(
-                ['ssh', self.hpc_host, command],
+                self._ssh_argv(self.hpc_host, command),
                 capture_output=True,
-                text=True,
                 timeout=timeout
             )
 
             success = result.returncode == 0
-            return success, result.stdout, result.stderr
+            return success, _decode(result.stdout), _decode(result.stderr)
 
-        except subprocess.TimeoutExpired:
-            self.logger.error(f"SSH command timeout: {command}")
-            return False, "", "Timeout"
+        except subprocess.TimeoutExpired as e:
+            self.logger.error("SSH command timeout: %s", command)
+            # Keep whatever arrived before the timeout (lets callers tell a
+            # slow remote command from a dead connection)
+            return False, _decode(e.stdout), "Timeout"
         except Exception as e:
-            self.logger.error(f"SSH command exception: {e}")
+            self.logger.error("SSH command exception: %s", e)
             return False, "", str(e)
 
     def check_job_queue(self, job_id: str) -> Tuple[JobStatus, str]:
@@ -277,15 +414,18 @@ class HPCMonitor:
         Returns:
             (status, message)
         """
-        self.logger.info(f"Step 1: Checking queue for job {job_id}")
+        self.logger.info("Step 1: Checking queue for job %s", job_id)
 
         try:
             queue_cmd = self._build_queue_command()
         except ValueError as e:
             return JobStatus.ERROR, str(e)
 
-        success, stdout, stderr = self.run_ssh_command(queue_cmd)
+        success, stdout, stderr = self._run_queue_command(queue_cmd)
+        return self._parse_job_queue(job_id, success, stdout, stderr)
 
+    def _parse_job_queue(self, job_id: str, success: bool, stdout: str, stderr: str) -> Tuple[JobStatus, str]:
+        """Interpret scheduler queue output for a single job."""
         if not success:
             if self.check_mfa_session(stderr):
                 return JobStatus.MFA_EXPIRED, "MFA session expired"
@@ -308,10 +448,10 @@ class HPCMonitor:
                         else:
                             queue_status = "UNKNOWN"
 
-                    self.logger.info(f"Job {job_id} found in queue: {queue_status}")
+                    self.logger.info("Job %s found in queue: %s", job_id, queue_status)
                     return JobStatus.RUNNING, f"Job in queue (status: {queue_status})"
 
-        self.logger.warning(f"Job {job_id} not found in qstat output")
+        self.logger.warning("Job %s not found in qstat output", job_id)
         return JobStatus.NOT_FOUND, "Job not in queue"
 
     def _parse_queue_output(self, stdout: str) -> list[dict]:
@@ -374,7 +514,7 @@ class HPCMonitor:
             result["error"] = str(e)
             return result
 
-        success, stdout, stderr = self.run_ssh_command(queue_cmd)
+        success, stdout, stderr = self._run_queue_command(queue_cmd)
         if not success:
             if self.check_mfa_session(stderr):
                 result["error"] = "MFA session expired"
@@ -388,21 +528,25 @@ class HPCMonitor:
         result["raw"] = stdout
         return result
 
-    def check_outcar_modification(self, path: str) -> Tuple[JobStatus, str, Optional[int]]:
+    def check_outcar_modification(self, outcar_path: str) -> Tuple[JobStatus, str, Optional[int]]:
         """
         Step 2: Check OUTCAR modification time
 
         Args:
-            path: Path to VASP calculation directory
+            outcar_path: Remote OUTCAR path (see _vasp_paths)
 
         Returns:
             (status, message, last_modified_timestamp)
         """
-        self.logger.info(f"Step 2: Checking OUTCAR modification time in {path}")
+        self.logger.info("Step 2: Checking OUTCAR modification time: %s", outcar_path)
 
-        outcar_path = f"{path}/OUTCAR"
         success, stdout, stderr = self.run_ssh_command(f'stat -c %Y {outcar_path}')
+        return self._parse_outcar_modification(success, stdout, stderr)
 
+    def _parse_outcar_modification(
+        self, success: bool, stdout: str, stderr: str
+    ) -> Tuple[JobStatus, str, Optional[int]]:
+        """Interpret `stat -c %Y OUTCAR` output."""
         if not success:
             if self.check_mfa_session(stderr):
                 return JobStatus.MFA_EXPIRED, "MFA session expired", None
@@ -414,7 +558,7 @@ class HPCMonitor:
             age_seconds = current_time - mtime
             age_minutes = age_seconds / 60
 
-            self.logger.info(f"OUTCAR last modified {age_minutes:.1f} minutes ago")
+            self.logger.info("OUTCAR last modified %.1f minutes ago", age_minutes)
 
             # If modified within last 10 minutes, assume still running
             if age_minutes < 10:
@@ -425,21 +569,25 @@ class HPCMonitor:
         except ValueError:
             return JobStatus.ERROR, "Failed to parse OUTCAR modification time", None
 
-    def check_oszicar_progress(self, path: str) -> Tuple[JobStatus, str, Optional[Dict]]:
+    def check_oszicar_progress(self, oszicar_path: str) -> Tuple[JobStatus, str, Optional[Dict]]:
         """
         Step 3: Parse OSZICAR for steps and energy
 
         Args:
-            path: Path to VASP calculation directory
+            oszicar_path: Remote OSZICAR path (see _vasp_paths)
 
         Returns:
             (status, message, progress_dict)
         """
-        self.logger.info(f"Step 3: Parsing OSZICAR in {path}")
+        self.logger.info("Step 3: Parsing OSZICAR: %s", oszicar_path)
 
-        oszicar_path = f"{path}/OSZICAR"
-        success, stdout, stderr = self.run_ssh_command(f'tail -1 {oszicar_path}')
+        success, stdout, stderr = self.run_ssh_command(f'tail -c {_OSZICAR_TAIL_BYTES} {oszicar_path}')
+        return self._parse_oszicar_progress(success, stdout, stderr)
 
+    def _parse_oszicar_progress(
+        self, success: bool, stdout: str, stderr: str
+    ) -> Tuple[JobStatus, str, Optional[Dict]]:
+        """Interpret the last OSZICAR line."""
         if not success:
             if self.check_mfa_session(stderr):
                 return JobStatus.MFA_EXPIRED, "MFA session expired", None
@@ -447,15 +595,13 @@ class HPCMonitor:
 
         try:
             # Parse OSZICAR line: "  1 F= -.12345678E+02 E0= -.12345678E+02  d E =0.123456E+00"
-            line = stdout.strip()
-            parts = line.split()
-
-            if len(parts) >= 3:
-                step = int(parts[0])
-                energy_str = parts[2]
+            lines = stdout.strip().splitlines()
+            line = lines[-1].strip() if lines else ""
+            match = _OSZICAR_STEP_RE.match(line)
 
-                # Extract energy value
-                energy = float(energy_str.replace('E', 'e'))
+            if match:
+                step = int(match.group(1))
+                energy = float(match.group(2))
 
                 progress = {
                     'step': step,
@@ -463,45 +609,109 @@ class HPCMonitor:
                     'raw_line': line
                 }
 
-                self.logger.info(f"OSZICAR progress: Step {step}, Energy {energy:.6f} eV")
+                self.logger.info("OSZICAR progress: Step %d, Energy %.6f eV", step, energy)
                 return JobStatus.RUNNING, f"Step {step}, E={energy:.6f} eV", progress
             else:
                 return JobStatus.ERROR, "Failed to parse OSZICAR format", None
 
         except (ValueError, IndexError) as e:
-            self.logger.error(f"OSZICAR parsing error: {e}")
+            self.logger.error("OSZICAR parsing error: %s", e)
             return JobStatus.ERROR, f"OSZICAR parse error: {e}", None
 
-    def check_convergence(self, path: str) -> Tuple[JobStatus, str]:
+    def check_convergence(self, outcar_path: str) -> Tuple[JobStatus, str]:
         """
         Step 4: Check if calculation converged
 
         Args:
-            path: Path to VASP calculation directory
+            outcar_path: Remote OUTCAR path (see _vasp_paths)
 
         Returns:
             (status, message)
         """
-        self.logger.info(f"Step 4: Checking convergence in {path}")
+        self.logger.info("Step 4: Checking convergence: %s", outcar_path)
 
-        outcar_path = f"{path}/OUTCAR"
         success, stdout, stderr = self.run_ssh_command(
-            f'grep "reached required accuracy" {outcar_path}'
+            _convergence_command(outcar_path)
         )
+        return self._parse_convergence(success, stdout, stderr)
 
+    def _parse_convergence(self, success: bool, stdout: str, stderr: str) -> Tuple[JobStatus, str]:
+        """Interpret the `grep -q` exit code echoed by _convergence_command."""
         if not success:
             if self.check_mfa_session(stderr):
                 return JobStatus.MFA_EXPIRED, "MFA session expired"
-            # grep returns non-zero if pattern not found (not an error)
-            if "reached required accuracy" not in stdout:
-                return JobStatus.RUNNING, "Not converged yet"
             return JobStatus.ERROR, "Failed to check convergence"
 
-        if "reached required accuracy" in stdout:
+        code = stdout.strip()
+        if code == "0":
             self.logger.info("✅ Calculation converged!")
             return JobStatus.CONVERGED, "Calculation converged successfully"
-        else:
+        if code == "1":
+            # grep exit 1 = pattern not found (not an error)
             return JobStatus.RUNNING, "Not converged yet"
+        return JobStatus.ERROR, "Failed to check convergence"
+
+    def _batched_probe(
+        self, queue_cmd: str, outcar_path: str, oszicar_path: str
+    ) -> Tuple[Optional[Dict[str, Tuple[bool, str, str]]], str]:
+        """
+        Run heartbeat/queue/stat/tail/grep probes in a single SSH invocation.
+
+        Each probe's stdout and stderr are followed by a delimiter line (the
+        stdout one carries its exit code), so the per-step parsers see the same
+        (success, stdout, stderr) they would get from separate calls. SSH's own
+        messages (e.g. an MFA prompt) land in the heartbeat section. The
+        leading heartbeat doubles as the zombie guard, so the whole monitor
+        pass costs one round-trip.
+
+        Args:
+            queue_cmd: Scheduler queue command (see _build_queue_command)
+            outcar_path: Remote OUTCAR path
+            oszicar_path: Remote OSZICAR path
+
+        Returns:
+            ({section: (success, stdout, stderr)}, stderr of the whole call).
+            The dict is empty when the connection was alive but the probes did
+            not finish, and None when the connection itself failed.
+        """
+        snippets = (
+            "echo heartbeat",
+            queue_cmd,
+            f"stat -c %Y {outcar_path}",
+            f"tail -c {_OSZICAR_TAIL_BYTES} {oszicar_path}",
+            _convergence_command(outcar_path),
+        )
+        command = " ".join(
+            f"{snippet}; printf '\\n%s%s\\n' \"{_PROBE_DELIM}\" $?; "
+            f"printf '\\n%s\\n' \"{_PROBE_DELIM}\" >&2;"
+            for snippet in snippets
+        )
+
+        _, stdout, stderr = self.run_ssh_command(command)
+
+        # [out0, rc0, out1, rc1, ..., trailing]
+        chunks = _PROBE_SPLIT_RE.split(stdout)
+        if len(chunks) < 2 * len(_PROBE_SECTIONS) + 1:
+            # Heartbeat came back but later probes were cut off (e.g. timeout)
+            if len(chunks) > 1 and chunks[0].strip() == "heartbeat":
+                return {}, stderr
+            return None, stderr
+
+        errors = stderr.split(_PROBE_ERR_DELIM)
+        errors += [""] * (len(_PROBE_SECTIONS) - len(errors))
+        sections: Dict[str, Tuple[bool, str, str]] = {}
+        for i, name in enumerate(_PROBE_SECTIONS):
+            rc = int(chunks[2 * i + 1])
+            sections[name] = (rc == 0, chunks[2 * i], errors[i])
+        return sections, stderr
+
+    def invalidate(self, job_id: Optional[str] = None):
+        """Drop cached monitor_job results (all, or only those for job_id)."""
+        if job_id is None:
+            self._status_cache.clear()
+            return
+        for key in [k for k in self._status_cache if k[1] == job_id]:
+            del self._status_cache[key]
 
     def monitor_job(self, job_id: str, path: str, cluster: Optional[str] = None) -> Dict:
         """
@@ -518,6 +728,25 @@ class HPCMonitor:
         if cluster and cluster != self.profile_name:
             self.set_profile(cluster)
 
+        path, outcar_path, oszicar_path = _vasp_paths(path)
+        cache_key = (self.profile_name, job_id, path)
+        cached = self._status_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._status_ttl:
+            return copy.deepcopy(cached[1])
+
+        result = self._monitor_job_uncached(job_id, path, outcar_path, oszicar_path)
+
+        # Only steady RUNNING states are worth re-serving; terminal/error
+        # transitions must be seen by the next poll. Callers get their own
+        # copy, so mutating a result never leaks into later cache hits.
+        if result['status'] == JobStatus.RUNNING.value:
+            self._status_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+        else:
+            self._status_cache.pop(cache_key, None)
+        return result
+
+    def _monitor_job_uncached(self, job_id: str, path: str, outcar_path: str, oszicar_path: str) -> Dict:
+        """Run the full probe hierarchy for monitor_job (no caching)."""
         self.logger.info(
             "=== Monitoring job %s at %s (profile=%s, host=%s) ===",
             job_id,
@@ -536,15 +765,41 @@ class HPCMonitor:
             'details': {}
         }
 
-        # Zombie guard
-        if not self.zombie_guard():
-            result['status'] = JobStatus.ZOMBIE.value
-            result['message'] = "SSH connection timeout or zombie"
-            self.logger.error("Zombie guard failed - aborting monitor")
+        # Zombie guard + all four probes share one SSH round-trip
+        cached_queue = None
+        try:
+            queue_cmd = self._build_queue_command()
+            queue_error = None
+            cached_queue = self._get_cached_queue(queue_cmd)
+        except ValueError as e:
+            queue_cmd, queue_error = "true", str(e)
+
+        # Skip the remote queue listing when another job just fetched it
+        sections, stderr = self._batched_probe(
+            "true" if cached_queue is not None else queue_cmd, outcar_path, oszicar_path
+        )
+        if sections == {}:
+            result['message'] = f"Remote probe incomplete: {stderr.strip() or 'no output'}"
+            return result
+        if sections is None:
+            if self.check_mfa_session(stderr):
+                result['status'] = JobStatus.MFA_EXPIRED.value
+                result['message'] = "MFA session expired"
+            else:
+                result['status'] = JobStatus.ZOMBIE.value
+                result['message'] = "SSH connection timeout or zombie"
+                self.logger.error("Zombie guard failed - aborting monitor")
             return result
 
         # Step 1: Check job queue
-        queue_status, queue_msg = self.check_job_queue(job_id)
+        if queue_error:
+            queue_status, queue_msg = JobStatus.ERROR, queue_error
+        else:
+            if cached_queue is not None:
+                sections['queue'] = (True, cached_queue, "")
+            elif sections['queue'][0]:
+                self._store_queue(queue_cmd, sections['queue'][1])
+            queue_status, queue_msg = self._parse_job_queue(job_id, *sections['queue'])
         result['details']['queue'] = {'status': queue_status.value, 'message': queue_msg}
 
         if queue_status == JobStatus.MFA_EXPIRED:
@@ -558,7 +813,7 @@ class HPCMonitor:
             pass
 
         # Step 2: Check OUTCAR modification
-        outcar_status, outcar_msg, mtime = self.check_outcar_modification(path)
+        outcar_status, outcar_msg, mtime = self._parse_outcar_modification(*sections['outcar'])
         result['details']['outcar'] = {
             'status': outcar_status.value,
             'message': outcar_msg,
@@ -576,7 +831,7 @@ class HPCMonitor:
             return result
 
         # Step 3: Parse OSZICAR
-        oszicar_status, oszicar_msg, progress = self.check_oszicar_progress(path)
+        oszicar_status, oszicar_msg, progress = self._parse_oszicar_progress(*sections['oszicar'])
         result['details']['oszicar'] = {
             'status': oszicar_status.value,
             'message': oszicar_msg,
@@ -589,7 +844,7 @@ class HPCMonitor:
             return result
 
         # Step 4: Check convergence
-        conv_status, conv_msg = self.check_convergence(path)
+        conv_status, conv_msg = self._parse_convergence(*sections['convergence'])
         result['details']['convergence'] = {
             'status': conv_status.value,
             'message': conv_msg
@@ -609,7 +864,7 @@ class HPCMonitor:
         result['status'] = JobStatus.RUNNING.value
         result['message'] = oszicar_msg if oszicar_msg else "Job running"
 
-        self.logger.info(f"Monitor complete: {result['status']} - {result['message']}")
+        self.logger.info("Monitor complete: %s - %s", result['status'], result['message'])
         return result
 
 
@@ -7,6 +7,7 @@ Search → Download → Analyze papers automatically
 import os
 import sys
 import argparse
+import logging
 import re
 import urllib.request
 import urllib.parse
@@ -27,13 +28,15 @@ OBSIDIAN_PATH = os.getenv("OBSIDIAN_PATH")
 if not OBSIDIAN_PATH:
     OBSIDIAN_PATH = None
 
+logger = logging.getLogger(__name__)
+
 # ========================================
 # arXiv API
 # ========================================
 
 def search_arxiv(query, max_results=10):
     """arXiv에서 논문 검색"""
-    print(f"🔍 Searching arXiv for: {query}")
+    logger.info("🔍 Searching arXiv for: %s", query)
 
     base_url = "http://export.arxiv.org/api/query?"
     params = {
@@ -92,7 +95,7 @@ def search_arxiv(query, max_results=10):
 
         return papers
     except Exception as e:
-        print(f"❌ arXiv search failed: {e}")
+        logger.warning("❌ arXiv search failed: %s", e)
         return []
 
 # ========================================
@@ -101,7 +104,7 @@ def search_arxiv(query, max_results=10):
 
 def search_semantic_scholar(query, max_results=10):
     """Semantic Scholar에서 논문 검색"""
-    print(f"🔍 Searching Semantic Scholar for: {query}")
+    logger.info("🔍 Searching Semantic Scholar for: %s", query)
 
     url = "https://api.semanticscholar.org/graph/v1/paper/search"
     params = {
@@ -149,7 +152,7 @@ def search_semantic_scholar(query, max_results=10):
 
         return papers
     except Exception as e:
-        print(f"❌ Semantic Scholar search failed: {e}")
+        logger.warning("❌ Semantic Scholar search failed: %s", e)
         return []
 
 # ========================================
@@ -190,7 +193,7 @@ def generate_citekey(authors, year):
 def download_pdf(pdf_url, save_path):
     """PDF 다운로드"""
     try:
-        print(f"  📥 Downloading PDF...")
+        logger.info("📥 Downloading PDF: %s", pdf_url)
         response = requests.get(pdf_url, timeout=30, stream=True)
         response.raise_for_status()
 
@@ -200,14 +203,19 @@ def download_pdf(pdf_url, save_path):
 
         return True
     except Exception as e:
-        print(f"  ❌ PDF download failed: {e}")
+        logger.warning("❌ PDF download failed: %s", e)
         return False
 
-def create_paper_note(paper, paper_dir):
-    """Papers_Zotero_v3 템플릿으로 논문 노트 생성"""
+def create_paper_note(paper, paper_dir, *, today=None, citekey=None):
+    """Papers_Zotero_v3 템플릿으로 논문 노트 생성
 
-    citekey = generate_citekey(paper['authors'], paper['year'])
-    today = datetime.now().strftime("%Y-%m-%d")
+    배치 실행 시 호출자가 today/citekey를 미리 계산해 넘기면 재계산을 생략한다.
+    """
+
+    if citekey is None:
+        citekey = generate_citekey(paper['authors'], paper['year'])
+    if today is None:
+        today = datetime.now().strftime("%Y-%m-%d")
 
     # DOI URL
     doi_url = f"https://doi.org/{paper['doi']}" if paper['doi'] else ""
@@ -279,7 +287,18 @@ tags:
 # 메인 워크플로우
 # ========================================
 
-def main():
+def parse_selection(selection, papers):
+    """선택 문자열('all' 또는 '1,3,5')을 논문 리스트로 변환 (잘못된 입력이면 None)"""
+    if selection.strip().lower() == 'all':
+        return list(papers)
+
+    try:
+        indices = [int(x.strip()) - 1 for x in selection.split(',')]
+    except ValueError:
+        return None
+    return [papers[i] for i in indices if 0 <= i < len(papers)]
+
+def main(argv=None):
     parser = argparse.ArgumentParser(
         description="Search, download, and analyze papers automatically"
     )
@@ -287,10 +306,25 @@ def main():
     parser.add_argument('--max-results', type=int, default=10, help='Maximum results to show')
     parser.add_argument('--source', choices=['arxiv', 'semantic', 'both'], default='both',
                         help='Search source (default: both)')
-    parser.add_argument('--auto-analyze', action='store_true',
-                        help='Automatically run analysis after download')
-
-    args = parser.parse_args()
+    parser.add_argument('--select', type=str, default=None,
+                        help="Non-interactive selection: comma-separated indices (e.g. 1,3,5) or 'all'")
+    analyze_group = parser.add_mutually_exclusive_group()
+    analyze_group.add_argument('--auto-analyze', dest='auto_analyze', action='store_true', default=None,
+                               help='Automatically run analysis after download')
+    analyze_group.add_argument('--no-auto-analyze', dest='auto_analyze', action='store_false',
+                               help='Skip analysis without prompting')
+    parser.add_argument('--log-level', type=str, default=None,
+                        help='Logging level (default: INFO on a TTY, WARNING otherwise)')
+
+    args = parser.parse_args(argv)
+
+    # 비대화식(배치) 실행에서는 네트워크 진행 로그를 줄여 tty flush 비용 제거
+    log_level = args.log_level or ("INFO" if sys.stderr.isatty() else "WARNING")
+    logging.basicConfig(
+        level=log_level.upper(),
+        format="%(message)s",
+        stream=sys.stderr,
+    )
 
     # 1. 논문 검색
     papers = []
@@ -332,17 +366,15 @@ def main():
 
     # 3. 사용자 선택
     print(f"\n{'='*60}")
-    selection = input("Select papers [1-10, comma-separated, or 'all']: ").strip()
-
-    if selection.lower() == 'all':
-        selected_papers = papers
+    if args.select is not None:
+        selection = args.select
     else:
-        try:
-            indices = [int(x.strip()) - 1 for x in selection.split(',')]
-            selected_papers = [papers[i] for i in indices if 0 <= i < len(papers)]
-        except:
-            print("❌ Invalid selection")
-            return
+        selection = input("Select papers [1-10, comma-separated, or 'all']: ").strip()
+
+    selected_papers = parse_selection(selection, papers)
+    if selected_papers is None:
+        print("❌ Invalid selection")
+        return
 
     if not selected_papers:
         print("❌ No papers selected")
@@ -355,6 +387,7 @@ def main():
     os.makedirs(papers_base, exist_ok=True)
 
     created_notes = []
+    today = datetime.now().strftime("%Y-%m-%d")
 
     for paper in selected_papers:
         print(f"\n📄 {paper['title'][:60]}...")
@@ -374,14 +407,19 @@ def main():
             print(f"  ⚠️  No PDF available")
 
         # 노트 생성
-        citekey, note_path = create_paper_note(paper, paper_dir)
+        citekey, note_path = create_paper_note(paper, paper_dir, today=today, citekey=citekey)
         created_notes.append((citekey, note_path))
         print(f"  ✅ Note created: {citekey}.md")
 
     # 5. 분석 옵션
     print(f"\n🎉 Complete! Created {len(created_notes)} paper note(s)")
 
-    if args.auto_analyze or input("\n🤖 Run AI analysis now? [Y/n]: ").strip().lower() in ['y', 'yes', '']:
+    if args.auto_analyze is None:
+        run_analysis = input("\n🤖 Run AI analysis now? [Y/n]: ").strip().lower() in ['y', 'yes', '']
+    else:
+        run_analysis = args.auto_analyze
+
+    if run_analysis:
         print("\n🤖 Running analysis...")
         for citekey, note_path in created_notes:
             print(f"\n  Analyzing {citekey}...")
@@ -200,7 +200,7 @@ class PhDAgent:
         if not results:
             return "검색 결과 없음"
 
-        formatted = f"📚 검색 결과 ({len(results)}개)\n\n"
+        parts = [f"📚 검색 결과 ({len(results)}개)\n\n"]
 
         for i, paper in enumerate(results, 1):
             title = paper.get('title', 'No title')
@@ -216,16 +216,16 @@ class PhDAgent:
             else:
                 authors_str = authors
 
-            formatted += f"{i}. **{title}**\n"
-            formatted += f"   👤 {authors_str}\n"
-            formatted += f"   📅 {year}"
+            parts.append(f"{i}. **{title}**\n")
+            parts.append(f"   👤 {authors_str}\n")
+            parts.append(f"   📅 {year}")
             if journal:
-                formatted += f" | 📖 {journal}"
-            formatted += "\n\n"
+                parts.append(f" | 📖 {journal}")
+            parts.append("\n\n")
 
-        formatted += "💡 다운로드하려면 번호를 선택하세요 (예: /download 1)"
+        parts.append("💡 다운로드하려면 번호를 선택하세요 (예: /download 1)")
 
-        return formatted
+        return "".join(parts)
 
     def download_and_save(self, paper: Dict, llm_choice: str = "gemini") -> Dict:
         """
@@ -257,7 +257,7 @@ class PhDAgent:
                 pdf_path = None
 
             # 메타데이터 노트 생성
-            note_path = create_paper_note(paper, paper_dir)
+            _, note_path = create_paper_note(paper, paper_dir, citekey=citekey)
 
             # 분석 (선택적)
             analysis_path = None
@@ -7,13 +7,21 @@ before executing.
 """
 
 import asyncio
+import inspect
 import logging
-import uuid
+import reprlib
+import secrets
+import time
 from enum import Enum
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+try:
+    from asyncio import timeout as _timeout  # Python 3.11+
+except ImportError:  # pragma: no cover - older interpreters
+    from async_timeout import timeout as _timeout
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,12 +48,31 @@ TOOL_RISK_MAP: Dict[str, RiskLevel] = {
     "send_email_reply": RiskLevel.CRITICAL,
 }
 
+# AUTO tools as a frozenset for the common no-approval fast path
+# (TOOL_RISK_MAP stays the source of truth)
+_AUTO_TOOLS = frozenset(
+    name for name, level in TOOL_RISK_MAP.items() if level is RiskLevel.AUTO
+)
+
 # Timeout in seconds per risk level
 _TIMEOUTS: Dict[RiskLevel, int] = {
     RiskLevel.CONFIRM: 300,    # 5 minutes
     RiskLevel.CRITICAL: 1800,  # 30 minutes
 }
 
+# Bounded repr for approval prompts (huge values never get fully rendered)
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = 80
+_ARG_REPR.maxother = 80
+_ARG_REPR.maxlist = 10
+
+# Approval keyboard labels / callback_data prefixes (only the id varies per request)
+_APPROVE_LABEL, _DENY_LABEL = "Yes", "No"
+_APPROVE_PREFIX, _DENY_PREFIX = "approve:", "deny:"
+
+# Pending entries older than this are dropped by the sweeper
+_PENDING_MAX_AGE = max(_TIMEOUTS.values()) + 60
+
 
 class ApprovalGate:
     """Gate that checks risk level and optionally asks the user before executing a tool."""
@@ -53,6 +80,10 @@ class ApprovalGate:
     def __init__(self):
         # callback_id → asyncio.Future mapping for pending approvals
         self._pending: Dict[str, asyncio.Future] = {}
+        # callback_id → monotonic registration time (for the stale sweep)
+        self._pending_since: Dict[str, float] = {}
+        # tool_name → (execute_fn, is_coroutine_function), decided once per callable
+        self._async_tools: Dict[str, Tuple[Callable, bool]] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -71,12 +102,12 @@ class ApprovalGate:
         Returns:
             {"approved": bool, "result": <tool result or None>, "approval_level": str}
         """
-        risk = TOOL_RISK_MAP.get(tool_name, RiskLevel.CONFIRM)
-
         # AUTO — just run it
-        if risk == RiskLevel.AUTO:
-            result = await self._call(execute_fn, tool_args)
-            return {"approved": True, "result": result, "approval_level": risk.value}
+        if tool_name in _AUTO_TOOLS:
+            result = await self._call(tool_name, execute_fn, tool_args)
+            return {"approved": True, "result": result, "approval_level": RiskLevel.AUTO.value}
+
+        risk = TOOL_RISK_MAP.get(tool_name, RiskLevel.CONFIRM)
 
         # CONFIRM / CRITICAL — ask user via Telegram
         if bot is None or chat_id is None:
@@ -93,7 +124,7 @@ class ApprovalGate:
         if not approved:
             return {"approved": False, "result": None, "approval_level": risk.value}
 
-        result = await self._call(execute_fn, tool_args)
+        result = await self._call(tool_name, execute_fn, tool_args)
         return {"approved": True, "result": result, "approval_level": risk.value}
 
     async def handle_callback(self, callback_query) -> None:
@@ -108,6 +139,7 @@ class ApprovalGate:
         action, callback_id = data.split(":", 1)
 
         future = self._pending.pop(callback_id, None)
+        self._pending_since.pop(callback_id, None)
         if future is None or future.done():
             await callback_query.answer("This request has expired.")
             return
@@ -138,7 +170,7 @@ class ApprovalGate:
         risk: RiskLevel,
     ) -> bool:
         """Send an inline-keyboard message and wait for the user's response."""
-        callback_id = uuid.uuid4().hex[:12]
+        callback_id = secrets.token_hex(6)  # 48 random bits, 12 hex chars
         timeout = _TIMEOUTS[risk]
 
         # Build message text
@@ -156,45 +188,89 @@ class ApprovalGate:
                 f"Approve execution? (timeout: {timeout // 60} min)"
             )
 
-        keyboard = InlineKeyboardMarkup(
-            [
-                [
-                    InlineKeyboardButton("Yes", callback_data=f"approve:{callback_id}"),
-                    InlineKeyboardButton("No", callback_data=f"deny:{callback_id}"),
-                ]
-            ]
-        )
-
-        await bot.send_message(chat_id=chat_id, text=text, reply_markup=keyboard)
+        keyboard = _approval_keyboard(callback_id)
 
-        # Create a future and wait with timeout
+        # Register the future before sending so a fast callback can't miss it
+        self._prune_pending()
         loop = asyncio.get_running_loop()
         future: asyncio.Future[bool] = loop.create_future()
         self._pending[callback_id] = future
+        self._pending_since[callback_id] = time.monotonic()
 
         try:
-            approved = await asyncio.wait_for(future, timeout=timeout)
-            return approved
-        except asyncio.TimeoutError:
+            await bot.send_message(chat_id=chat_id, text=text, reply_markup=keyboard)
+
+            try:
+                async with _timeout(timeout):
+                    approved = await future
+                return approved
+            except asyncio.TimeoutError:
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text=f"Approval request for '{tool_name}' timed out. Action denied.",
+                )
+                return False
+        finally:
+            # Always release the entry (send failure, timeout, cancellation)
             self._pending.pop(callback_id, None)
-            await bot.send_message(
-                chat_id=chat_id,
-                text=f"Approval request for '{tool_name}' timed out. Action denied.",
-            )
-            return False
+            self._pending_since.pop(callback_id, None)
+
+    def _prune_pending(self) -> None:
+        """Drop resolved or stale pending approvals left behind by other paths."""
+        cutoff = time.monotonic() - _PENDING_MAX_AGE
+        for callback_id, future in list(self._pending.items()):
+            since = self._pending_since.get(callback_id)
+            if future.done() or (since is not None and since < cutoff):
+                self._pending.pop(callback_id, None)
+                self._pending_since.pop(callback_id, None)
+
+    async def _call(self, tool_name: str, execute_fn: Callable, tool_args: dict) -> Any:
+        """Invoke *execute_fn*. Supports both sync and async callables.
+
+        Whether the callable is async is decided the first time it is seen for
+        *tool_name*, not on every call. A sync callable that returns an
+        awaitable (e.g. a partial over a coroutine function) is still awaited.
+        """
+        cached = self._async_tools.get(tool_name)
+        if cached is None or cached[0] is not execute_fn:
+            cached = (execute_fn, inspect.iscoroutinefunction(execute_fn))
+            self._async_tools[tool_name] = cached
 
-    @staticmethod
-    async def _call(execute_fn: Callable, tool_args: dict) -> Any:
-        """Invoke *execute_fn*. Supports both sync and async callables."""
+        if cached[1]:
+            return await execute_fn(**tool_args)
         result = execute_fn(**tool_args)
-        if asyncio.iscoroutine(result):
+        if inspect.isawaitable(result):
             result = await result
         return result
 
 
+def _approval_keyboard(callback_id: str) -> InlineKeyboardMarkup:
+    """Yes/No inline keyboard for one approval request."""
+    return InlineKeyboardMarkup(
+        (
+            (
+                InlineKeyboardButton(_APPROVE_LABEL, callback_data=_APPROVE_PREFIX + callback_id),
+                InlineKeyboardButton(_DENY_LABEL, callback_data=_DENY_PREFIX + callback_id),
+            ),
+        )
+    )
+
+
 def _format_args(args: dict, max_len: int = 200) -> str:
-    """Pretty-print tool args, truncating if too long."""
-    text = ", ".join(f"{k}={v!r}" for k, v in args.items())
-    if len(text) > max_len:
-        text = text[:max_len] + "..."
-    return text
+    """Pretty-print tool args, truncating if too long.
+
+    Stops rendering once *max_len* is reached instead of building the full
+    string first.
+    """
+    parts = []
+    total = 0
+    for k, v in args.items():
+        piece = f"{k}={_ARG_REPR.repr(v)}"
+        if parts:
+            piece = ", " + piece
+        if total + len(piece) > max_len:
+            parts.append(piece[:max_len - total])
+            return "".join(parts) + "..."
+        parts.append(piece)
+        total += len(piece)
+    return "".join(parts)
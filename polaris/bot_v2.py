@@ -6,10 +6,15 @@ Uses PolarisRouter (ReAct loop) instead of keyword-based PolarisOrchestrator.
 Integrates ApprovalGate for tool execution control and TraceLogger for audit trail.
 """
 
+import io
 import os
 import logging
 import asyncio
-from typing import Dict, List
+import functools
+import time
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional
 from pathlib import Path
 
 from telegram import Update, BotCommand
@@ -23,19 +28,23 @@ from telegram.ext import (
 )
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency (not on Windows)
+    uvloop = None
+
 from polaris.router import PolarisRouter
 from polaris.approval_gate import ApprovalGate
 from polaris.trace_logger import TraceLogger
 from polaris.tools import get_all_tools
 from polaris.mailops import MailOpsService, MailOpsPoller
-from polaris.services import HotReloader
-
-# Legacy agent imports for explicit command handlers
-from mail_reader import MailReader
-from email_analyzer import EmailAnalyzer
-from phd_agent import PhDAgent
-from hpc_monitor import HPCMonitor, JobStatus
-from schedule_agent import ScheduleAgent
+from polaris.services import (
+    ConversationCache,
+    HotReloader,
+    StreamingReply,
+    TraceBatcher,
+    markdown_balanced,
+)
 
 load_dotenv()
 
@@ -45,6 +54,76 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# user_data key holding the response a pending /wrong correction refers to
+_CORRECTION_KEY = "wrong_original"
+
+_WELCOME_TEXT = (
+    "**Polaris v2**\n\n"
+    "Your research north star.\n\n"
+    "**Features:**\n"
+    "- Paper search/analysis (arXiv, Semantic Scholar)\n"
+    "- TA email classification\n"
+    "- HPC job monitoring\n"
+    "- iCloud Calendar\n"
+    "- LLM-powered natural language routing\n\n"
+    "Type /help for commands, or just ask me anything."
+)
+
+_HELP_TEXT = (
+    "**Polaris v2 Commands**\n\n"
+    "/start - Welcome\n"
+    "/help - This message\n"
+    "/status - System status\n"
+    "/mail - Check primary mail account\n"
+    "/search <query> - Search papers\n"
+    "/schedule - Today/tomorrow calendar\n"
+    "/hpc [status|jobs] [cluster] - HPC status and queue\n"
+    "/trace - Show recent action traces\n"
+    "/tools - List registered tools\n"
+    "/skills - List registered skills\n"
+    "/wrong - Mark last response as wrong\n"
+    "/feedback - Show recent feedback\n"
+    "/index - Index Obsidian vault\n"
+    "/vault - Vault status / search\n"
+    "/mail\\_digest - Unified mail digest\n"
+    "/mail\\_accounts - Apple Mail account names\n"
+    "/mail\\_urgent - Urgent mails only\n"
+    "/mail\\_promo - Promotion/deal mails\n"
+    "/mail\\_actions - Propose safe mail actions\n"
+    "/reload - Reload runtime components\n\n"
+    "Or just type naturally and Polaris will route your request."
+)
+
+_STATUS_TEMPLATE = (
+    "**Polaris v2 Status**\n\n"
+    "**Router:** PolarisRouter (ReAct loop)\n"
+    "**Model:** %(model)s\n"
+    "**Tools:** %(tools)d registered\n"
+    "**Approval Gate:** Active\n"
+    "**Trace Logger:** Active\n"
+)
+
+# /hpc argument shapes ("*" = cluster name) -> (action arg index, cluster
+# arg index); a None action index means the default "status".
+_HPC_ACTIONS = frozenset({"status", "jobs"})
+_HPC_ARGS = {
+    (): (None, None),
+    ("*",): (None, 0),
+    ("status",): (0, None),
+    ("jobs",): (0, None),
+    ("*", "status"): (1, 0),
+    ("*", "jobs"): (1, 0),
+}
+_HPC_ARGS.update({(a, b): (0, 1) for a in _HPC_ACTIONS for b in (*_HPC_ACTIONS, "*")})
+
+# Row templates for list replies. Missing keys fall back to the defaults via
+# ChainMap, so each row renders with a single format_map call.
+_DIGEST_ROW = "- [{category}] {subject} ({account_id})".format_map
+_MAIL_ROW = "- {subject} / {sender}".format_map
+_TRACE_ROW = "`{timestamp:.19}` | {tool} | {approval_level}".format_map
+_MAIL_ROW_DEFAULTS = {"category": "info", "subject": "", "account_id": "unknown", "sender": ""}
+_TRACE_ROW_DEFAULTS = {"timestamp": "?", "tool": "?", "approval_level": "?"}
+
 
 class PolarisBotV2:
     """Polaris Telegram Bot v2 with LLM-powered routing."""
@@ -55,11 +134,6 @@ class PolarisBotV2:
         self.trace_logger = TraceLogger()
 
         self.obsidian_path = os.getenv("OBSIDIAN_PATH", os.path.expanduser("~/Documents"))
-        self.phd_agent = PhDAgent(self.obsidian_path)
-        self.mail_reader = MailReader()
-        self.email_analyzer = EmailAnalyzer()
-        self.hpc_monitor = HPCMonitor()
-        self.schedule_agent = ScheduleAgent()
         self.mailops = None
         self.mailops_poll_interval = int(os.getenv("POLARIS_MAILOPS_POLL_INTERVAL", "300"))
         try:
@@ -71,9 +145,31 @@ class PolarisBotV2:
         self._mailops_poller = (
             MailOpsPoller(self.mailops, self.mailops_poll_interval) if self.mailops else None
         )
+        self._mailops_task: Optional[asyncio.Task] = None
+
+        # Per-user conversation history, evicted when idle or over capacity
+        self.conversations = ConversationCache()
+
+        # Blocking Apple Mail / SQLite / SSH / CalDAV calls run on a small
+        # dedicated pool so they cannot starve the default executor, and
+        # identical calls already in flight are shared instead of repeated.
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=int(os.getenv("POLARIS_IO_WORKERS", "4")),
+            thread_name_prefix="polaris-io",
+        )
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+        # Long-running command jobs (/mail, /schedule, /index) by key
+        self._background: Dict[Hashable, asyncio.Task] = {}
 
-        # Per-user conversation history
-        self.conversations: Dict[int, List[dict]] = {}
+        # /tools, /skills, /status listings; reset by _on_runtime_reload
+        self._tools_cache: Optional[list] = None
+        self._tools_text: Optional[str] = None
+        self._skills_text: Optional[str] = None
+
+        # Background warm-up of the router and registries after startup
+        self.warmup_enabled = os.getenv("POLARIS_WARMUP", "true").lower() == "true"
+        self._warmup_task: Optional[asyncio.Task] = None
 
         # Hot-reload settings
         self.auto_reload = os.getenv("POLARIS_AUTO_RELOAD", "true").lower() == "true"
@@ -84,64 +180,223 @@ class PolarisBotV2:
         self.reload_check_interval = float(os.getenv("POLARIS_RELOAD_CHECK_INTERVAL", "2.0"))
         self._hot_reloader = HotReloader(
             watch_root=Path(__file__).resolve().parent.parent,
-            on_runtime_reload=self.router._init_skills,
+            on_runtime_reload=self._on_runtime_reload,
             auto_reload=self.auto_reload,
             auto_restart_on_code_change=self.auto_restart_on_code_change,
             check_interval=self.reload_check_interval,
         )
+        self._reload_stop: Optional[asyncio.Event] = None
+        self._reload_task: Optional[asyncio.Task] = None
+
+        # Trace records from handlers, written on the I/O pool in batches
+        self.traces = TraceBatcher(self.trace_logger, run_io=self._run_io)
 
         logger.info("Polaris Bot v2 initialized")
 
+    # ------------------------------------------------------------------
+    # Legacy agents (imported and built on first use)
+    # ------------------------------------------------------------------
+
+    @functools.cached_property
+    def phd_agent(self):
+        from phd_agent import PhDAgent
+        return PhDAgent(self.obsidian_path)
+
+    @functools.cached_property
+    def mail_reader(self):
+        from mail_reader import MailReader
+        return MailReader()
+
+    @functools.cached_property
+    def email_analyzer(self):
+        from email_analyzer import EmailAnalyzer
+        return EmailAnalyzer()
+
+    @functools.cached_property
+    def hpc_monitor(self):
+        from hpc_monitor import HPCMonitor
+        return HPCMonitor()
+
+    @functools.cached_property
+    def schedule_agent(self):
+        from schedule_agent import ScheduleAgent
+        return ScheduleAgent()
+
+    async def _agent(self, name: str):
+        """Return a legacy agent, building it on the I/O pool the first time.
+
+        Construction can import heavy modules or call remote APIs, so it is
+        kept off the event loop.
+        """
+        if name in self.__dict__:
+            return self.__dict__[name]
+        return await self._run_io(getattr, self, name)
+
+    # ------------------------------------------------------------------
+    # Blocking I/O helpers
+    # ------------------------------------------------------------------
+
+    async def _run_io(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the bot's I/O pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._io_pool, functools.partial(fn, *args, **kwargs))
+
+    async def _coalesced(self, key: Hashable, fn: Callable[..., Any], *args) -> Any:
+        """Run ``fn(*args)`` on the I/O pool, sharing one call per in-flight ``key``.
+
+        Concurrent callers with the same key await the same task. The task
+        is shielded so one cancelled handler does not cancel the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run_io(fn, *args))
+            self._inflight[key] = task
+
+            def _release(done: asyncio.Task) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(_release)
+        return await asyncio.shield(task)
+
+    async def _sync_mail(self) -> dict:
+        """Sync unread mail once for all mail commands currently waiting on it."""
+        return await self._coalesced("mail_sync", self.mailops.sync_unread, 20)
+
+    # ------------------------------------------------------------------
+    # Replies
+    # ------------------------------------------------------------------
+
+    async def _send(self, update: Optional[Update], text: str, chat_id: Optional[int] = None):
+        """Reply to ``update`` (or message ``chat_id``) as Markdown, else plain text."""
+        if update is not None:
+            send = update.message.reply_text
+        else:
+            send = functools.partial(self.application.bot.send_message, chat_id=chat_id)
+        if markdown_balanced(text):
+            try:
+                return await send(text=text, parse_mode="Markdown")
+            except Exception as e:
+                logger.debug("Markdown rejected, sending plain text: %s", e)
+        return await send(text=text)
+
+    # ------------------------------------------------------------------
+    # Hot reload
+    # ------------------------------------------------------------------
+
+    def start_hot_reload(self):
+        """Start the file watcher on the running event loop."""
+        if not self.auto_reload or self._reload_task is not None:
+            return
+        self._reload_stop = asyncio.Event()
+        self._reload_task = asyncio.create_task(self._hot_reloader.watch(self._reload_stop))
+
+    async def stop_hot_reload(self):
+        """Stop the file watcher and wait for it to exit."""
+        if self._reload_task is None:
+            return
+        self._reload_stop.set()
+        try:
+            await self._reload_task
+        except Exception as e:
+            logger.warning("Hot-reload watcher exited with error: %s", e)
+        self._reload_task = None
+
+    # ------------------------------------------------------------------
+    # MailOps polling
+    # ------------------------------------------------------------------
+
+    def start_mail_poller(self):
+        """Start periodic urgent-mail polling on the running event loop."""
+        if self._mailops_poller and self._mailops_task is None:
+            self._mailops_task = asyncio.create_task(self._mailops_poller.run(self.application))
+
+    async def stop_mail_poller(self):
+        """Stop the poller and wait for an in-flight poll to finish."""
+        if self._mailops_task is None:
+            return
+        self._mailops_poller.stop()
+        await self._mailops_task
+        self._mailops_task = None
+
+    # ------------------------------------------------------------------
+    # Background command jobs
+    # ------------------------------------------------------------------
+
+    def _spawn(self, key: Hashable, fn: Callable[..., Any], *args) -> bool:
+        """Start ``fn(*args)`` as a tracked task unless ``key`` is still running.
+
+        Returns False when a job with the same key is in flight; its blocking
+        work cannot be interrupted, so starting another would only repeat it.
+        """
+        task = self._background.get(key)
+        if task is not None and not task.done():
+            return False
+        task = asyncio.create_task(fn(*args))
+        self._background[key] = task
+
+        def _release(done: asyncio.Task) -> None:
+            if self._background.get(key) is done:
+                del self._background[key]
+
+        task.add_done_callback(_release)
+        return True
+
+    async def stop_background(self):
+        """Cancel command jobs still running at shutdown and wait for them."""
+        tasks = list(self._background.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def stop_hpc_monitors(self):
+        """Tear down the SSH master connections held by cached HPC monitors."""
+        from polaris.tools.hpc_tools import close_monitors
+
+        await self._run_io(close_monitors)
+        if "hpc_monitor" in self.__dict__:
+            await self._run_io(self.hpc_monitor.close)
+
+    # ------------------------------------------------------------------
+    # Warm-up
+    # ------------------------------------------------------------------
+
+    def start_warmup(self):
+        """Prime the router and registry caches in the background after startup."""
+        if self.warmup_enabled and self._warmup_task is None:
+            self._warmup_task = asyncio.create_task(self._warmup())
+
+    def stop_warmup(self):
+        """Cancel a warm-up that is still running at shutdown."""
+        if self._warmup_task is not None and not self._warmup_task.done():
+            self._warmup_task.cancel()
+
+    async def _warmup(self):
+        started = time.monotonic()
+        await asyncio.gather(
+            self.router.awarmup(),
+            self._run_io(self._get_tools_text),
+            self._run_io(self._get_skills_text),
+            return_exceptions=True,
+        )
+        logger.info("Warm-up finished in %.1fs", time.monotonic() - started)
+
     # ------------------------------------------------------------------
     # Basic commands
     # ------------------------------------------------------------------
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        welcome = (
-            "**Polaris v2**\n\n"
-            "Your research north star.\n\n"
-            "**Features:**\n"
-            "- Paper search/analysis (arXiv, Semantic Scholar)\n"
-            "- TA email classification\n"
-            "- HPC job monitoring\n"
-            "- iCloud Calendar\n"
-            "- LLM-powered natural language routing\n\n"
-            "Type /help for commands, or just ask me anything."
-        )
-        await update.message.reply_text(welcome, parse_mode="Markdown")
+        await update.message.reply_text(_WELCOME_TEXT, parse_mode="Markdown")
 
     async def help_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        help_text = (
-            "**Polaris v2 Commands**\n\n"
-            "/start - Welcome\n"
-            "/help - This message\n"
-            "/status - System status\n"
-            "/mail - Check primary mail account\n"
-            "/search <query> - Search papers\n"
-            "/schedule - Today/tomorrow calendar\n"
-            "/hpc [status|jobs] [cluster] - HPC status and queue\n"
-            "/trace - Show recent action traces\n"
-            "/tools - List registered tools\n"
-            "/skills - List registered skills\n"
-            "/wrong - Mark last response as wrong\n"
-            "/feedback - Show recent feedback\n"
-            "/index - Index Obsidian vault\n"
-            "/vault - Vault status / search\n"
-            "/mail\\_digest - Unified mail digest\n"
-            "/mail\\_accounts - Apple Mail account names\n"
-            "/mail\\_urgent - Urgent mails only\n"
-            "/mail\\_promo - Promotion/deal mails\n"
-            "/mail\\_actions - Propose safe mail actions\n"
-            "/reload - Reload runtime components\n\n"
-            "Or just type naturally and Polaris will route your request."
-        )
-        await update.message.reply_text(help_text, parse_mode="Markdown")
+        await update.message.reply_text(_HELP_TEXT, parse_mode="Markdown")
 
     async def mail_accounts_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List Apple Mail account names to validate account keyword config."""
         try:
+            from mail_reader import MailReader
             reader = MailReader(account_keyword="*")
-            accounts = await asyncio.to_thread(reader.list_accounts)
+            accounts = await self._run_io(reader.list_accounts)
             if not accounts:
                 await update.message.reply_text("Apple Mail 계정을 찾지 못했어.")
                 return
@@ -157,8 +412,8 @@ class PolarisBotV2:
             return
 
         await update.message.reply_text("메일 동기화 및 요약 중...")
-        data = await asyncio.to_thread(self.mailops.sync_unread, 20)
-        rows = await asyncio.to_thread(self.mailops.get_digest, 20)
+        data = await self._sync_mail()
+        rows = await self._run_io(self.mailops.get_digest, 20)
         if not rows:
             await update.message.reply_text("새로 분류된 메일이 없어.")
             return
@@ -168,9 +423,7 @@ class PolarisBotV2:
             f"sync: fetched={data['fetched']}, new={data['inserted']}, urgent_new={data['urgent_new']}",
             "",
         ]
-        for row in rows[:10]:
-            cat = row.get("category", "info")
-            lines.append(f"- [{cat}] {row.get('subject', '')} ({row.get('account_id', 'unknown')})")
+        lines.extend(_DIGEST_ROW(ChainMap(row, _MAIL_ROW_DEFAULTS)) for row in rows[:10])
         await update.message.reply_text("\n".join(lines))
 
     async def mail_urgent_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -179,14 +432,13 @@ class PolarisBotV2:
             await update.message.reply_text("MailOps가 초기화되지 않았어.")
             return
 
-        await asyncio.to_thread(self.mailops.sync_unread, 20)
-        rows = await asyncio.to_thread(self.mailops.get_urgent, 20)
+        await self._sync_mail()
+        rows = await self._run_io(self.mailops.get_urgent, 20)
         if not rows:
             await update.message.reply_text("긴급 메일이 없어.")
             return
         lines = ["**Urgent Mails**", ""]
-        for row in rows[:10]:
-            lines.append(f"- {row.get('subject', '')} / {row.get('sender', '')}")
+        lines.extend(_MAIL_ROW(ChainMap(row, _MAIL_ROW_DEFAULTS)) for row in rows[:10])
         await update.message.reply_text("\n".join(lines))
 
     async def mail_promo_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -195,14 +447,13 @@ class PolarisBotV2:
             await update.message.reply_text("MailOps가 초기화되지 않았어.")
             return
 
-        await asyncio.to_thread(self.mailops.sync_unread, 20)
-        rows = await asyncio.to_thread(self.mailops.get_promo, 20)
+        await self._sync_mail()
+        rows = await self._run_io(self.mailops.get_promo, 20)
         if not rows:
             await update.message.reply_text("프로모션 메일이 없어.")
             return
         lines = ["**Promo/Deal Mails**", ""]
-        for row in rows[:15]:
-            lines.append(f"- {row.get('subject', '')} / {row.get('sender', '')}")
+        lines.extend(_MAIL_ROW(ChainMap(row, _MAIL_ROW_DEFAULTS)) for row in rows[:15])
         await update.message.reply_text("\n".join(lines))
 
     async def mail_actions_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -212,7 +463,7 @@ class PolarisBotV2:
             return
 
         target = context.args[0] if context.args else "promo"
-        proposals = await asyncio.to_thread(self.mailops.propose_actions, target, 20)
+        proposals = await self._run_io(self.mailops.propose_actions, target, 20)
         if not proposals:
             await update.message.reply_text("제안할 액션이 없어.")
             return
@@ -235,15 +486,7 @@ class PolarisBotV2:
             await update.message.reply_text(f"리로드 실패: {e}")
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        tools = get_all_tools()
-        status = (
-            "**Polaris v2 Status**\n\n"
-            f"**Router:** PolarisRouter (ReAct loop)\n"
-            f"**Model:** {self.router.model}\n"
-            f"**Tools:** {len(tools)} registered\n"
-            f"**Approval Gate:** Active\n"
-            f"**Trace Logger:** Active\n"
-        )
+        status = _STATUS_TEMPLATE % {"model": self.router.model, "tools": len(self._get_tools())}
         await update.message.reply_text(status, parse_mode="Markdown")
 
     # ------------------------------------------------------------------
@@ -258,83 +501,108 @@ class PolarisBotV2:
             return
 
         lines = ["**Recent Traces (last 10)**\n"]
-        for entry in recent:
-            ts = entry.get("timestamp", "?")[:19]
-            tool = entry.get("tool", "?")
-            level = entry.get("approval_level", "?")
-            lines.append(f"`{ts}` | {tool} | {level}")
+        lines.extend(_TRACE_ROW(ChainMap(entry, _TRACE_ROW_DEFAULTS)) for entry in recent)
 
         await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
 
     async def tools_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List all registered tools."""
-        tools = get_all_tools()
-        if not tools:
-            await update.message.reply_text("No tools registered.")
-            return
-
-        lines = [f"**Registered Tools ({len(tools)})**\n"]
-        for t in tools:
-            name = t["name"]
-            desc = t["description"][:80]
-            lines.append(f"- `{name}`: {desc}")
-
-        await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
+        await update.message.reply_text(self._get_tools_text(), parse_mode="Markdown")
 
     async def skills_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """List all registered skills."""
         try:
-            from polaris.skills import SkillRegistry
-            registry = SkillRegistry()
-            skills = registry.list_all()
-            if not skills:
-                await update.message.reply_text("등록된 스킬이 없어.")
-                return
-
-            lines = [f"**등록된 스킬 ({len(skills)}개)**\n"]
-            for s in skills:
-                triggers = ", ".join(s.get("triggers", []))
-                tags = []
-                if s.get("source") == "external":
-                    tags.append("외부")
-                if s.get("requires_tool"):
-                    tags.append("강제도구")
-                chain = s.get("tool_chain", [])
-                if chain:
-                    tags.append(f"체인:{len(chain)}")
-                tag_text = f" [{' | '.join(tags)}]" if tags else ""
-                lines.append(f"- `{s['name']}`{tag_text}: {s.get('description', '')} [{triggers}]")
-
-            try:
-                await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
-            except Exception:
-                await update.message.reply_text("\n".join(lines))
+            text = self._get_skills_text()
         except Exception as e:
             await update.message.reply_text(f"스킬 시스템 에러: {e}")
+            return
+
+        await self._send(update, text)
+
+    # ------------------------------------------------------------------
+    # Registry listings (cached until the next runtime reload)
+    # ------------------------------------------------------------------
+
+    def _get_tools(self) -> list:
+        if self._tools_cache is None:
+            self._tools_cache = get_all_tools()
+        return self._tools_cache
+
+    def _get_tools_text(self) -> str:
+        if self._tools_text is None:
+            tools = self._get_tools()
+            if not tools:
+                self._tools_text = "No tools registered."
+            else:
+                buf = io.StringIO()
+                w = buf.write
+                w(f"**Registered Tools ({len(tools)})**\n")
+                for t in tools:
+                    w("\n- `"); w(t["name"]); w("`: "); w(t["description"][:80])
+                self._tools_text = buf.getvalue()
+        return self._tools_text
+
+    def _get_skills_text(self) -> str:
+        if self._skills_text is None:
+            from polaris.skills import SkillRegistry
+            skills = SkillRegistry().list_all()
+            if not skills:
+                self._skills_text = "등록된 스킬이 없어."
+            else:
+                buf = io.StringIO()
+                w = buf.write
+                w(f"**등록된 스킬 ({len(skills)}개)**\n")
+                for s in skills:
+                    tags = []
+                    if s.get("source") == "external":
+                        tags.append("외부")
+                    if s.get("requires_tool"):
+                        tags.append("강제도구")
+                    chain = s.get("tool_chain", [])
+                    if chain:
+                        tags.append(f"체인:{len(chain)}")
+                    w("\n- `"); w(s["name"]); w("`")
+                    if tags:
+                        w(" ["); w(" | ".join(tags)); w("]")
+                    w(": "); w(s.get("description", ""))
+                    w(" ["); w(", ".join(s.get("triggers", []))); w("]")
+                self._skills_text = buf.getvalue()
+        return self._skills_text
+
+    def _on_runtime_reload(self):
+        """Reload router skills and drop the cached registry listings."""
+        self.router._init_skills()
+        self._tools_cache = None
+        self._tools_text = None
+        self._skills_text = None
 
     # ------------------------------------------------------------------
     # Legacy explicit commands (kept for backward compatibility)
     # ------------------------------------------------------------------
 
     async def mail_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        await update.message.reply_text("Processing emails...\nResults will arrive in 10-20 seconds.")
         chat_id = update.effective_chat.id
-        asyncio.create_task(self._process_mail_background(chat_id))
+        if not self._spawn((chat_id, "mail"), self._process_mail_background, chat_id):
+            await update.message.reply_text("Still processing your last /mail request...")
+            return
+        await update.message.reply_text("Processing emails...\nResults will arrive in 10-20 seconds.")
 
     async def _process_mail_background(self, chat_id: int):
         try:
-            mails = self.mail_reader.get_unread_mails(limit=5)
+            reader = await self._agent("mail_reader")
+            mails = await self._run_io(reader.get_unread_mails, limit=5)
             if not mails:
                 await self.application.bot.send_message(chat_id=chat_id, text="No unread emails.")
                 return
 
-            analyzed = await asyncio.to_thread(self.email_analyzer.analyze_batch, mails)
+            analyzer = await self._agent("email_analyzer")
+            analyzed = await self._run_io(analyzer.analyze_batch, mails)
             if not analyzed:
                 await self.application.bot.send_message(chat_id=chat_id, text="Email analysis returned no results.")
                 return
 
-            message = self.email_analyzer.format_categorized_summary(analyzed)
-            await self.application.bot.send_message(chat_id=chat_id, text=message, parse_mode="Markdown")
+            message = analyzer.format_categorized_summary(analyzed)
+            await self._send(None, message, chat_id=chat_id)
         except Exception as e:
             logger.error("Mail processing error: %s", e)
             await self.application.bot.send_message(chat_id=chat_id, text=f"Email error: {e}")
@@ -345,25 +613,29 @@ class PolarisBotV2:
             return
         query = " ".join(context.args)
         await update.message.reply_text(f"Searching '{query}'...")
-        result = self.phd_agent._handle_paper_search(f"search {query}")
+        phd_agent = await self._agent("phd_agent")
+        result = phd_agent._handle_paper_search(f"search {query}")
         if result["status"] == "success":
-            await update.message.reply_text(result["formatted_message"], parse_mode="Markdown")
+            await self._send(update, result["formatted_message"])
         else:
             await update.message.reply_text(result["message"])
 
     async def schedule_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        await update.message.reply_text("Checking schedule...")
         chat_id = update.effective_chat.id
-        asyncio.create_task(self._get_schedule_background(chat_id))
+        if not self._spawn((chat_id, "schedule"), self._get_schedule_background, chat_id):
+            await update.message.reply_text("Still checking your schedule...")
+            return
+        await update.message.reply_text("Checking schedule...")
 
     async def _get_schedule_background(self, chat_id: int):
         try:
-            briefing = await asyncio.to_thread(self.schedule_agent.get_daily_briefing)
+            schedule_agent = await self._agent("schedule_agent")
+            briefing = await self._coalesced("schedule", schedule_agent.get_daily_briefing)
             if briefing.get("status") == "error":
                 await self.application.bot.send_message(chat_id=chat_id, text=f"Schedule error: {briefing.get('message')}")
                 return
-            message = self.schedule_agent.format_daily_briefing(briefing)
-            await self.application.bot.send_message(chat_id=chat_id, text=message, parse_mode="Markdown")
+            message = schedule_agent.format_daily_briefing(briefing)
+            await self._send(None, message, chat_id=chat_id)
         except Exception as e:
             logger.error("Schedule error: %s", e)
             await self.application.bot.send_message(chat_id=chat_id, text=f"Schedule error: {e}")
@@ -376,30 +648,22 @@ class PolarisBotV2:
         def _target_label(profile: str, host: str) -> str:
             return profile if profile == host else f"{profile} ({host})"
 
-        args = context.args or []
-        actions = {"status", "jobs"}
-        action = "status"
-        cluster = None
-
-        if len(args) == 1:
-            if args[0].lower() in actions:
-                action = args[0].lower()
-            else:
-                cluster = args[0]
-        elif len(args) >= 2:
-            if args[0].lower() in actions:
-                action = args[0].lower()
-                cluster = args[1]
-            elif args[1].lower() in actions:
-                cluster = args[0]
-                action = args[1].lower()
-            else:
-                await update.message.reply_text("Usage: /hpc [status|jobs] [cluster]")
-                return
+        args = (context.args or [])[:2]
+        lowered = [a.lower() for a in args]
+        dispatch = _HPC_ARGS.get(tuple(a if a in _HPC_ACTIONS else "*" for a in lowered))
+        if dispatch is None:
+            await update.message.reply_text("Usage: /hpc [status|jobs] [cluster]")
+            return
+        action_slot, cluster_slot = dispatch
+        action = lowered[action_slot] if action_slot is not None else "status"
+        cluster = args[cluster_slot] if cluster_slot is not None else None
 
         try:
+            hpc = await self._agent("hpc_monitor")
             if action == "jobs":
-                result = await asyncio.to_thread(self.hpc_monitor.list_jobs, cluster, 30)
+                result = await self._coalesced(
+                    ("hpc_jobs", cluster), hpc.list_jobs, cluster, 30
+                )
                 target = _target_label(result.get("cluster", "default"), result.get("host", "unknown"))
                 if not result.get("ok"):
                     await update.message.reply_text(
@@ -422,9 +686,9 @@ class PolarisBotV2:
                 return
 
             if cluster:
-                self.hpc_monitor.set_profile(cluster)
-            alive = await asyncio.to_thread(self.hpc_monitor.zombie_guard)
-            target = _target_label(self.hpc_monitor.profile_name, self.hpc_monitor.hpc_host)
+                hpc.set_profile(cluster)
+            alive = await self._coalesced(("hpc_alive", hpc.profile_name), hpc.zombie_guard)
+            target = _target_label(hpc.profile_name, hpc.hpc_host)
             if alive:
                 await update.message.reply_text(
                     f"{target} 연결됨.\n"
@@ -453,8 +717,10 @@ class PolarisBotV2:
             return
 
         chat_id = update.effective_chat.id
+        if not self._spawn("index", self._index_vault_background, chat_id):
+            await update.message.reply_text("Vault 인덱싱이 이미 진행 중이야.")
+            return
         await update.message.reply_text("Vault 인덱싱 시작...")
-        asyncio.create_task(self._index_vault_background(chat_id))
 
     async def _index_vault_background(self, chat_id: int):
         """Run vault indexing in background and report completion."""
@@ -475,10 +741,7 @@ class PolarisBotV2:
                 f"스킵: {stats['skipped']}개\n"
                 f"에러: {stats['errors']}개"
             )
-            try:
-                await self.application.bot.send_message(chat_id=chat_id, text=msg, parse_mode="Markdown")
-            except Exception:
-                await self.application.bot.send_message(chat_id=chat_id, text=msg)
+            await self._send(None, msg, chat_id=chat_id)
         except Exception as e:
             logger.error("Vault indexing error: %s", e)
             await self.application.bot.send_message(chat_id=chat_id, text=f"인덱싱 에러: {e}")
@@ -504,10 +767,7 @@ class PolarisBotV2:
                 lines.append(f"  {r['content'][:100]}...")
 
             text = "\n".join(lines)
-            try:
-                await update.message.reply_text(text, parse_mode="Markdown")
-            except Exception:
-                await update.message.reply_text(text)
+            await self._send(update, text)
             return
 
         # /vault (status)
@@ -517,10 +777,7 @@ class PolarisBotV2:
             f"인덱싱된 노트: {stats['indexed_notes']}개\n"
             f"마지막 인덱싱: {stats['last_indexed'] or '없음'}"
         )
-        try:
-            await update.message.reply_text(msg, parse_mode="Markdown")
-        except Exception:
-            await update.message.reply_text(msg)
+        await self._send(update, msg)
 
     # ------------------------------------------------------------------
     # Feedback commands (/wrong, /feedback)
@@ -529,7 +786,7 @@ class PolarisBotV2:
     async def wrong_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Mark the last response as wrong. User provides correction in next message."""
         user_id = update.effective_user.id
-        history = self.conversations.get(user_id, [])
+        history = self.conversations.get(user_id, ())
 
         # Find last assistant response
         last_response = ""
@@ -543,8 +800,7 @@ class PolarisBotV2:
             return
 
         # Store state for next message
-        context.user_data["awaiting_correction"] = True
-        context.user_data["wrong_original"] = last_response
+        context.user_data[_CORRECTION_KEY] = last_response
 
         await update.message.reply_text(
             "어떻게 고쳐야 하는지 알려줘. (다음 메시지에 교정 내용을 적어줘)"
@@ -561,32 +817,29 @@ class PolarisBotV2:
             await update.message.reply_text("저장된 피드백이 없어.")
             return
 
-        lines = [f"**최근 피드백 ({len(feedbacks)}개)**\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"**최근 피드백 ({len(feedbacks)}개)**\n")
         for fb in feedbacks:
-            ts = fb.get("timestamp", "?")[:10]
-            correction = fb.get("correction", "")[:60]
-            cat = fb.get("category", "") or ""
-            cat_label = f" [{cat}]" if cat else ""
-            lines.append(f"- `{ts}`{cat_label} {correction}")
+            w("\n- `"); w(fb.get("timestamp", "?")[:10]); w("`")
+            cat = fb.get("category", "")
+            if cat:
+                w(" ["); w(cat); w("]")
+            w(" "); w(fb.get("correction", "")[:60])
 
-        text = "\n".join(lines)
-        try:
-            await update.message.reply_text(text, parse_mode="Markdown")
-        except Exception:
-            await update.message.reply_text(text)
+        await self._send(update, buf.getvalue())
 
     # ------------------------------------------------------------------
     # Natural language handler (LLM router)
     # ------------------------------------------------------------------
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        self._hot_reloader.check_and_apply()
         user_message = update.message.text
         user_id = update.effective_user.id
 
-        # Trigger periodic background urgent-mail polling.
+        # Subscribe this chat to the periodic urgent-mail poller.
         if self._mailops_poller:
-            self._mailops_poller.maybe_trigger(update.effective_chat.id, self.application)
+            self._mailops_poller.subscribe(update.effective_chat.id)
 
         # Defensive: skip /commands that slip past filters.COMMAND
         if user_message and user_message.startswith("/"):
@@ -599,12 +852,11 @@ class PolarisBotV2:
         logger.info("User %d: %s", user_id, user_message)
 
         # Handle /wrong follow-up (awaiting correction)
-        if context.user_data.get("awaiting_correction"):
-            context.user_data["awaiting_correction"] = False
-            original = context.user_data.pop("wrong_original", "")
-
+        original = context.user_data.pop(_CORRECTION_KEY, None)
+        if original is not None:
             if self.router.feedback_manager:
-                self.router.feedback_manager.save_correction(
+                await self._run_io(
+                    self.router.feedback_manager.save_correction,
                     session_id=str(user_id),
                     original_response=original,
                     user_correction=user_message,
@@ -616,11 +868,13 @@ class PolarisBotV2:
             return
 
         # Get or create conversation history
-        history = self.conversations.get(user_id, [])
+        history = self.conversations.touch(user_id)
 
-        # Route through LLM (session_id enables memory persistence)
-        result = await asyncio.to_thread(
-            self.router.route, user_message, history, session_id=str(user_id)
+        # Route through LLM (session_id enables memory persistence).
+        # Tool-free answers stream into a reply that is edited in place.
+        stream = StreamingReply(update.message)
+        result = await self.router.aroute(
+            user_message, list(history), session_id=str(user_id), on_delta=stream.feed,
         )
 
         response_text = result["response"]
@@ -628,7 +882,7 @@ class PolarisBotV2:
 
         # Log tool usage to trace
         for tool_name in tools_used:
-            self.trace_logger.log(
+            self.traces.queue(
                 thought="LLM routed request",
                 tool=tool_name,
                 args={"user_message": user_message},
@@ -637,18 +891,16 @@ class PolarisBotV2:
                 session_id=str(user_id),
             )
 
-        # Update conversation history (keep last 20 messages)
+        # Update conversation history (deque keeps the last 20 messages)
         history.append({"role": "user", "content": user_message})
         history.append({"role": "assistant", "content": response_text})
-        self.conversations[user_id] = history[-20:]
+        self.conversations.touch(user_id, history)
 
-        # Send response (try Markdown, fallback to plain text)
-        if response_text:
-            try:
-                await update.message.reply_text(response_text, parse_mode="Markdown")
-            except Exception:
-                # LLM response may contain broken markdown — send as plain text
-                await update.message.reply_text(response_text)
+        # Send response (Markdown when it looks well-formed, else plain text)
+        if stream.message is not None:
+            await stream.finish(response_text or "I could not generate a response. Please try again.")
+        elif response_text:
+            await self._send(update, response_text)
         else:
             await update.message.reply_text("I could not generate a response. Please try again.")
 
@@ -674,6 +926,10 @@ def main():
     if not token:
         raise ValueError("TELEGRAM_BOT_TOKEN not found in .env")
 
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+
     app = Application.builder().token(token).build()
     bot = PolarisBotV2()
     bot.application = app
@@ -734,12 +990,30 @@ def main():
             BotCommand("reload", "Reload runtime components"),
         ]
         await application.bot.set_my_commands(commands)
+        bot.start_hot_reload()
+        bot.traces.start()
+        bot.start_mail_poller()
+        bot.start_warmup()
         logger.info("Polaris Bot v2 started")
 
+    async def post_shutdown(application):
+        bot.stop_warmup()
+        await bot.stop_background()
+        await bot.stop_hot_reload()
+        await bot.stop_mail_poller()
+        if bot.mailops:
+            bot.mailops.close()
+        await bot.stop_hpc_monitors()
+        await bot.traces.stop()
+
     app.post_init = post_init
+    app.post_shutdown = post_shutdown
 
     logger.info("Polaris Bot v2 starting...")
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    try:
+        app.run_polling(allowed_updates=Update.ALL_TYPES)
+    finally:
+        bot._io_pool.shutdown(wait=False, cancel_futures=True)
 
 
 if __name__ == "__main__":
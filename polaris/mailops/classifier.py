@@ -40,6 +40,32 @@ class MailOpsClassifier:
         r"limited time",
     ]
 
+    PROMO_SENDER_MARKERS = [
+        "noreply",
+        "no-reply",
+        "newsletter",
+        "marketing",
+        "deals",
+        "offers",
+        "coupon",
+        "store",
+    ]
+
+    # Substring prefilters: every match of a category's patterns contains one
+    # of its literals, so the regex only runs when a literal is present.
+    URGENT_LITERALS = ("urgent", "asap", "deadline", "due", "마감", "긴급", "즉시", "final notice", "payment failed")
+    ACTION_LITERALS = ("reply", "please", "rsvp", "필요", "확인해", "요청", "submit")
+    PROMO_LITERALS = ("sale", "deal", "discount", "coupon", "프로모션", "할인", "특가", "무료배송", "limited time")
+
+    # Each category is fused into one alternation compiled at class load, so
+    # classify() scans the text once per category rather than once per pattern.
+    # classify() lowercases its input, so the regexes skip IGNORECASE: patterns,
+    # sender markers and literals must be written in lowercase.
+    URGENT_RE = re.compile("|".join(f"(?:{p})" for p in URGENT_PATTERNS))
+    ACTION_RE = re.compile("|".join(f"(?:{p})" for p in ACTION_PATTERNS))
+    PROMO_RE = re.compile("|".join(f"(?:{p})" for p in PROMO_PATTERNS))
+    PROMO_SENDER_RE = re.compile("|".join(re.escape(m) for m in PROMO_SENDER_MARKERS))
+
     def classify(self, message: dict) -> dict:
         """Return category, confidence, and short reason."""
         subject = (message.get("subject") or "").lower()
@@ -47,21 +73,21 @@ class MailOpsClassifier:
         body = (message.get("body_preview") or message.get("content") or "").lower()
         text = f"{subject}\n{sender}\n{body}"
 
-        if self._matches_any(text, self.URGENT_PATTERNS):
+        if self._matches(self.URGENT_LITERALS, self.URGENT_RE, text):
             return {
                 "category": "urgent",
                 "confidence": 0.92,
                 "reason": "Matched urgent keyword pattern",
             }
 
-        if self._is_promo_sender(sender) or self._matches_any(text, self.PROMO_PATTERNS):
+        if self._is_promo_sender(sender) or self._matches(self.PROMO_LITERALS, self.PROMO_RE, text):
             return {
                 "category": "promo",
                 "confidence": 0.88,
                 "reason": "Promotion sender/keyword detected",
             }
 
-        if self._matches_any(text, self.ACTION_PATTERNS):
+        if self._matches(self.ACTION_LITERALS, self.ACTION_RE, text):
             return {
                 "category": "action",
                 "confidence": 0.76,
@@ -74,21 +100,9 @@ class MailOpsClassifier:
             "reason": "No urgent/action/promo pattern",
         }
 
-    def _matches_any(self, text: str, patterns: list[str]) -> bool:
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+    @staticmethod
+    def _matches(literals: tuple, pattern: re.Pattern, text: str) -> bool:
+        return any(lit in text for lit in literals) and pattern.search(text) is not None
 
     def _is_promo_sender(self, sender: str) -> bool:
-        promo_sender_markers = [
-            "noreply",
-            "no-reply",
-            "newsletter",
-            "marketing",
-            "deals",
-            "offers",
-            "coupon",
-            "store",
-        ]
-        return any(marker in sender for marker in promo_sender_markers)
+        return self.PROMO_SENDER_RE.search(sender) is not None
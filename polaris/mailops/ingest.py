@@ -1,22 +1,30 @@
 """Apple Mail ingest for MailOps."""
 
+import functools
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Callable, Optional
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 
+# First matching substring of the lowercased account name wins
+_PROVIDER_TABLE = (("gmail", "gmail"), ("outlook", "outlook"), ("uic", "outlook"))
+
+
+# Both helpers see the same few account names for every mail; cache them.
+@functools.lru_cache(maxsize=128)
 def _provider_from_account(account_name: str) -> str:
     name = (account_name or "").lower()
-    if "gmail" in name:
-        return "gmail"
-    if "outlook" in name or "uic" in name:
-        return "outlook"
+    for needle, provider in _PROVIDER_TABLE:
+        if needle in name:
+            return provider
     return "mail"
 
 
+@functools.lru_cache(maxsize=128)
 def _make_account_id(account_keyword: str, account_name: str) -> str:
     base = account_name or account_keyword or "unknown"
     return base.lower().replace(" ", "_")
@@ -28,6 +36,8 @@ class MailOpsIngestor:
     def __init__(self, account_keywords: list[str], reader_factory: Optional[Callable] = None):
         self.account_keywords = [k.strip() for k in account_keywords if k.strip()]
         self.reader_factory = reader_factory or self._default_reader_factory
+        # One reader per keyword, reused across polls (MailReader setup launches Mail.app)
+        self._readers: dict[str, Any] = {}
 
     def _default_reader_factory(self, account_keyword: str):
         from mail_reader import MailReader
@@ -35,17 +45,42 @@ class MailOpsIngestor:
         return MailReader(account_keyword=account_keyword)
 
     def fetch_unread(self, limit_per_account: int = 20) -> list[dict]:
-        collected: list[dict] = []
-        for keyword in self.account_keywords:
-            try:
-                reader = self.reader_factory(keyword)
-                mails = reader.get_unread_mails(limit=limit_per_account)
-                for mail in mails:
-                    collected.append(self._normalize(mail, keyword))
-            except Exception as e:
-                logger.warning("Mail ingest failed for account keyword '%s': %s", keyword, e)
-                continue
-        return collected
+        """Fetch every account concurrently; results keep account keyword order."""
+        if len(self.account_keywords) <= 1:
+            batches = [self._fetch_one(k, limit_per_account) for k in self.account_keywords]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=len(self.account_keywords), thread_name_prefix="mailops-ingest"
+            ) as pool:
+                batches = list(pool.map(
+                    lambda keyword: self._fetch_one(keyword, limit_per_account),
+                    self.account_keywords,
+                ))
+        return [mail for batch in batches for mail in batch]
+
+    def _fetch_one(self, keyword: str, limit: int) -> list[dict]:
+        try:
+            reader = self._readers.get(keyword) or self._readers.setdefault(
+                keyword, self.reader_factory(keyword)
+            )
+            mails = reader.get_unread_mails(limit=limit)
+            return [self._normalize(mail, keyword) for mail in mails]
+        except Exception as e:
+            # Rebuild the reader on the next poll rather than reusing a broken one
+            self._readers.pop(keyword, None)
+            logger.warning("Mail ingest failed for account keyword '%s': %s", keyword, e)
+            return []
+
+    def close(self):
+        """Drop cached readers, closing any that hold a connection."""
+        readers, self._readers = list(self._readers.values()), {}
+        for reader in readers:
+            close = getattr(reader, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug("Mail reader close failed: %s", e)
 
     def _normalize(self, mail: dict, account_keyword: str) -> dict:
         account_name = mail.get("account", "")
@@ -55,8 +90,10 @@ class MailOpsIngestor:
         date_str = mail.get("date", "")
 
         # Apple Mail script does not expose message-id. Hash with stable fields.
+        # The digest is a dedup key, not a security boundary; it must stay SHA-1
+        # so ext_ids already stored (and their alerts) keep matching.
         hash_input = f"{account_name}|{sender}|{subject}|{date_str}|{content[:160]}"
-        ext_id = hashlib.sha1(hash_input.encode("utf-8")).hexdigest()
+        ext_id = hashlib.sha1(hash_input.encode("utf-8"), usedforsecurity=False).hexdigest()
 
         return {
             "ext_id": ext_id,
@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,42 +11,62 @@ logger = logging.getLogger(__name__)
 
 
 class MailOpsPoller:
-    """Manages periodic urgent mail polling and Telegram push alerts."""
+    """Manages periodic urgent mail polling and Telegram push alerts.
+
+    Polling runs on its own timer (``run``); chats that talk to the bot are
+    subscribed to alerts. A newly subscribed chat triggers an immediate poll.
+    """
 
     def __init__(self, mailops: "MailOpsService", poll_interval: int = 300):
         self.mailops = mailops
         self.poll_interval = poll_interval
-        self._last_poll = 0.0
-
-    def maybe_trigger(self, chat_id: int, bot_app) -> bool:
-        """Check interval; if due, create background polling task. Returns True if triggered."""
-        now = time.time()
-        if now - self._last_poll >= self.poll_interval:
-            self._last_poll = now
-            asyncio.create_task(self.poll_and_alert(chat_id, bot_app))
-            return True
-        return False
-
-    async def poll_and_alert(self, chat_id: int, bot_app):
+        self._chat_ids: set[int] = set()
+        self._wake = asyncio.Event()
+        self._running = False
+
+    def subscribe(self, chat_id: int) -> bool:
+        """Register a chat for urgent alerts. Returns True if it is new."""
+        if chat_id in self._chat_ids:
+            return False
+        self._chat_ids.add(chat_id)
+        self._wake.set()
+        return True
+
+    async def run(self, bot_app):
+        """Poll every ``poll_interval`` seconds until :meth:`stop` is called."""
+        self._running = True
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if not self._running:
+                break
+            await self.poll_and_alert(bot_app)
+
+    def stop(self):
+        """Ask :meth:`run` to exit after the current poll."""
+        self._running = False
+        self._wake.set()
+
+    async def poll_and_alert(self, bot_app):
         """Sync unread, find unalerted urgent mails, send Telegram alerts."""
+        if not self._chat_ids:
+            return
         try:
-            await asyncio.to_thread(self.mailops.sync_unread, 20)
-            urgent = await asyncio.to_thread(self.mailops.list_unalerted_urgent, 5)
+            urgent = await asyncio.to_thread(self.mailops.poll_urgent, 20, 5)
             if not urgent:
                 return
 
             lines = ["**Urgent Mail Alert**", ""]
-            for row in urgent:
-                lines.append(f"- {row.get('subject', '')} / {row.get('sender', '')}")
-                await asyncio.to_thread(self.mailops.mark_urgent_alerted, row["ext_id"])
+            lines.extend(f"- {row.get('subject', '')} / {row.get('sender', '')}" for row in urgent)
+            text = "\n".join(lines)
 
-            try:
-                await bot_app.bot.send_message(
-                    chat_id=chat_id,
-                    text="\n".join(lines),
-                    parse_mode="Markdown",
-                )
-            except Exception:
-                await bot_app.bot.send_message(chat_id=chat_id, text="\n".join(lines))
+            for chat_id in list(self._chat_ids):
+                try:
+                    await bot_app.bot.send_message(chat_id=chat_id, text=text, parse_mode="Markdown")
+                except Exception:
+                    await bot_app.bot.send_message(chat_id=chat_id, text=text)
         except Exception as e:
             logger.warning("MailOps poll failed: %s", e)
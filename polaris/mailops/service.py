@@ -1,6 +1,7 @@
 """MailOps orchestration service."""
 
 import os
+from datetime import datetime, timezone
 from typing import Optional
 
 from polaris.mailops.classifier import MailOpsClassifier
@@ -31,28 +32,35 @@ class MailOpsService:
     def sync_unread(self, limit_per_account: int = 20) -> dict:
         """Fetch unread mail from Apple Mail and persist triage results."""
         messages = self.ingestor.fetch_unread(limit_per_account=limit_per_account)
-        inserted = 0
-        urgent_new = 0
-        for msg in messages:
-            is_new = self.store.upsert_message(msg)
-            if is_new:
-                inserted += 1
-            result = self.classifier.classify(msg)
-            self.store.save_classification(
-                ext_id=msg["ext_id"],
-                category=result["category"],
-                confidence=result["confidence"],
-                reason=result["reason"],
-            )
-            if is_new and result["category"] == "urgent":
-                urgent_new += 1
+        # Mail already classified on an earlier sync keeps its stored result
+        classified = self.store.classified_ext_ids([msg["ext_id"] for msg in messages])
+        results = [
+            (msg["ext_id"], self.classifier.classify(msg))
+            for msg in messages
+            if msg["ext_id"] not in classified
+        ]
+        # One commit and one timestamp for the whole batch
+        now = datetime.now(timezone.utc).isoformat()
+        with self.store.transaction():
+            is_new = self.store.upsert_many(messages, now=now)
+            self.store.save_classifications(results, now=now)
+
+        new_ids = {msg["ext_id"] for msg, new in zip(messages, is_new) if new}
+        urgent_new = {
+            ext_id for ext_id, result in results
+            if result["category"] == "urgent" and ext_id in new_ids
+        }
 
         return {
             "fetched": len(messages),
-            "inserted": inserted,
-            "urgent_new": urgent_new,
+            "inserted": len(new_ids),
+            "urgent_new": len(urgent_new),
         }
 
+    def close(self):
+        """Release the store's database connections."""
+        self.store.close()
+
     def get_digest(self, limit: int = 20) -> list:
         return self.store.get_digest(limit=limit)
 
@@ -68,6 +76,24 @@ class MailOpsService:
     def mark_urgent_alerted(self, ext_id: str):
         self.store.mark_alerted(ext_id=ext_id, alert_type="urgent")
 
+    def mark_urgent_alerted_bulk(self, ext_ids: list[str]):
+        self.store.mark_alerted_bulk(ext_ids, alert_type="urgent")
+
+    def poll_urgent(self, sync_limit: int = 20, urgent_limit: int = 5) -> list:
+        """Sync unread mail, then claim unalerted urgent mail for one alert.
+
+        Runs synchronously so the poller needs a single worker-thread hop.
+        Listing and marking both run under the store's write lock, so two
+        polls cannot claim the same mail (the list itself is read on the
+        reader connection); the Mail.app fetch in sync_unread stays outside
+        it so the write lock is not held meanwhile.
+        """
+        self.sync_unread(sync_limit)
+        with self.store.transaction():
+            urgent = self.store.list_unalerted_urgent(limit=urgent_limit)
+            self.store.mark_alerted_bulk([row["ext_id"] for row in urgent], alert_type="urgent")
+        return urgent
+
     def propose_actions(self, target: str = "promo", limit: int = 20) -> list[dict]:
         """Return safe action proposals without mutating mailbox."""
         if target == "urgent":
@@ -106,9 +132,8 @@ class MailOpsService:
             self.store.log_action(action=action, status="rejected", detail="Action not allowed in R1")
             return {"status": "error", "message": "Action not allowed in R1"}
 
-        for ext_id in message_ids:
-            detail = label if action == "label" else "queued_manual"
-            self.store.log_action(action=action, status="queued", detail=detail, ext_id=ext_id)
+        detail = label if action == "label" else "queued_manual"
+        self.store.log_actions([(action, "queued", detail, ext_id) for ext_id in message_ids])
 
         return {
             "status": "ok",
@@ -3,10 +3,34 @@
 import json
 import os
 import sqlite3
-from datetime import datetime
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+# Applied to every connection: WAL lets readers run alongside the writer,
+# and busy_timeout waits out a held lock instead of raising "database is locked".
+# Digest reads use a 256 MiB mmap window and a ~20 MB page cache.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+
+def _utc_now() -> str:
+    """ISO-8601 UTC timestamp for created_at/updated_at columns."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _raw_json(message: dict) -> str:
+    """Serialize the source mail dict only; the normalized fields have columns."""
+    return json.dumps(message.get("raw", {}), ensure_ascii=False, separators=(",", ":"))
+
 
 class MailOpsStore:
     """Persistence for ingested mail, classification, alerts, and actions."""
@@ -16,10 +40,63 @@ class MailOpsStore:
             db_path = str(Path(__file__).resolve().parent.parent.parent / "data" / "mailops.db")
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = self._connect()
+        self._write_lock = threading.RLock()
+        self._batch_depth = 0
+        self._local = threading.local()
+        # Every per-thread reader, so close() can release them all
+        self._readers: list = []
+        self._readers_lock = threading.Lock()
         self._init_schema()
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read connection, so digest reads do not queue behind writes."""
+        if self.db_path == ":memory:":
+            return self.conn
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self):
+        """Close the per-thread read connections and the write connection."""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+            self._local = threading.local()
+        for conn in readers:
+            conn.close()
+        with self._write_lock:
+            self.conn.close()
+
+    def _commit(self):
+        if not self._batch_depth:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Group writes into a single commit (rolled back on error)."""
+        with self._write_lock:
+            self._batch_depth += 1
+            try:
+                yield
+            except BaseException:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.conn.rollback()
+                raise
+            self._batch_depth -= 1
+            self._commit()
+
     def _init_schema(self):
         self.conn.executescript(
             """
@@ -40,6 +117,8 @@ class MailOpsStore:
 
             CREATE INDEX IF NOT EXISTS idx_mail_messages_received_at ON mail_messages(received_at);
             CREATE INDEX IF NOT EXISTS idx_mail_messages_account_id ON mail_messages(account_id);
+            -- Digest order key: lets ORDER BY ... LIMIT walk the index instead of sorting
+            CREATE INDEX IF NOT EXISTS idx_mail_messages_order ON mail_messages(COALESCE(received_at, created_at));
 
             CREATE TABLE IF NOT EXISTS mail_classification (
                 ext_id TEXT PRIMARY KEY,
@@ -70,49 +149,127 @@ class MailOpsStore:
             );
             """
         )
+        # Refresh planner statistics (a no-op unless tables changed noticeably)
+        self.conn.execute("PRAGMA optimize")
         self.conn.commit()
 
-    def upsert_message(self, message: dict) -> bool:
+    def upsert_message(self, message: dict, now: Optional[str] = None) -> bool:
         """Insert message if new. Returns True when inserted."""
-        now = datetime.utcnow().isoformat()
-        cursor = self.conn.execute(
-            """
-            INSERT OR IGNORE INTO mail_messages
-            (ext_id, thread_id, account_id, provider, sender, subject, body_preview, received_at, is_unread, raw_json, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                message["ext_id"],
-                message.get("thread_id", ""),
-                message.get("account_id", "unknown"),
-                message.get("provider", "unknown"),
-                message.get("sender", ""),
-                message.get("subject", ""),
-                message.get("body_preview", ""),
-                message.get("received_at", ""),
-                1 if message.get("is_unread", True) else 0,
-                json.dumps(message, ensure_ascii=False),
-                now,
-            ),
-        )
-        self.conn.commit()
+        now = now or _utc_now()
+        with self.transaction():
+            cursor = self.conn.execute(
+                """
+                INSERT OR IGNORE INTO mail_messages
+                (ext_id, thread_id, account_id, provider, sender, subject, body_preview, received_at, is_unread, raw_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    message["ext_id"],
+                    message.get("thread_id", ""),
+                    message.get("account_id", "unknown"),
+                    message.get("provider", "unknown"),
+                    message.get("sender", ""),
+                    message.get("subject", ""),
+                    message.get("body_preview", ""),
+                    message.get("received_at", ""),
+                    1 if message.get("is_unread", True) else 0,
+                    _raw_json(message),
+                    now,
+                ),
+            )
         return cursor.rowcount > 0
 
-    def save_classification(self, ext_id: str, category: str, confidence: float, reason: str):
-        now = datetime.utcnow().isoformat()
-        self.conn.execute(
-            """
-            INSERT INTO mail_classification (ext_id, category, confidence, reason, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(ext_id) DO UPDATE SET
-                category=excluded.category,
-                confidence=excluded.confidence,
-                reason=excluded.reason,
-                updated_at=excluded.updated_at
-            """,
-            (ext_id, category, confidence, reason, now),
-        )
-        self.conn.commit()
+    def save_classification(self, ext_id: str, category: str, confidence: float, reason: str, now: Optional[str] = None):
+        now = now or _utc_now()
+        with self.transaction():
+            self.conn.execute(
+                """
+                INSERT INTO mail_classification (ext_id, category, confidence, reason, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(ext_id) DO UPDATE SET
+                    category=excluded.category,
+                    confidence=excluded.confidence,
+                    reason=excluded.reason,
+                    updated_at=excluded.updated_at
+                """,
+                (ext_id, category, confidence, reason, now),
+            )
+
+    @staticmethod
+    def _present_ids(conn: sqlite3.Connection, table: str, ext_ids: list) -> set:
+        """Subset of ``ext_ids`` that has a row in ``table``."""
+        present = set()
+        for start in range(0, len(ext_ids), 500):
+            chunk = ext_ids[start:start + 500]
+            rows = conn.execute(
+                f"SELECT ext_id FROM {table} WHERE ext_id IN ({','.join('?' * len(chunk))})",
+                chunk,
+            ).fetchall()
+            present.update(r["ext_id"] for r in rows)
+        return present
+
+    def classified_ext_ids(self, ext_ids: list) -> set:
+        """Return the ext_ids that already have a stored classification."""
+        return self._present_ids(self._reader(), "mail_classification", ext_ids)
+
+    def upsert_many(self, messages: list, now: Optional[str] = None) -> list:
+        """Insert messages not stored yet, in one transaction.
+
+        Returns one flag per message: True where that message was inserted.
+        ``now`` (ISO string) is stamped on every row; pass one per sync batch.
+        """
+        if not messages:
+            return []
+        now = now or _utc_now()
+        with self.transaction():
+            seen = self._present_ids(self.conn, "mail_messages", [m["ext_id"] for m in messages])
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO mail_messages
+                (ext_id, thread_id, account_id, provider, sender, subject, body_preview, received_at, is_unread, raw_json, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        m["ext_id"],
+                        m.get("thread_id", ""),
+                        m.get("account_id", "unknown"),
+                        m.get("provider", "unknown"),
+                        m.get("sender", ""),
+                        m.get("subject", ""),
+                        m.get("body_preview", ""),
+                        m.get("received_at", ""),
+                        1 if m.get("is_unread", True) else 0,
+                        _raw_json(m),
+                        now,
+                    )
+                    for m in messages
+                ],
+            )
+        inserted = []
+        for m in messages:
+            inserted.append(m["ext_id"] not in seen)
+            seen.add(m["ext_id"])  # a repeat within the batch was ignored
+        return inserted
+
+    def save_classifications(self, rows: list, now: Optional[str] = None):
+        """Upsert ``(ext_id, classify() result)`` pairs in one transaction."""
+        if not rows:
+            return
+        now = now or _utc_now()
+        with self.transaction():
+            self.conn.executemany(
+                """
+                INSERT INTO mail_classification (ext_id, category, confidence, reason, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(ext_id) DO UPDATE SET
+                    category=excluded.category,
+                    confidence=excluded.confidence,
+                    reason=excluded.reason,
+                    updated_at=excluded.updated_at
+                """,
+                [(ext_id, c["category"], c["confidence"], c["reason"], now) for ext_id, c in rows],
+            )
 
     def get_digest(self, category: Optional[str] = None, account_id: Optional[str] = None, limit: int = 50) -> list:
         sql = (
@@ -133,11 +290,11 @@ class MailOpsStore:
             params.append(account_id)
         sql += " ORDER BY COALESCE(m.received_at, m.created_at) DESC LIMIT ?"
         params.append(limit)
-        rows = self.conn.execute(sql, params).fetchall()
+        rows = self._reader().execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
     def list_unalerted_urgent(self, limit: int = 20) -> list:
-        rows = self.conn.execute(
+        rows = self._reader().execute(
             """
             SELECT m.ext_id, m.account_id, m.sender, m.subject, m.body_preview, m.received_at
             FROM mail_messages m
@@ -151,22 +308,50 @@ class MailOpsStore:
         ).fetchall()
         return [dict(r) for r in rows]
 
-    def mark_alerted(self, ext_id: str, alert_type: str = "urgent"):
-        self.conn.execute(
-            """
-            INSERT OR IGNORE INTO mail_alerts (ext_id, alert_type, notified_at)
-            VALUES (?, ?, ?)
-            """,
-            (ext_id, alert_type, datetime.utcnow().isoformat()),
-        )
-        self.conn.commit()
+    def mark_alerted(self, ext_id: str, alert_type: str = "urgent", now: Optional[str] = None):
+        with self.transaction():
+            self.conn.execute(
+                """
+                INSERT OR IGNORE INTO mail_alerts (ext_id, alert_type, notified_at)
+                VALUES (?, ?, ?)
+                """,
+                (ext_id, alert_type, now or _utc_now()),
+            )
 
-    def log_action(self, action: str, status: str, detail: str = "", ext_id: str = ""):
-        self.conn.execute(
-            """
-            INSERT INTO mail_actions_log (ext_id, action, status, detail, created_at)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (ext_id, action, status, detail, datetime.utcnow().isoformat()),
-        )
-        self.conn.commit()
+    def mark_alerted_bulk(self, ext_ids: list, alert_type: str = "urgent", now: Optional[str] = None):
+        """Record alerts for several messages in one transaction."""
+        if not ext_ids:
+            return
+        now = now or _utc_now()
+        with self.transaction():
+            self.conn.executemany(
+                """
+                INSERT OR IGNORE INTO mail_alerts (ext_id, alert_type, notified_at)
+                VALUES (?, ?, ?)
+                """,
+                [(ext_id, alert_type, now) for ext_id in ext_ids],
+            )
+
+    def log_action(self, action: str, status: str, detail: str = "", ext_id: str = "", now: Optional[str] = None):
+        with self.transaction():
+            self.conn.execute(
+                """
+                INSERT INTO mail_actions_log (ext_id, action, status, detail, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (ext_id, action, status, detail, now or _utc_now()),
+            )
+
+    def log_actions(self, rows: list, now: Optional[str] = None):
+        """Log ``(action, status, detail, ext_id)`` tuples in one transaction."""
+        if not rows:
+            return
+        now = now or _utc_now()
+        with self.transaction():
+            self.conn.executemany(
+                """
+                INSERT INTO mail_actions_log (ext_id, action, status, detail, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(ext_id, action, status, detail, now) for action, status, detail, ext_id in rows],
+            )
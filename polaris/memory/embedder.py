@@ -1,23 +1,45 @@
 """
 Ollama Embedder — Local embedding via nomic-embed-text.
 
-Uses the Ollama REST API at http://localhost:11434/api/embeddings.
+Uses the Ollama REST API at http://localhost:11434/api/embeddings, and the
+batched /api/embed endpoint for batch_embed when the server supports it.
 Falls back gracefully when Ollama is unavailable (semantic search disabled,
 keyword search used instead).
 """
 
+import heapq
 import logging
 import math
+import os
 import struct
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
 import requests
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 logger = logging.getLogger(__name__)
 
 OLLAMA_EMBED_URL = "http://localhost:11434/api/embeddings"
 OLLAMA_EMBED_MODEL = "nomic-embed-text"
 
+# Seconds before an unreachable Ollama is probed again
+_PROBE_RETRY_SECONDS = 60.0
+
+# dtype byte prefixed to stored embeddings; headerless blobs are legacy float32.
+# _FP16_UNIT_HEADER marks float16 vectors normalized to unit length on write.
+# int8 blobs carry a float32 scale after the header; headed blobs always have
+# odd length, so an odd-dimension int8 vector gets one pad byte (_INT8_PAD_HEADER).
+_FP16_HEADER = b"\x10"
+_FP16_UNIT_HEADER = b"\x11"
+_INT8_HEADER = b"\x12"
+_INT8_PAD_HEADER = b"\x13"
+_FP32_HEADER = b"\x20"
+
 
 class OllamaEmbedder:
     """Generate embeddings via Ollama's local nomic-embed-text model."""
@@ -29,14 +51,34 @@ class OllamaEmbedder:
         timeout: int = 30,
     ):
         self.url = url
+        self.batch_url = url.rsplit("/api/", 1)[0] + "/api/embed"
         self.model = model
         self.timeout = timeout
-        self.available = self._check_availability()
+        # One keep-alive connection to Ollama instead of a new one per call
+        self.session = requests.Session()
+        self._batch_supported = True
+        # Probed on first use rather than here, so construction never blocks
+        self._available: Optional[bool] = None
+        self._last_probe = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether the model is reachable; a failed probe is retried after 60 s."""
+        if self._available is None or (
+            not self._available and time.monotonic() - self._last_probe > _PROBE_RETRY_SECONDS
+        ):
+            self._available = self._check_availability()
+            self._last_probe = time.monotonic()
+        return self._available
+
+    def _mark_unavailable(self):
+        self._available = False
+        self._last_probe = time.monotonic()
 
     def _check_availability(self) -> bool:
         """Probe Ollama to see if the embedding model is reachable."""
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 self.url,
                 json={"model": self.model, "prompt": "test"},
                 timeout=5,
@@ -56,13 +98,18 @@ class OllamaEmbedder:
         if not self.available:
             return None
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 self.url,
                 json={"model": self.model, "prompt": text},
                 timeout=self.timeout,
             )
             resp.raise_for_status()
             return resp.json()["embedding"]
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # Ollama went away: skip embedding until the next probe is due
+            logger.error("Embedding failed, Ollama unreachable: %s", e)
+            self._mark_unavailable()
+            return None
         except Exception as e:
             logger.error("Embedding failed: %s", e)
             return None
@@ -72,22 +119,100 @@ class OllamaEmbedder:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def to_bytes(vector: List[float]) -> bytes:
-        """Pack a float list into a compact binary BLOB."""
-        return struct.pack(f"{len(vector)}f", *vector)
+    def to_bytes(vector: List[float], quantize: bool = True) -> bytes:
+        """Pack a float list into a compact BLOB.
+
+        The vector is scaled to unit length first, so stored embeddings can be
+        ranked with a plain dot product (see :meth:`rank`). Only direction
+        matters for cosine similarity, so nothing reads the magnitude back.
+
+        By default components are quantized to int8 with one float32 scale per
+        vector (1 byte/dim); ``quantize=False`` keeps float16 (2 bytes/dim).
+        """
+        if np is not None:
+            v = np.asarray(vector, dtype=np.float32)
+            n = np.linalg.norm(v)
+            if n > 0:
+                v = v / n
+            if not quantize:
+                return _FP16_UNIT_HEADER + v.astype("<f2").tobytes()
+            peak = float(np.abs(v).max()) if v.size else 0.0
+            scale = peak / 127 if peak > 0 else 1.0
+            data = np.clip(np.rint(v / scale), -127, 127).astype(np.int8).tobytes()
+        else:
+            n = math.sqrt(sum(x * x for x in vector))
+            if n > 0:
+                vector = [x / n for x in vector]
+            if not quantize:
+                return _FP16_UNIT_HEADER + struct.pack(f"<{len(vector)}e", *vector)
+            peak = max((abs(x) for x in vector), default=0.0)
+            scale = peak / 127 if peak > 0 else 1.0
+            data = struct.pack(
+                f"<{len(vector)}b", *(max(-127, min(127, round(x / scale))) for x in vector)
+            )
+        if len(data) % 2:
+            return _INT8_PAD_HEADER + struct.pack("<f", scale) + data + b"\x00"
+        return _INT8_HEADER + struct.pack("<f", scale) + data
 
     @staticmethod
     def from_bytes(blob: bytes) -> List[float]:
-        """Unpack a binary BLOB back into a float list."""
+        """Unpack a binary BLOB back into a float list.
+
+        Blobs written before the dtype header existed are bare float32 and
+        always have a length divisible by 4; headed blobs have odd length.
+        """
+        if len(blob) % 2 == 1:
+            header, blob = blob[:1], blob[1:]
+            if header in (_FP16_UNIT_HEADER, _FP16_HEADER):
+                if np is not None:
+                    return np.frombuffer(blob, dtype="<f2").astype(np.float32).tolist()
+                return list(struct.unpack(f"<{len(blob) // 2}e", blob))
+            if header in (_INT8_HEADER, _INT8_PAD_HEADER):
+                (scale,) = struct.unpack("<f", blob[:4])
+                data = blob[4:-1] if header == _INT8_PAD_HEADER else blob[4:]
+                if np is not None:
+                    return (np.frombuffer(data, dtype=np.int8).astype(np.float32) * scale).tolist()
+                return [q * scale for q in struct.unpack(f"<{len(data)}b", data)]
+            if header != _FP32_HEADER:
+                raise ValueError(f"Unknown embedding dtype header: {header!r}")
         n = len(blob) // 4  # 4 bytes per float32
         return list(struct.unpack(f"{n}f", blob))
 
+    @staticmethod
+    def is_quantized(blob: bytes) -> bool:
+        """True for int8 blobs written by :meth:`to_bytes`."""
+        return len(blob) % 2 == 1 and blob[:1] in (_INT8_HEADER, _INT8_PAD_HEADER)
+
     # ------------------------------------------------------------------
     # Similarity
     # ------------------------------------------------------------------
 
     def batch_embed(self, texts: List[str]) -> List[Optional[List[float]]]:
-        """Embed multiple texts. Returns a list of vectors (or None for failures)."""
+        """Embed multiple texts. Returns a list of vectors (or None for failures).
+
+        Sends one /api/embed request for the whole batch; servers without that
+        endpoint (older Ollama) fall back to one /api/embeddings call per text.
+        """
+        if not self.available:
+            return [None] * len(texts)
+        if texts and self._batch_supported:
+            try:
+                resp = self.session.post(
+                    self.batch_url,
+                    json={"model": self.model, "input": texts},
+                    timeout=self.timeout,
+                )
+                if resp.status_code == 404:
+                    logger.info("OllamaEmbedder: /api/embed not supported; embedding per text")
+                    self._batch_supported = False
+                else:
+                    resp.raise_for_status()
+                    embeddings = resp.json()["embeddings"]
+                    if len(embeddings) == len(texts):
+                        return embeddings
+                    logger.warning("Batch embedding returned %d vectors for %d texts", len(embeddings), len(texts))
+            except Exception as e:
+                logger.warning("Batch embedding failed, embedding per text: %s", e)
         return [self.embed(t) for t in texts]
 
     @staticmethod
@@ -95,9 +220,132 @@ class OllamaEmbedder:
         """Compute cosine similarity between two vectors."""
         if len(a) != len(b):
             return 0.0
+        if np is not None:
+            va = np.asarray(a, dtype=np.float32)
+            vb = np.asarray(b, dtype=np.float32)
+            norm_a = np.linalg.norm(va)
+            norm_b = np.linalg.norm(vb)
+            if norm_a == 0 or norm_b == 0:
+                return 0.0
+            return float(va @ vb / (norm_a * norm_b))
         dot = sum(x * y for x, y in zip(a, b))
         norm_a = math.sqrt(sum(x * x for x in a))
         norm_b = math.sqrt(sum(x * x for x in b))
         if norm_a == 0 or norm_b == 0:
             return 0.0
         return dot / (norm_a * norm_b)
+
+
+class EmbeddingIndex:
+    """Embeddings of one table held in memory as unit-length rows.
+
+    Callers load the table once and :meth:`add` rows as they are embedded;
+    :meth:`top_k` then ranks every row with a single matrix-vector product
+    instead of decoding and scoring each BLOB per query.
+
+    With NumPy the rows live in one preallocated float32 buffer that doubles
+    when full, so adding a row never re-stacks the matrix. Without NumPy, or
+    once rows of different lengths appear, they are kept as a list instead.
+    """
+
+    _INITIAL_CAPACITY = 64
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self._buffer = None  # (capacity, D) float32 while every row has length D
+        self._rows: Optional[list] = None if np is not None else []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, row_id: int, vector: List[float]):
+        if np is not None:
+            row = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(row))
+        else:
+            row = list(vector)
+            norm = math.sqrt(sum(x * x for x in row))
+        if norm > 0:
+            row = row / norm if np is not None else [x / norm for x in row]
+
+        n = len(self.ids)
+        if self._rows is None:
+            if self._buffer is None:
+                self._buffer = np.empty((self._INITIAL_CAPACITY, len(row)), dtype=np.float32)
+            elif len(row) != self._buffer.shape[1]:
+                # Embeddings from models of different size: give up on the matrix
+                self._rows = list(self._buffer[:n])
+                self._buffer = None
+            elif n == len(self._buffer):
+                grown = np.empty((2 * n, self._buffer.shape[1]), dtype=np.float32)
+                grown[:n] = self._buffer
+                self._buffer = grown
+        if self._rows is None:
+            self._buffer[n] = row
+        else:
+            self._rows.append(row)
+        self.ids.append(row_id)
+
+    def save(self, stem: str) -> bool:
+        """Write the matrix to ``<stem>.vec.npy`` and ids to ``<stem>.ids.npy``.
+
+        Returns False (writing nothing) without NumPy or a contiguous matrix.
+        """
+        if np is None or self._buffer is None:
+            return False
+        n = len(self.ids)
+        for suffix, array in (
+            (".ids.npy", np.asarray(self.ids, dtype=np.int64)),
+            (".vec.npy", self._buffer[:n]),
+        ):
+            tmp = f"{stem}{suffix}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp, stem + suffix)
+        return True
+
+    @classmethod
+    def load(cls, stem: str) -> Optional["EmbeddingIndex"]:
+        """Index saved by :meth:`save`, memory-mapped; None if missing or unreadable.
+
+        The matrix is mapped copy-on-write, so pages are read on demand and
+        stay shared through the OS page cache; :meth:`add` never writes back.
+        """
+        if np is None:
+            return None
+        try:
+            ids = np.load(stem + ".ids.npy")
+            matrix = np.load(stem + ".vec.npy", mmap_mode="c")
+        except (OSError, ValueError):
+            return None
+        if matrix.ndim != 2 or matrix.dtype != np.float32 or len(matrix) != len(ids):
+            return None
+        index = cls()
+        if len(ids):
+            index.ids = ids.tolist()
+            index._buffer = matrix
+        return index
+
+    def top_k(self, query: List[float], k: int) -> List[Tuple[int, float]]:
+        """Return up to *k* ``(row_id, cosine similarity)`` pairs, best first."""
+        if not self.ids or k <= 0:
+            return []
+        scores = self._scores(query)
+        if np is not None and isinstance(scores, np.ndarray):
+            idx = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+            idx = idx[np.argsort(-scores[idx], kind="stable")]
+            return [(self.ids[i], float(scores[i])) for i in idx]
+        best = heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+        return [(self.ids[i], scores[i]) for i in best]
+
+    def _scores(self, query: List[float]):
+        if self._buffer is not None and np is not None:
+            matrix = self._buffer[:len(self.ids)]
+            if matrix.shape[1] != len(query):
+                return np.zeros(len(self.ids), dtype=np.float32)
+            q = np.asarray(query, dtype=np.float32)
+            norm = np.linalg.norm(q)
+            if norm == 0:
+                return np.zeros(len(self.ids), dtype=np.float32)
+            return matrix @ (q / norm)
+        return [OllamaEmbedder.cosine_similarity(query, row) for row in self._rows or []]
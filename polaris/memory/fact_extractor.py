@@ -10,7 +10,9 @@ reflected in master_prompt.md 99_CURRENT_CONTEXT.
 
 import logging
 import re
+import string
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -90,6 +92,49 @@ for raw_pattern, category, title_tpl in _RAW_PATTERNS:
     FACT_PATTERNS.append((re.compile(raw_pattern, re.IGNORECASE), category, title_tpl))
 
 
+def _title_parts(title_tpl: str, group_count: int) -> Optional[tuple]:
+    """Split a title template into literals and group indexes, parsed once.
+
+    Returns None when the template cannot be filled from the pattern's groups
+    (the title is then the template as written).
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(title_tpl):
+        if literal:
+            parts.append(literal)
+        if field is None:
+            continue
+        if not field.isdigit() or int(field) >= group_count or spec or conversion:
+            return None
+        parts.append(int(field))
+    return tuple(parts)
+
+
+# Parallel to FACT_PATTERNS
+_TITLE_PARTS = [_title_parts(tpl, pattern.groups) for pattern, _, tpl in FACT_PATTERNS]
+
+# Lowercase literals at least one of which occurs in any text a fact pattern
+# matches; a message containing none of them skips the regexes entirely.
+# Keep in sync with _RAW_PATTERNS.
+_ANCHORS = (
+    "시작했어", "쓰게", "배우고", "쓰기", "써",
+    "설치했어", "깔았어", "세팅했어", "설정했어", "셋업했어",
+    "합격했어", "붙었어", "떨어졌어", "통과했어",
+    "샀어", "바꿨어", "구매했어", "질렀어", "주문했어",
+    "시루", "설기", "학기", "연구에서",
+    "시뮬레이션", "계산", "dft", "vasp", "onetep", "밴드갭", "band",
+    "인턴", "직장", "회사", "취직",
+    "km", "마일", "mile", "엔진오일", "타이어", "브레이크", "배터리",
+    "이사", "병원", "아파서", "감기", "코로나", "독감",
+)
+
+# All patterns fused into one alternation: a single scan rules out the common
+# turn that states no fact. It is only a gate: finditer over the alternation
+# would return non-overlapping matches, and the (.+?) patterns would shadow
+# each other, so matching turns still run every pattern for its groups.
+_ANY_FACT = re.compile("|".join(f"(?:{raw})" for raw, _, _ in _RAW_PATTERNS), re.IGNORECASE)
+
+
 # Section mapping for master_prompt.md
 CATEGORY_TO_SECTION = {
     "research": "02_RESEARCH",
@@ -106,12 +151,51 @@ HIGH_IMPORTANCE_CATEGORIES = {"career", "research", "academic"}
 # Minimum message length to consider extraction
 MIN_MESSAGE_LENGTH = 10
 
-# Simple messages that should never trigger extraction
-_SKIP_PATTERNS = re.compile(
-    r"^(ㅋ+|ㅎ+|ㅠ+|ㅜ+|안녕|고마워|감사|ㅇㅋ|ㅇㅇ|응|아니|네|오키|잘\s*자|굿나잇|"
-    r"good\s*night|thanks|thank\s*you|ok|okay|hi|hello|hey|bye|gn)[\s!?.]*$",
-    re.IGNORECASE,
-)
+# Simple messages that should never trigger extraction, compared after
+# lowercasing, stripping trailing "!?." and collapsing whitespace runs.
+# Phrases are listed with and without their inner space.
+_SKIP_LITERALS = frozenset({
+    "안녕", "고마워", "감사", "ㅇㅋ", "ㅇㅇ", "응", "아니", "네", "오키", "잘자", "잘 자", "굿나잇",
+    "goodnight", "good night", "thanks", "thankyou", "thank you",
+    "ok", "okay", "hi", "hello", "hey", "bye", "gn",
+})
+# ...plus a run of a single jamo (ㅋㅋㅋ, ㅎㅎ, ㅠㅠ, ㅜㅜ)
+_SKIP_REPEAT_CHARS = frozenset("ㅋㅎㅠㅜ")
+
+
+@lru_cache(maxsize=512)
+def _match_facts(user_message: str) -> tuple:
+    """``(category, title)`` pairs matched in *user_message*, deduplicated by title.
+
+    Cached because retries and follow-ups often repeat a message verbatim.
+    """
+    lowered = user_message.lower()
+    if not any(anchor in lowered for anchor in _ANCHORS):
+        return ()
+    if not _ANY_FACT.search(user_message):
+        return ()
+    matched = []
+    seen_titles = set()
+
+    for (pattern, category, title_tpl), parts in zip(FACT_PATTERNS, _TITLE_PARTS):
+        match = pattern.search(user_message)
+        if not match:
+            continue
+
+        # Build title from template + captured groups
+        if parts is None:
+            title = title_tpl
+        else:
+            groups = match.groups()
+            title = "".join(p if isinstance(p, str) else (groups[p] or "") for p in parts)
+
+        # Deduplicate within same extraction
+        if title in seen_titles:
+            continue
+        seen_titles.add(title)
+        matched.append((category, title))
+
+    return tuple(matched)
 
 
 class FactExtractor:
@@ -138,7 +222,10 @@ class FactExtractor:
         """
         if not user_message or len(user_message) < MIN_MESSAGE_LENGTH:
             return False
-        if _SKIP_PATTERNS.match(user_message.strip()):
+        text = " ".join(user_message.lower().rstrip("!?. \t\r\n").split())
+        if text in _SKIP_LITERALS:
+            return False
+        if len(set(text)) == 1 and text[0] in _SKIP_REPEAT_CHARS:
             return False
         return True
 
@@ -157,36 +244,12 @@ class FactExtractor:
         Returns a list of fact dicts:
             [{category, title, content, source}]
         """
-        facts = []
-        seen_titles = set()
-
-        for pattern, category, title_tpl in FACT_PATTERNS:
-            match = pattern.search(user_message)
-            if not match:
-                continue
-
-            # Build title from template + captured groups
-            groups = match.groups()
-            try:
-                title = title_tpl.format(*groups)
-            except (IndexError, KeyError):
-                title = title_tpl
-
-            # Deduplicate within same extraction
-            if title in seen_titles:
-                continue
-            seen_titles.add(title)
-
-            content = user_message.strip()
-
-            facts.append({
-                "category": category,
-                "title": title,
-                "content": content,
-                "source": "conversation",
-            })
-
-        return facts
+        content = user_message.strip()
+        # Fresh dicts per call, so callers may modify them without touching the cache
+        return [
+            {"category": category, "title": title, "content": content, "source": "conversation"}
+            for category, title in _match_facts(user_message)
+        ]
 
     # ------------------------------------------------------------------
     # Categorization (for master_prompt section mapping)
@@ -7,9 +7,13 @@ as caution blocks for system prompt injection.
 
 import logging
 import re
-from datetime import datetime
+import threading
+from functools import lru_cache
 from typing import Dict, List, Optional
 
+from polaris.memory.embedder import EmbeddingIndex
+from polaris.timestamps import utc_now
+
 logger = logging.getLogger(__name__)
 
 # Korean + English correction patterns
@@ -47,8 +51,28 @@ CORRECTION_PATTERNS = [
     r"(?i)wrong[.!]",
 ]
 
-# Compiled patterns for performance
-_COMPILED_PATTERNS = [re.compile(p) for p in CORRECTION_PATTERNS]
+def _scoped(pattern: str) -> str:
+    """Turn a leading global ``(?i)`` into a scoped group so it can be fused."""
+    return f"(?i:{pattern[4:]})" if pattern.startswith("(?i)") else f"(?:{pattern})"
+
+
+# Most patterns are plain phrases: those are found with substring checks on
+# the lowercased message, and only the rest go through the fused regex.
+_REGEX_META = re.compile(r"[\\|()\[\]{}+*?.^$]")
+_CORRECTION_LITERALS = tuple(
+    p.removeprefix("(?i)").lower()
+    for p in CORRECTION_PATTERNS
+    if not _REGEX_META.search(p.removeprefix("(?i)"))
+)
+_CORRECTION_RE = re.compile(
+    "|".join(
+        _scoped(p) for p in CORRECTION_PATTERNS
+        if _REGEX_META.search(p.removeprefix("(?i)"))
+    )
+)
+
+# PRAGMA user_version once _migrate_schema has run; bump it when adding a migration
+_SCHEMA_VERSION = 1
 
 # Max character length for stored feedback text
 MAX_FEEDBACK_LENGTH = 200
@@ -69,25 +93,49 @@ class FeedbackManager:
         """
         self.memory = memory
         self.embedder = embedder or getattr(memory, "embedder", None)
+        # Correction embeddings for semantic search, loaded on first search
+        self._index: Optional[EmbeddingIndex] = None
+        self._index_lock = threading.Lock()
+        memory.add_index_invalidator(self.invalidate_index)
         self._migrate_schema()
 
-    def _migrate_schema(self):
-        """Add new columns to feedback table if they don't exist (idempotent)."""
-        conn = self.memory.conn
-        cursor = conn.execute("PRAGMA table_info(feedback)")
-        existing_cols = {row[1] for row in cursor.fetchall()}
-
-        new_columns = {
-            "embedding": "BLOB",
-            "session_id": "TEXT",
-            "category": "TEXT",
-        }
+    def invalidate_index(self):
+        """Drop the cached correction embeddings; the next search reloads them."""
+        with self._index_lock:
+            self._index = None
 
-        for col_name, col_type in new_columns.items():
-            if col_name not in existing_cols:
-                conn.execute(f"ALTER TABLE feedback ADD COLUMN {col_name} {col_type}")
-                logger.info("Added column '%s' to feedback table", col_name)
+    def _migrate_schema(self):
+        """Add new columns to feedback table if they don't exist (idempotent).
 
+        Skipped once PRAGMA user_version records the migration. The steps run
+        in one transaction, so a failure leaves the version unchanged.
+        """
+        conn = self.memory.conn
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute("PRAGMA table_info(feedback)")
+            existing_cols = {row[1] for row in cursor.fetchall()}
+
+            new_columns = {
+                "embedding": "BLOB",
+                "session_id": "TEXT",
+                "category": "TEXT",
+            }
+
+            for col_name, col_type in new_columns.items():
+                if col_name not in existing_cols:
+                    conn.execute(f"ALTER TABLE feedback ADD COLUMN {col_name} {col_type}")
+                    logger.info("Added column '%s' to feedback table", col_name)
+
+            # Created here rather than in schema.sql: older DBs lack the column until now
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_category ON feedback(category)")
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        except BaseException:
+            conn.rollback()
+            raise
         conn.commit()
 
     # ------------------------------------------------------------------
@@ -95,18 +143,20 @@ class FeedbackManager:
     # ------------------------------------------------------------------
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def detect_correction(user_message: str) -> bool:
         """Check if a user message contains a correction pattern.
 
-        Stateless — only checks text against regex patterns.
+        Stateless — only checks text against regex patterns, so results are
+        cached per message for repeated phrasings.
         """
         if not user_message or len(user_message) < 2:
             return False
 
-        for pattern in _COMPILED_PATTERNS:
-            if pattern.search(user_message):
-                return True
-        return False
+        lowered = user_message.lower()
+        if any(lit in lowered for lit in _CORRECTION_LITERALS):
+            return True
+        return _CORRECTION_RE.search(user_message) is not None
 
     # ------------------------------------------------------------------
     # Storage
@@ -138,20 +188,23 @@ class FeedbackManager:
                 logger.debug("Embedding correction failed: %s", e)
 
         conn = self.memory.conn
-        cursor = conn.execute(
-            """INSERT INTO feedback
-               (timestamp, original_action, correction, applied, embedding, session_id, category)
-               VALUES (?, ?, ?, 0, ?, ?, ?)""",
-            (
-                datetime.utcnow().isoformat(),
-                original_response,
-                user_correction,
-                embedding_blob,
-                session_id,
-                category,
-            ),
-        )
-        conn.commit()
+        with self._index_lock:
+            cursor = conn.execute(
+                """INSERT INTO feedback
+                   (timestamp, original_action, correction, applied, embedding, session_id, category)
+                   VALUES (?, ?, ?, 0, ?, ?, ?)""",
+                (
+                    utc_now(),
+                    original_response,
+                    user_correction,
+                    embedding_blob,
+                    session_id,
+                    category,
+                ),
+            )
+            conn.commit()
+            if embedding_blob is not None and self._index is not None:
+                self._index.add(cursor.lastrowid, self.embedder.from_bytes(embedding_blob))
         logger.info("Saved correction (id=%d, category=%s)", cursor.lastrowid, category)
         return cursor.lastrowid
 
@@ -186,21 +239,39 @@ class FeedbackManager:
     def _semantic_feedback_search(self, query_vec: list, top_k: int) -> List[Dict]:
         """Rank feedback by cosine similarity to query vector."""
         conn = self.memory.conn
+        with self._index_lock:
+            if self._index is None:
+                index = EmbeddingIndex()
+                cursor = conn.execute(
+                    "SELECT id, embedding FROM feedback WHERE embedding IS NOT NULL ORDER BY id"
+                )
+                for row in cursor:
+                    index.add(row["id"], self.embedder.from_bytes(row["embedding"]))
+                self._index = index
+            hits = self._index.top_k(query_vec, top_k)
+        if not hits:
+            return []
+
+        scores = dict(hits)
         cursor = conn.execute(
-            """SELECT id, timestamp, original_action, correction, category, session_id, embedding
-               FROM feedback WHERE embedding IS NOT NULL"""
+            f"""SELECT id, timestamp, original_action, correction, category, session_id
+                FROM feedback WHERE id IN ({','.join('?' * len(scores))})""",
+            list(scores),
         )
-
-        candidates = []
-        for row in cursor:
-            row_dict = dict(row)
-            vec = self.embedder.from_bytes(row_dict.pop("embedding"))
-            sim = self.embedder.cosine_similarity(query_vec, vec)
-            row_dict["score"] = sim
-            candidates.append(row_dict)
-
-        candidates.sort(key=lambda c: c["score"], reverse=True)
-        return candidates[:top_k]
+        rows = {
+            row_id: {
+                "id": row_id,
+                "timestamp": timestamp,
+                "original_action": original_action,
+                "correction": correction,
+                "category": category,
+                "session_id": session_id,
+                "score": scores[row_id],
+            }
+            for row_id, timestamp, original_action, correction, category, session_id in cursor
+        }
+        # hits are already best first; no need to sort again
+        return [rows[row_id] for row_id, _ in hits if row_id in rows]
 
     def get_recent_feedback(self, limit: int = 10) -> List[Dict]:
         """Get most recent feedback entries. For /feedback command."""
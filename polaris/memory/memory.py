@@ -6,18 +6,93 @@ Embeds text via OllamaEmbedder (nomic-embed-text, local, free).
 When Ollama is unavailable, falls back to keyword-based search.
 """
 
+import heapq
 import json
 import logging
 import os
+import queue
 import sqlite3
-from datetime import datetime
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
-from polaris.memory.embedder import OllamaEmbedder
+from polaris.memory.embedder import EmbeddingIndex, OllamaEmbedder
+from polaris.timestamps import utc_now
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+def _dumps(obj) -> str:
+    """Compact JSON text with non-ASCII kept as-is (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# Both raise a json.JSONDecodeError subclass on malformed input
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+# Rows embedded per background batch_embed call
+_EMBED_BATCH_SIZE = 32
+
+# Parsed corrections.jsonl lines buffered per executemany during migration
+_MIGRATE_BATCH_SIZE = 10_000
+
+# Trigram full-text tables over conversation and knowledge text. They are
+# external-content tables kept in sync by triggers, and answer substring
+# queries (Korean included) from an index instead of a LIKE table scan.
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS conversations_fts USING fts5(
+    content, content='conversations', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS conversations_fts_ai AFTER INSERT ON conversations BEGIN
+    INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS conversations_fts_ad AFTER DELETE ON conversations BEGIN
+    INSERT INTO conversations_fts(conversations_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS conversations_fts_au AFTER UPDATE OF content ON conversations BEGIN
+    INSERT INTO conversations_fts(conversations_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO conversations_fts(rowid, content) VALUES (new.id, new.content);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts USING fts5(
+    title, content, content='knowledge', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS knowledge_fts_ai AFTER INSERT ON knowledge BEGIN
+    INSERT INTO knowledge_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS knowledge_fts_ad AFTER DELETE ON knowledge BEGIN
+    INSERT INTO knowledge_fts(knowledge_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS knowledge_fts_au AFTER UPDATE OF title, content ON knowledge BEGIN
+    INSERT INTO knowledge_fts(knowledge_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+    INSERT INTO knowledge_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+END;
+"""
+
+# Conversations are scored on a pool thread alongside knowledge once both
+# matrices hold this many rows; below that a thread hand-off costs more
+# than the matrix-vector product it would overlap.
+_PARALLEL_SCORE_ROWS = 20_000
+
+# Trigram queries need at least three characters
+_FTS_MIN_QUERY = 3
+
+# WAL lets searches read while the embedding worker writes; the rest keeps
+# temp b-trees in memory and maps up to 256 MiB of the file for reads.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
 
 class PolarisMemory:
     """Unified memory interface for the Polaris agent system."""
@@ -31,10 +106,24 @@ class PolarisMemory:
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            self.conn.execute(pragma)
         self._init_schema()
 
         self.embedder = embedder if embedder is not None else OllamaEmbedder()
 
+        # Write-behind embedding: rows are inserted with a NULL embedding and
+        # a daemon thread fills them in batches (started on first save).
+        self._lock = threading.RLock()
+        self._pending: "queue.Queue[tuple]" = queue.Queue()
+        self._embed_thread: Optional[threading.Thread] = None
+        # Per-table embedding matrices for semantic search, loaded on first search
+        self._indexes: Dict[str, EmbeddingIndex] = {}
+        self._score_pool: Optional[ThreadPoolExecutor] = None
+        # Indexes owned by other components (e.g. FeedbackManager) that must
+        # be dropped when stored embeddings are rewritten
+        self._index_invalidators: List[weakref.WeakMethod] = []
+
     # ------------------------------------------------------------------
     # Schema
     # ------------------------------------------------------------------
@@ -45,22 +134,44 @@ class PolarisMemory:
         with open(schema_path, "r") as f:
             schema_sql = f.read()
         self.conn.executescript(schema_sql)
+        self._fts = self._init_fts()
+
+    def _init_fts(self) -> bool:
+        """Create the full-text tables; False when SQLite lacks FTS5/trigram."""
+        existing = {
+            row[0] for row in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE name IN ('conversations_fts', 'knowledge_fts')"
+            )
+        }
+        try:
+            self.conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError as e:
+            logger.info("Full-text index unavailable, keyword search uses LIKE: %s", e)
+            return False
+        # Index rows written before the tables existed
+        for table in ("conversations_fts", "knowledge_fts"):
+            if table not in existing:
+                self.conn.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        self.conn.commit()
+        return True
 
     # ------------------------------------------------------------------
     # Conversations
     # ------------------------------------------------------------------
 
     def save_conversation(self, session_id: str, role: str, content: str) -> int:
-        """Save a conversation turn and return the row id."""
-        embedding = self.embedder.embed(content)
-        blob = self.embedder.to_bytes(embedding) if embedding else None
+        """Save a conversation turn and return the row id.
 
-        cursor = self.conn.execute(
-            """INSERT INTO conversations (timestamp, session_id, role, content, embedding)
-               VALUES (?, ?, ?, ?, ?)""",
-            (datetime.utcnow().isoformat(), session_id, role, content, blob),
-        )
-        self.conn.commit()
+        The embedding is computed in the background; see :meth:`flush`.
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                """INSERT INTO conversations (timestamp, session_id, role, content, embedding)
+                   VALUES (?, ?, ?, ?, NULL)""",
+                (utc_now(), session_id, role, content),
+            )
+            self.conn.commit()
+        self._queue_embedding("conversations", cursor.lastrowid, content)
         return cursor.lastrowid
 
     def get_recent_conversations(self, session_id: str, limit: int = 20) -> List[Dict]:
@@ -88,26 +199,136 @@ class PolarisMemory:
         source: str = "manual",
         tags: Optional[List[str]] = None,
     ) -> int:
-        """Save a knowledge entry and return the row id."""
-        embedding = self.embedder.embed(content)
-        blob = self.embedder.to_bytes(embedding) if embedding else None
+        """Save a knowledge entry and return the row id.
 
-        cursor = self.conn.execute(
-            """INSERT INTO knowledge (timestamp, category, title, content, embedding, source, tags)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (
-                datetime.utcnow().isoformat(),
-                category,
-                title,
-                content,
-                blob,
-                source,
-                json.dumps(tags or [], ensure_ascii=False),
-            ),
-        )
-        self.conn.commit()
+        The embedding is computed in the background; see :meth:`flush`.
+        """
+        with self._lock:
+            cursor = self.conn.execute(
+                """INSERT INTO knowledge (timestamp, category, title, content, embedding, source, tags)
+                   VALUES (?, ?, ?, ?, NULL, ?, ?)""",
+                (
+                    utc_now(),
+                    category,
+                    title,
+                    content,
+                    source,
+                    _dumps(tags or []),
+                ),
+            )
+            self.conn.commit()
+        self._queue_embedding("knowledge", cursor.lastrowid, content)
         return cursor.lastrowid
 
+    # ------------------------------------------------------------------
+    # Background embedding
+    # ------------------------------------------------------------------
+
+    def _queue_embedding(self, table: str, row_id: int, content: str):
+        with self._lock:
+            if self._embed_thread is None:
+                self._embed_thread = threading.Thread(
+                    target=self._embed_worker, name="polaris-embed", daemon=True
+                )
+                self._embed_thread.start()
+        self._pending.put((table, row_id, content))
+
+    def _embed_worker(self):
+        while True:
+            batch = [self._pending.get()]
+            while len(batch) < _EMBED_BATCH_SIZE:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._embed_rows(batch)
+            except Exception as e:
+                logger.warning("Background embedding failed for %d rows: %s", len(batch), e)
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    def _embed_rows(self, batch: List[tuple]):
+        """Embed a batch of queued rows and store the vectors in one transaction."""
+        texts = [content for _, _, content in batch]
+        batch_embed = getattr(self.embedder, "batch_embed", None)
+        vectors = batch_embed(texts) if batch_embed else [self.embedder.embed(t) for t in texts]
+        updates: Dict[str, List[tuple]] = {}
+        for (table, row_id, _), vec in zip(batch, vectors):
+            if vec:
+                updates.setdefault(table, []).append((self.embedder.to_bytes(vec), row_id))
+        if not updates:
+            return
+        with self._lock:
+            for table, pairs in updates.items():
+                self.conn.executemany(
+                    f"UPDATE {table} SET embedding = ? WHERE id = ?",
+                    pairs,
+                )
+            self.conn.commit()
+            for table, pairs in updates.items():
+                index = self._indexes.get(table)
+                if index is not None:
+                    # Index the stored (int8) vector, as a rebuild from the DB would
+                    for blob, row_id in pairs:
+                        index.add(row_id, self.embedder.from_bytes(blob))
+
+    def flush(self):
+        """Block until every queued embedding has been written."""
+        self._pending.join()
+
+    def add_index_invalidator(self, callback: Callable[[], None]) -> None:
+        """Register a bound method to call when stored embeddings are rewritten.
+
+        Held weakly, so registering does not keep the owner alive.
+        """
+        with self._lock:
+            self._index_invalidators.append(weakref.WeakMethod(callback))
+
+    def quantize_embeddings(self) -> int:
+        """Rewrite float embeddings as int8 blobs in one transaction.
+
+        Covers conversations, knowledge and feedback. Returns the number of
+        rows converted; rows already stored as int8 are left alone.
+        """
+        self.flush()
+        tables = ["conversations", "knowledge"]
+        feedback_cols = {row[1] for row in self.conn.execute("PRAGMA table_info(feedback)")}
+        if "embedding" in feedback_cols:
+            tables.append("feedback")
+        converted = 0
+        with self._lock:
+            for table in tables:
+                rows = self.conn.execute(
+                    f"SELECT id, embedding FROM {table} WHERE embedding IS NOT NULL"
+                ).fetchall()
+                pairs = [
+                    (OllamaEmbedder.to_bytes(OllamaEmbedder.from_bytes(r["embedding"])), r["id"])
+                    for r in rows
+                    if not OllamaEmbedder.is_quantized(r["embedding"])
+                ]
+                self.conn.executemany(f"UPDATE {table} SET embedding = ? WHERE id = ?", pairs)
+                converted += len(pairs)
+            self.conn.commit()
+            if converted:
+                # Cached matrices hold the pre-quantization vectors
+                self._indexes.clear()
+                live = []
+                for ref in self._index_invalidators:
+                    callback = ref()
+                    if callback is not None:
+                        callback()
+                        live.append(ref)
+                self._index_invalidators = live
+                for table in ("conversations", "knowledge"):
+                    stem = self._sidecar(table)
+                    for suffix in (".ids.npy", ".vec.npy"):
+                        if stem and os.path.exists(stem + suffix):
+                            os.remove(stem + suffix)
+        logger.info("Quantized %d stored embeddings to int8", converted)
+        return converted
+
     # ------------------------------------------------------------------
     # Feedback
     # ------------------------------------------------------------------
@@ -117,7 +338,7 @@ class PolarisMemory:
         cursor = self.conn.execute(
             """INSERT INTO feedback (timestamp, original_action, correction, applied)
                VALUES (?, ?, ?, 0)""",
-            (datetime.utcnow().isoformat(), original_action, correction),
+            (utc_now(), original_action, correction),
         )
         self.conn.commit()
         return cursor.lastrowid
@@ -142,6 +363,7 @@ class PolarisMemory:
         query_vec = self.embedder.embed(query)
 
         if query_vec is not None:
+            self.flush()  # include rows saved moments ago
             return self._semantic_search(query_vec, top_k)
         return self._keyword_search(query, top_k)
 
@@ -162,51 +384,133 @@ class PolarisMemory:
     # Internal search implementations
     # ------------------------------------------------------------------
 
-    def _semantic_search(self, query_vec: List[float], top_k: int) -> List[Dict]:
-        """Rank by cosine similarity across conversations and knowledge."""
-        candidates = []
+    def _sidecar(self, table: str) -> Optional[str]:
+        """Path stem of the on-disk matrix cached for *table* (None for :memory:)."""
+        if self.db_path == ":memory:":
+            return None
+        return f"{self.db_path}.{table}"
 
-        # Search conversations
+    def _index(self, table: str) -> EmbeddingIndex:
+        """Embedding index for *table*, loaded on first use.
+
+        Vectors come from the sidecar matrix written by the previous load when
+        its ids still match the table; only rows embedded since then are
+        decoded from their BLOBs, after which the sidecar is rewritten.
+        """
+        index = self._indexes.get(table)
+        if index is not None:
+            return index
+        stem = self._sidecar(table)
+        index = EmbeddingIndex.load(stem) if stem else None
+        if index is not None:
+            ids = [
+                row[0] for row in self.conn.execute(
+                    f"SELECT id FROM {table} WHERE embedding IS NOT NULL ORDER BY id LIMIT ?",
+                    (len(index),),
+                )
+            ]
+            if ids != index.ids:
+                index = None
+        if index is None:
+            index = EmbeddingIndex()
+        last_id = index.ids[-1] if len(index) else 0
         cursor = self.conn.execute(
-            "SELECT id, content, embedding FROM conversations WHERE embedding IS NOT NULL"
+            f"SELECT id, embedding FROM {table} WHERE embedding IS NOT NULL AND id > ? ORDER BY id",
+            (last_id,),
         )
+        added = 0
         for row in cursor:
-            vec = self.embedder.from_bytes(row["embedding"])
-            sim = self.embedder.cosine_similarity(query_vec, vec)
-            candidates.append({
-                "source_table": "conversation",
-                "id": row["id"],
-                "content": row["content"],
-                "score": sim,
-            })
+            index.add(row["id"], self.embedder.from_bytes(row["embedding"]))
+            added += 1
+        if added and stem:
+            try:
+                index.save(stem)
+            except OSError as e:
+                logger.debug("Could not write embedding sidecar for %s: %s", table, e)
+        self._indexes[table] = index
+        return index
 
-        # Search knowledge
-        cursor = self.conn.execute(
-            "SELECT id, title, content, category, embedding FROM knowledge WHERE embedding IS NOT NULL"
+    def _semantic_search(self, query_vec: List[float], top_k: int) -> List[Dict]:
+        """Rank by cosine similarity across conversations and knowledge."""
+        with self._lock:
+            conv_index = self._index("conversations")
+            know_index = self._index("knowledge")
+            if min(len(conv_index), len(know_index)) >= _PARALLEL_SCORE_ROWS:
+                # NumPy releases the GIL in the product, so both tables score
+                # at once; the lock keeps the embed worker from appending rows.
+                if self._score_pool is None:
+                    self._score_pool = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="polaris-memory-score"
+                    )
+                conv_future = self._score_pool.submit(conv_index.top_k, query_vec, top_k)
+                know_hits = know_index.top_k(query_vec, top_k)
+                conv_hits = conv_future.result()
+            else:
+                conv_hits = conv_index.top_k(query_vec, top_k)
+                know_hits = know_index.top_k(query_vec, top_k)
+
+        # Merge on (table, id, score) first, so only the final top_k rows are
+        # fetched and turned into dicts.
+        best = heapq.nlargest(
+            top_k,
+            [("conversations", i, score) for i, score in conv_hits]
+            + [("knowledge", i, score) for i, score in know_hits],
+            key=lambda hit: hit[2],
         )
-        for row in cursor:
-            vec = self.embedder.from_bytes(row["embedding"])
-            sim = self.embedder.cosine_similarity(query_vec, vec)
-            candidates.append({
-                "source_table": "knowledge",
-                "id": row["id"],
-                "content": f"{row['title']}: {row['content']}",
-                "category": row["category"],
-                "score": sim,
-            })
+        conv_scores = {i: score for table, i, score in best if table == "conversations"}
+        know_scores = {i: score for table, i, score in best if table == "knowledge"}
 
-        candidates.sort(key=lambda c: c["score"], reverse=True)
-        return candidates[:top_k]
+        found = {}
+        if conv_scores:
+            cursor = self.conn.execute(
+                f"SELECT id, content FROM conversations WHERE id IN ({','.join('?' * len(conv_scores))})",
+                list(conv_scores),
+            )
+            for row_id, content in cursor:
+                found["conversations", row_id] = {
+                    "source_table": "conversation",
+                    "id": row_id,
+                    "content": content,
+                    "score": conv_scores[row_id],
+                }
+
+        if know_scores:
+            cursor = self.conn.execute(
+                f"SELECT id, title, content, category FROM knowledge WHERE id IN ({','.join('?' * len(know_scores))})",
+                list(know_scores),
+            )
+            for row_id, title, content, category in cursor:
+                found["knowledge", row_id] = {
+                    "source_table": "knowledge",
+                    "id": row_id,
+                    "content": f"{title}: {content}",
+                    "category": category,
+                    "score": know_scores[row_id],
+                }
+
+        return [found[table, i] for table, i, _ in best if (table, i) in found]
 
     def _keyword_search(self, query: str, top_k: int) -> List[Dict]:
-        """Simple LIKE-based fallback when embeddings are unavailable."""
-        results = []
-        pattern = f"%{query}%"
+        """Substring fallback when embeddings are unavailable.
 
-        cursor = self.conn.execute(
-            "SELECT id, content FROM conversations WHERE content LIKE ? ORDER BY id DESC LIMIT ?",
-            (pattern, top_k),
-        )
+        Uses the trigram full-text index when available, else a LIKE scan.
+        """
+        results = []
+        use_fts = self._fts and len(query) >= _FTS_MIN_QUERY
+        if use_fts:
+            phrase = '"' + query.replace('"', '""') + '"'
+            cursor = self.conn.execute(
+                """SELECT c.id, c.content
+                   FROM conversations_fts f JOIN conversations c ON c.id = f.rowid
+                   WHERE conversations_fts MATCH ? ORDER BY c.id DESC LIMIT ?""",
+                (phrase, top_k),
+            )
+        else:
+            pattern = f"%{query}%"
+            cursor = self.conn.execute(
+                "SELECT id, content FROM conversations WHERE content LIKE ? ORDER BY id DESC LIMIT ?",
+                (pattern, top_k),
+            )
         for row in cursor:
             results.append({
                 "source_table": "conversation",
@@ -217,13 +521,21 @@ class PolarisMemory:
 
         remaining = top_k - len(results)
         if remaining > 0:
-            cursor = self.conn.execute(
-                """SELECT id, title, content, category
-                   FROM knowledge
-                   WHERE content LIKE ? OR title LIKE ?
-                   ORDER BY id DESC LIMIT ?""",
-                (pattern, pattern, remaining),
-            )
+            if use_fts:
+                cursor = self.conn.execute(
+                    """SELECT k.id, k.title, k.content, k.category
+                       FROM knowledge_fts f JOIN knowledge k ON k.id = f.rowid
+                       WHERE knowledge_fts MATCH ? ORDER BY k.id DESC LIMIT ?""",
+                    (phrase, remaining),
+                )
+            else:
+                cursor = self.conn.execute(
+                    """SELECT id, title, content, category
+                       FROM knowledge
+                       WHERE content LIKE ? OR title LIKE ?
+                       ORDER BY id DESC LIMIT ?""",
+                    (pattern, pattern, remaining),
+                )
             for row in cursor:
                 results.append({
                     "source_table": "knowledge",
@@ -296,29 +608,37 @@ class PolarisMemory:
             return 0
 
         count = 0
-        with open(jsonl_path, "r", encoding="utf-8") as f:
+        rows = []
+        now = utc_now()  # for entries without their own timestamp
+        with self._lock, self.conn, open(jsonl_path, "r", encoding="utf-8") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _loads(line)
                     original = (
                         f"[{entry.get('hash', '')}] {entry.get('subject', '')} → "
                         f"{entry.get('original_label', '')}"
                     )
                     correction = entry.get("corrected_label", "")
-                    ts = entry.get("timestamp", datetime.utcnow().isoformat())
-
-                    self.conn.execute(
-                        """INSERT INTO feedback (timestamp, original_action, correction, applied)
-                           VALUES (?, ?, ?, 1)""",
-                        (ts, original, correction),
-                    )
-                    count += 1
+                    ts = entry.get("timestamp", now)
                 except (json.JSONDecodeError, KeyError) as e:
                     logger.warning("Skipping malformed line in corrections.jsonl: %s", e)
+                    continue
+                rows.append((ts, original, correction))
+                if len(rows) >= _MIGRATE_BATCH_SIZE:
+                    count += self._insert_applied_feedback(rows)
+                    rows = []
+            count += self._insert_applied_feedback(rows)
 
-        self.conn.commit()
         logger.info("Migrated %d corrections from %s", count, jsonl_path)
         return count
+
+    def _insert_applied_feedback(self, rows: List[tuple]) -> int:
+        self.conn.executemany(
+            """INSERT INTO feedback (timestamp, original_action, correction, applied)
+               VALUES (?, ?, ?, 1)""",
+            rows,
+        )
+        return len(rows)
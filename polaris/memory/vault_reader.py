@@ -6,11 +6,14 @@ indexes them into the knowledge table with embeddings for semantic search.
 Supports incremental indexing via a vault_index.json tracking file.
 """
 
+import hashlib
 import json
 import logging
+import multiprocessing
 import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -31,6 +34,17 @@ MIN_FILE_SIZE = 1024  # 1KB
 # Max content length stored per note (for embedding efficiency)
 MAX_CONTENT_LENGTH = 2000
 
+# Threads reading/parsing notes ahead of the (sequential) embedding step
+READ_WORKERS = int(os.getenv("POLARIS_VAULT_READ_WORKERS", "8"))
+
+# Worker processes parsing notes when a reindex touches many of them
+# (1 or less keeps parsing on the READ_WORKERS threads)
+PARSE_PROCESSES = int(os.getenv("POLARIS_VAULT_PARSE_PROCESSES", str(os.cpu_count() or 1)))
+
+# Below this many changed notes, threads parse them: starting worker
+# processes costs more than the regex work they would spread out.
+_PROCESS_PARSE_MIN_NOTES = 200
+
 # Folder path → category mapping
 FOLDER_CATEGORY_MAP = [
     ("30_Resources/Foundations/Physics", "research"),
@@ -43,12 +57,127 @@ FOLDER_CATEGORY_MAP = [
     ("Polaris/Research", "research"),
 ]
 
+# Note parsing patterns, compiled once at import
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_WIKILINK_TARGET_RE = re.compile(r"\[\[([^\]|]+?)(?:\|[^\]]+)?\]\]")
+_TAG_RE = re.compile(r"(?:^|\s)#([a-zA-Z가-힣][\w가-힣/-]*)")
+
+# Markdown formatting stripped by _strip_markdown in one pass: heading
+# markers, images, wikilinks (alias kept), links (text kept), bold/italic
+# (text kept) and HTML tags. Images come before links so "![alt](src)"
+# is dropped whole rather than read as "!" plus a link.
+_MD_RE = re.compile(
+    r"(?P<head>^#+\s+)"
+    r"|(?P<img>!\[[^\]]*\]\([^)]+\))"
+    r"|\[\[(?P<wiki>[^\]|]+?)(?:\|(?P<alias>[^\]]+))?\]\]"
+    r"|\[(?P<link>[^\]]+)\]\([^)]+\)"
+    r"|\*{1,3}(?P<bold>[^*]+)\*{1,3}"
+    r"|(?P<html><[^>]+>)",
+    re.MULTILINE,
+)
+_WS_RE = re.compile(r"\n{3,}")
+
+
+def _md_replacement(match: "re.Match") -> str:
+    kind = match.lastgroup
+    if kind in ("bold", "link"):
+        # Kept text may itself hold formatting, e.g. **[x](url)**
+        return _MD_RE.sub(_md_replacement, match.group(kind))
+    if kind in ("wiki", "alias"):
+        return match.group("alias") or match.group("wiki")
+    return ""
+
+
 # Default index file path
 _DEFAULT_INDEX_PATH = str(
     Path(__file__).parent.parent.parent / "data" / "vault_index.json"
 )
 
 
+def _walk_markdown(root: str):
+    """Yield ``(path, name, stat)`` for each .md file under *root*.
+
+    Uses os.scandir so each file's stat comes from its DirEntry (free on
+    Windows, one call elsewhere) and SKIP_DIRS subtrees are never opened.
+    A directory's files come before its subdirectories.
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            yield entry.path, entry.name, entry.stat()
+                    except OSError:
+                        continue
+        except OSError as e:
+            logger.debug("Cannot scan %s: %s", directory, e)
+        pending.extend(reversed(subdirs))
+
+
+def _content_hash(data: bytes) -> str:
+    """Digest of a note's raw bytes, recorded in vault_index.json."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_note_file(filepath: str) -> Dict:
+    """VaultReader.parse_note without the instance, so worker processes can run it."""
+    path = Path(filepath)
+    title = path.stem
+
+    try:
+        data = path.read_bytes()
+        raw = data.decode("utf-8")
+    except Exception as e:
+        logger.warning("Failed to read %s: %s", filepath, e)
+        return {
+            "title": title,
+            "frontmatter": {},
+            "content": "",
+            "links": [],
+            "tags": [],
+            "path": filepath,
+            "content_hash": "",
+        }
+
+    # Parse YAML frontmatter
+    frontmatter = {}
+    content = raw
+    fm_match = _FRONTMATTER_RE.match(raw)
+    if fm_match:
+        frontmatter = VaultReader._parse_yaml_simple(fm_match.group(1))
+        content = raw[fm_match.end():]
+
+    # Extract [[wikilinks]]
+    links = _WIKILINK_TARGET_RE.findall(content)
+
+    # Extract #tags (inline + frontmatter)
+    inline_tags = _TAG_RE.findall(content)
+    fm_tags = frontmatter.get("tags", [])
+    if isinstance(fm_tags, str):
+        fm_tags = [fm_tags]
+    all_tags = list(set(inline_tags + fm_tags))
+
+    # Strip markdown formatting for cleaner content
+    clean_content = VaultReader._strip_markdown(content)
+
+    return {
+        "title": title,
+        "frontmatter": frontmatter,
+        "content": clean_content[:MAX_CONTENT_LENGTH],
+        "links": links,
+        "tags": all_tags,
+        "path": filepath,
+        "content_hash": _content_hash(data),
+    }
+
+
 class VaultReader:
     """Read-only indexer for Obsidian vault notes."""
 
@@ -82,25 +211,12 @@ class VaultReader:
             logger.warning("Vault not found: %s", vault_dir)
             return []
 
-        results = []
-        for md_file in vault_dir.rglob("*.md"):
-            # Skip hidden/excluded directories
-            rel_parts = md_file.relative_to(vault_dir).parts
-            if any(part in SKIP_DIRS for part in rel_parts):
-                continue
-
-            stat = md_file.stat()
-
+        results = [
+            {"path": path, "title": name[:-3], "modified_time": st.st_mtime, "size": st.st_size}
+            for path, name, st in _walk_markdown(str(vault_dir))
             # Skip small files
-            if stat.st_size < MIN_FILE_SIZE:
-                continue
-
-            results.append({
-                "path": str(md_file),
-                "title": md_file.stem,
-                "modified_time": stat.st_mtime,
-                "size": stat.st_size,
-            })
+            if st.st_size >= MIN_FILE_SIZE
+        ]
 
         logger.info("Scanned vault '%s': %d indexable notes", vault_name, len(results))
         return results
@@ -112,53 +228,9 @@ class VaultReader:
     def parse_note(self, filepath: str) -> Dict:
         """Parse a markdown note into structured data.
 
-        Returns: {title, frontmatter, content, links, tags, path}
+        Returns: {title, frontmatter, content, links, tags, path, content_hash}
         """
-        path = Path(filepath)
-        title = path.stem
-
-        try:
-            raw = path.read_text(encoding="utf-8")
-        except Exception as e:
-            logger.warning("Failed to read %s: %s", filepath, e)
-            return {
-                "title": title,
-                "frontmatter": {},
-                "content": "",
-                "links": [],
-                "tags": [],
-                "path": filepath,
-            }
-
-        # Parse YAML frontmatter
-        frontmatter = {}
-        content = raw
-        fm_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", raw, re.DOTALL)
-        if fm_match:
-            frontmatter = self._parse_yaml_simple(fm_match.group(1))
-            content = raw[fm_match.end():]
-
-        # Extract [[wikilinks]]
-        links = re.findall(r"\[\[([^\]|]+?)(?:\|[^\]]+)?\]\]", content)
-
-        # Extract #tags (inline + frontmatter)
-        inline_tags = re.findall(r"(?:^|\s)#([a-zA-Z가-힣][\w가-힣/-]*)", content)
-        fm_tags = frontmatter.get("tags", [])
-        if isinstance(fm_tags, str):
-            fm_tags = [fm_tags]
-        all_tags = list(set(inline_tags + fm_tags))
-
-        # Strip markdown formatting for cleaner content
-        clean_content = self._strip_markdown(content)
-
-        return {
-            "title": title,
-            "frontmatter": frontmatter,
-            "content": clean_content[:MAX_CONTENT_LENGTH],
-            "links": links,
-            "tags": all_tags,
-            "path": filepath,
-        }
+        return _parse_note_file(filepath)
 
     @staticmethod
     def _parse_yaml_simple(yaml_text: str) -> Dict:
@@ -205,21 +277,9 @@ class VaultReader:
     @staticmethod
     def _strip_markdown(text: str) -> str:
         """Remove markdown formatting for cleaner embedding content."""
-        # Remove headings markers
-        text = re.sub(r"^#+\s+", "", text, flags=re.MULTILINE)
-        # Remove bold/italic
-        text = re.sub(r"\*{1,3}([^*]+)\*{1,3}", r"\1", text)
-        # Remove wikilinks, keep text
-        text = re.sub(r"\[\[([^\]|]+?)(?:\|([^\]]+))?\]\]", lambda m: m.group(2) or m.group(1), text)
-        # Remove regular links, keep text
-        text = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", text)
-        # Remove images
-        text = re.sub(r"!\[([^\]]*)\]\([^)]+\)", "", text)
-        # Remove HTML tags
-        text = re.sub(r"<[^>]+>", "", text)
-        # Collapse whitespace
-        text = re.sub(r"\n{3,}", "\n\n", text)
-        return text.strip()
+        text = _MD_RE.sub(_md_replacement, text)
+        # Collapse whitespace, including blank runs left by removed tags/images
+        return _WS_RE.sub("\n\n", text).strip()
 
     # ------------------------------------------------------------------
     # Category inference
@@ -289,41 +349,76 @@ class VaultReader:
 
         stats = {"total": len(notes), "new": 0, "updated": 0, "skipped": 0, "errors": 0}
 
-        for i, note_info in enumerate(notes):
-            filepath = note_info["path"]
-            modified = note_info["modified_time"]
+        # Already indexed and unchanged notes are skipped without reading them
+        def _unchanged(note_info: Dict) -> bool:
+            entry = index.get(note_info["path"])
+            return (
+                not force
+                and entry is not None
+                and note_info["modified_time"] <= entry.get("indexed_time", 0)
+            )
+
+        changed = [n for n in notes if not _unchanged(n)]
+        changed_paths = {n["path"] for n in changed}
+
+        # Read and parse changed notes on a pool, in order, while the loop
+        # below embeds and stores them one at a time. Large reindexes parse
+        # in worker processes, since the regex work holds the GIL. Workers are
+        # spawned, not forked: the bot is multi-threaded, and a fork could copy
+        # a lock another thread holds.
+        paths = [n["path"] for n in changed]
+        if PARSE_PROCESSES > 1 and len(paths) >= _PROCESS_PARSE_MIN_NOTES:
+            pool = ProcessPoolExecutor(
+                max_workers=PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+            parsed_notes = pool.map(_parse_note_file, paths, chunksize=32)
+        else:
+            pool = ThreadPoolExecutor(max_workers=max(1, READ_WORKERS))
+            parsed_notes = pool.map(self.parse_note, paths)
+
+        with pool:
+            for i, note_info in enumerate(notes):
+                filepath = note_info["path"]
 
-            # Progress callback
-            if progress_callback and (i % 10 == 0 or i == len(notes) - 1):
-                progress_callback(i + 1, len(notes))
+                # Progress callback
+                if progress_callback and (i % 10 == 0 or i == len(notes) - 1):
+                    progress_callback(i + 1, len(notes))
 
-            # Check if already indexed and unchanged
-            if not force and filepath in index:
-                last_indexed = index[filepath].get("indexed_time", 0)
-                if modified <= last_indexed:
+                # Check if already indexed and unchanged
+                if filepath not in changed_paths:
                     stats["skipped"] += 1
                     continue
 
-            # Parse and index
-            parsed = self.parse_note(filepath)
-            if not parsed["content"]:
-                stats["skipped"] += 1
-                continue
+                # Parse and index
+                parsed = next(parsed_notes)
+                if not parsed["content"]:
+                    stats["skipped"] += 1
+                    continue
 
-            row_id = self.index_note(parsed)
-            if row_id > 0:
-                if filepath in index:
-                    stats["updated"] += 1
-                else:
-                    stats["new"] += 1
+                # mtime moved but the bytes did not (touch, sync, copy back):
+                # keep the stored row instead of embedding the note again
+                entry = index.get(filepath)
+                if entry and entry.get("content_hash") == parsed["content_hash"]:
+                    entry["indexed_time"] = time.time()
+                    stats["skipped"] += 1
+                    continue
 
-                index[filepath] = {
-                    "indexed_time": time.time(),
-                    "title": parsed["title"],
-                    "knowledge_id": row_id,
-                }
-            else:
-                stats["errors"] += 1
+                row_id = self.index_note(parsed)
+                if row_id > 0:
+                    if filepath in index:
+                        stats["updated"] += 1
+                    else:
+                        stats["new"] += 1
+
+                    index[filepath] = {
+                        "indexed_time": time.time(),
+                        "content_hash": parsed["content_hash"],
+                        "size": note_info["size"],
+                        "title": parsed["title"],
+                        "knowledge_id": row_id,
+                    }
+                else:
+                    stats["errors"] += 1
 
         self._save_index(index)
         logger.info(
@@ -348,6 +443,7 @@ class VaultReader:
         query_vec = self.memory.embedder.embed(query)
 
         if query_vec is not None:
+            self.memory.flush()  # notes indexed moments ago are still being embedded
             return self._semantic_vault_search(query_vec, top_k)
         return self._keyword_vault_search(query, top_k)
 
@@ -9,10 +9,11 @@ Backend is selected by POLARIS_LLM_BACKEND env var (default: "ollama").
 Paid API calls require POLARIS_ALLOW_PAID_API=true.
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -84,6 +85,7 @@ class PolarisRouter:
         self.max_iterations = max_iterations
         self.backend = backend or os.getenv("POLARIS_LLM_BACKEND", "ollama")
         self.allow_paid = os.getenv("POLARIS_ALLOW_PAID_API", "false").lower() == "true"
+        self.async_client = None
 
         if self.backend == "anthropic":
             self.model = model or ANTHROPIC_MODEL
@@ -118,17 +120,22 @@ class PolarisRouter:
 
     def _init_ollama(self):
         """Initialise the Ollama (OpenAI-compatible) client."""
-        from openai import OpenAI
+        from openai import AsyncOpenAI, OpenAI
         self.client = OpenAI(
             base_url=OLLAMA_BASE_URL,
             api_key="ollama",
         )
+        self.async_client = AsyncOpenAI(
+            base_url=OLLAMA_BASE_URL,
+            api_key="ollama",
+        )
         logger.info("Using Ollama backend (%s) at %s", self.model, OLLAMA_BASE_URL)
 
     def _init_anthropic(self):
         """Initialise the Anthropic client (paid, requires opt-in)."""
         import anthropic
         self.client = anthropic.Anthropic()
+        self.async_client = anthropic.AsyncAnthropic()
         logger.info("Using Anthropic backend (%s)", self.model)
 
     # ------------------------------------------------------------------
@@ -335,17 +342,17 @@ class PolarisRouter:
             "preflight_tools": preflight_tools,
         }
 
-    def _execute_preflight_tools(self, tool_names: list[str]) -> list[dict]:
+    async def _execute_preflight_tools(self, tool_names: list[str]) -> list[dict]:
         """Execute zero-argument tools before the main LLM turn."""
-        results = []
-        for name in tool_names:
-            result_text = self._execute_tool(name, {})
-            results.append({
+        outputs = await self._execute_tools([(name, {}) for name in tool_names])
+        return [
+            {
                 "name": name,
                 "content": result_text,
                 "ok": not self._looks_like_tool_error(result_text),
-            })
-        return results
+            }
+            for name, result_text in zip(tool_names, outputs)
+        ]
 
     def _looks_like_tool_error(self, result_text: str) -> bool:
         """Best-effort check for tool failure payloads."""
@@ -363,15 +370,47 @@ class PolarisRouter:
         message: str,
         conversation_history: Optional[list] = None,
         session_id: str = "",
+    ) -> dict:
+        """Synchronous variant of :meth:`aroute` for legacy callers.
+
+        Runs the ReAct loop on a private event loop, so it must not be
+        called from inside a running loop (use ``await aroute(...)``).
+        """
+        blocked = self._paid_api_blocked()
+        if blocked:
+            return blocked
+
+        if self.backend == "anthropic":
+            result = self._route_anthropic(message, conversation_history, session_id)
+        else:
+            result = self._route_ollama(message, conversation_history, session_id)
+
+        self._after_route(message, conversation_history, session_id, result)
+        return result
+
+    async def aroute(
+        self,
+        message: str,
+        conversation_history: Optional[list] = None,
+        session_id: str = "",
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> dict:
         """
         Route a user message through the ReAct loop.
 
+        LLM calls go through the backend's native async client and tool
+        calls run in worker threads, so many conversations can share one
+        event loop without pinning a thread for the whole loop.
+
         Args:
             message: The user's message.
             conversation_history: Prior messages as
                 [{"role": "user"|"assistant", "content": "..."}].
             session_id: Optional session identifier for memory persistence.
+            on_delta: Optional coroutine called with each text fragment of a
+                streamed final answer. Only tool-free Ollama turns stream;
+                otherwise it is never called and the full response is
+                returned as usual.
 
         Returns:
             {"response": str, "tools_used": list[str]}
@@ -379,24 +418,70 @@ class PolarisRouter:
         # NOTE: Memory save is deferred to AFTER the LLM response.
         # This prevents model swapping (nomic-embed-text ↔ llama70b)
         # which was causing ~60s load time per message on 42GB model.
-
-        # Store session_id for _build_system_prompt to read recent conversations
-        self._current_session_id = session_id
+        blocked = self._paid_api_blocked()
+        if blocked:
+            return blocked
 
         if self.backend == "anthropic":
-            if not self.allow_paid:
-                return {
-                    "response": (
-                        "This request requires a paid API (Anthropic). "
-                        "Set POLARIS_ALLOW_PAID_API=true to enable, "
-                        "or use the default Ollama backend."
-                    ),
-                    "tools_used": [],
-                }
-            result = self._route_anthropic(message, conversation_history)
+            result = await self._aroute_anthropic(
+                message, conversation_history, session_id, use_async_client=True,
+            )
         else:
-            result = self._route_ollama(message, conversation_history)
+            result = await self._aroute_ollama(
+                message, conversation_history, session_id,
+                use_async_client=True, on_delta=on_delta,
+            )
 
+        await asyncio.to_thread(
+            self._after_route, message, conversation_history, session_id, result
+        )
+        return result
+
+    def _paid_api_blocked(self) -> Optional[dict]:
+        """Return the refusal payload when the paid backend is not opted in."""
+        if self.backend == "anthropic" and not self.allow_paid:
+            return {
+                "response": (
+                    "This request requires a paid API (Anthropic). "
+                    "Set POLARIS_ALLOW_PAID_API=true to enable, "
+                    "or use the default Ollama backend."
+                ),
+                "tools_used": [],
+            }
+        return None
+
+    async def awarmup(self):
+        """Prime prompt-building caches and the local model before the first user.
+
+        Builds one system prompt (skills, memory DB, vault embedder) and, on
+        the Ollama backend, requests a one-token completion so the model is
+        loaded. The paid Anthropic backend is never called here.
+        """
+        try:
+            await asyncio.to_thread(self._build_system_prompt, "ping", False, "_warmup")
+        except Exception as e:
+            logger.debug("Prompt warm-up skipped: %s", e)
+
+        if self.backend == "anthropic" or self.async_client is None:
+            return
+        try:
+            await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1,
+            )
+            logger.info("Warmed up %s", self.model)
+        except Exception as e:
+            logger.warning("Model warm-up failed: %s", e)
+
+    def _after_route(
+        self,
+        message: str,
+        conversation_history: Optional[list],
+        session_id: str,
+        result: dict,
+    ) -> None:
+        """Persist corrections, conversation turns and facts for a finished route."""
         # Detect and save corrections (before memory save, after LLM response)
         if self.feedback_manager and session_id:
             try:
@@ -445,13 +530,16 @@ class PolarisRouter:
             except Exception as e:
                 logger.debug("Fact extraction failed: %s", e)
 
-        return result
-
     # ------------------------------------------------------------------
     # Ollama (OpenAI-compatible) backend
     # ------------------------------------------------------------------
 
-    def _build_system_prompt(self, message: str, has_tools: bool = False) -> str:
+    def _build_system_prompt(
+        self,
+        message: str,
+        has_tools: bool = False,
+        session_id: str = "",
+    ) -> str:
         """Build system prompt with persona + skills + tool examples + recent context.
 
         Layers:
@@ -502,7 +590,7 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
             # Inject recent conversation history (DB read, no embedding)
             try:
                 recent = self.memory.get_recent_conversations(
-                    session_id=getattr(self, '_current_session_id', ''),
+                    session_id=session_id,
                     limit=5,
                 )
                 if recent:
@@ -546,9 +634,21 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
         self,
         message: str,
         conversation_history: Optional[list] = None,
+        session_id: str = "",
+    ) -> dict:
+        """Blocking ReAct loop using the OpenAI-compatible API (Ollama)."""
+        return asyncio.run(self._aroute_ollama(message, conversation_history, session_id))
+
+    async def _aroute_ollama(
+        self,
+        message: str,
+        conversation_history: Optional[list] = None,
+        session_id: str = "",
+        use_async_client: bool = False,
+        on_delta: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> dict:
         """ReAct loop using the OpenAI-compatible API (Ollama)."""
-        from openai import OpenAI, APIError, AuthenticationError
+        from openai import APIError, AuthenticationError
 
         tools_used: list[str] = []
         successful_tools: list[str] = []
@@ -571,7 +671,9 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
 
         openai_tools = _convert_tools_to_openai_format(relevant_tools) if relevant_tools else None
 
-        system_prompt = self._build_system_prompt(message, has_tools=bool(relevant_tools))
+        system_prompt = await asyncio.to_thread(
+            self._build_system_prompt, message, bool(relevant_tools), session_id
+        )
         if enforcement["requires_tool"]:
             chain = ", ".join(enforcement["chain_tools"])
             system_prompt += (
@@ -583,7 +685,7 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
                 "필수 인자가 부족하면 임의로 채우지 말고 사용자에게 추가 정보를 요청해."
             )
 
-        preflight_results = self._execute_preflight_tools(enforcement["preflight_tools"])
+        preflight_results = await self._execute_preflight_tools(enforcement["preflight_tools"])
         if preflight_results:
             prompt_lines = ["[PREFLIGHT TOOL RESULTS]"]
             for item in preflight_results:
@@ -602,6 +704,11 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
         active_model = self.model_full if relevant_tools else self.model_fast
         logger.info("Using model: %s (tools=%d)", active_model, len(relevant_tools))
 
+        # Without tools the first answer is final, so it can be streamed.
+        stream = bool(
+            on_delta and not openai_tools and use_async_client and self.async_client is not None
+        )
+
         for iteration in range(self.max_iterations):
             logger.debug("ReAct iteration %d/%d (ollama)", iteration + 1, self.max_iterations)
 
@@ -614,7 +721,23 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
                 if openai_tools:
                     kwargs["tools"] = openai_tools
 
-                response = self.client.chat.completions.create(**kwargs)
+                if stream:
+                    parts: list[str] = []
+                    chunks = await self.async_client.chat.completions.create(
+                        stream=True, **kwargs
+                    )
+                    async for chunk in chunks:
+                        delta = chunk.choices[0].delta.content if chunk.choices else None
+                        if delta:
+                            parts.append(delta)
+                            await on_delta(delta)
+                    return {"response": "".join(parts), "tools_used": tools_used}
+                if use_async_client and self.async_client is not None:
+                    response = await self.async_client.chat.completions.create(**kwargs)
+                else:
+                    response = await asyncio.to_thread(
+                        self.client.chat.completions.create, **kwargs
+                    )
             except AuthenticationError:
                 logger.error("OpenAI-compatible auth failed")
                 return {
@@ -637,17 +760,19 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
                 # Append assistant message with tool calls
                 messages.append(choice.message)
 
+                calls = []
                 for tool_call in choice.message.tool_calls:
-                    tool_name = tool_call.function.name
                     try:
                         tool_args = json.loads(tool_call.function.arguments)
                     except (json.JSONDecodeError, TypeError):
                         tool_args = {}
+                    calls.append((tool_call.function.name, tool_args))
 
-                    logger.info("Tool call: %s(%s)", tool_name, tool_args)
+                results = await self._execute_tools(calls)
+                for tool_call, (tool_name, _), result_text in zip(
+                    choice.message.tool_calls, calls, results
+                ):
                     tools_used.append(tool_name)
-
-                    result_text = self._execute_tool(tool_name, tool_args)
                     if not self._looks_like_tool_error(result_text):
                         successful_tools.append(tool_name)
 
@@ -685,6 +810,17 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
         self,
         message: str,
         conversation_history: Optional[list] = None,
+        session_id: str = "",
+    ) -> dict:
+        """Blocking ReAct loop using the native Anthropic API."""
+        return asyncio.run(self._aroute_anthropic(message, conversation_history, session_id))
+
+    async def _aroute_anthropic(
+        self,
+        message: str,
+        conversation_history: Optional[list] = None,
+        session_id: str = "",
+        use_async_client: bool = False,
     ) -> dict:
         """ReAct loop using the native Anthropic API."""
         import anthropic
@@ -696,10 +832,13 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
 
         relevant_tools = self._select_relevant_tools(message)
 
+        system_prompt = await asyncio.to_thread(
+            self._build_system_prompt, message, bool(relevant_tools), session_id
+        )
         api_kwargs = {
             "model": self.model,
             "max_tokens": 4096,
-            "system": self._build_system_prompt(message, has_tools=bool(relevant_tools)),
+            "system": system_prompt,
         }
         if relevant_tools:
             api_kwargs["tools"] = relevant_tools
@@ -708,10 +847,17 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
             logger.debug("ReAct iteration %d/%d (anthropic)", iteration + 1, self.max_iterations)
 
             try:
-                response = self.client.messages.create(
-                    messages=messages,
-                    **api_kwargs,
-                )
+                if use_async_client and self.async_client is not None:
+                    response = await self.async_client.messages.create(
+                        messages=messages,
+                        **api_kwargs,
+                    )
+                else:
+                    response = await asyncio.to_thread(
+                        self.client.messages.create,
+                        messages=messages,
+                        **api_kwargs,
+                    )
             except anthropic.AuthenticationError:
                 logger.error("Anthropic authentication failed — check ANTHROPIC_API_KEY")
                 return {
@@ -728,23 +874,16 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
             if response.stop_reason == "tool_use":
                 messages.append({"role": "assistant", "content": response.content})
 
+                blocks = [block for block in response.content if block.type == "tool_use"]
+                results = await self._execute_tools(
+                    [(block.name, block.input) for block in blocks]
+                )
                 tool_results = []
-                for block in response.content:
-                    if block.type != "tool_use":
-                        continue
-
-                    tool_name = block.name
-                    tool_input = block.input
-                    tool_use_id = block.id
-
-                    logger.info("Tool call: %s(%s)", tool_name, tool_input)
-                    tools_used.append(tool_name)
-
-                    result_text = self._execute_tool(tool_name, tool_input)
-
+                for block, result_text in zip(blocks, results):
+                    tools_used.append(block.name)
                     tool_results.append({
                         "type": "tool_result",
-                        "tool_use_id": tool_use_id,
+                        "tool_use_id": block.id,
                         "content": result_text,
                     })
 
@@ -773,6 +912,19 @@ User: "안녕? 잘 지내?" -> No tool needed, respond directly."""
     # Tool execution
     # ------------------------------------------------------------------
 
+    async def _execute_tools(self, calls: list[tuple[str, dict]]) -> list[str]:
+        """Run the tool calls of one LLM turn concurrently.
+
+        Calls emitted in the same turn cannot depend on each other's
+        output, so the turn costs max(T_i) instead of sum(T_i). Results
+        come back in call order.
+        """
+        for name, args in calls:
+            logger.info("Tool call: %s(%s)", name, args)
+        return await asyncio.gather(*(
+            asyncio.to_thread(self._execute_tool, name, args) for name, args in calls
+        ))
+
     def _execute_tool(self, name: str, args: dict) -> str:
         """Execute a tool by name and return its result as a string.
 
@@ -1,3 +1,6 @@
+from .conversation_cache import ConversationCache
 from .hot_reload import HotReloader
+from .streaming_reply import StreamingReply, markdown_balanced
+from .trace_batcher import TraceBatcher
 
-__all__ = ["HotReloader"]
+__all__ = ["ConversationCache", "HotReloader", "StreamingReply", "TraceBatcher", "markdown_balanced"]
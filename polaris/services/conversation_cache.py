@@ -0,0 +1,58 @@
+"""Per-user conversation history with LRU and idle-time eviction."""
+
+import time
+from collections import OrderedDict, deque
+from typing import Optional
+
+# Messages kept per user, users kept before the least recent is evicted, and
+# seconds of inactivity after which a user's history is dropped.
+HISTORY_MAXLEN = 20
+MAX_CONVERSATIONS = 10_000
+CONVERSATION_TTL = 24 * 3600
+
+
+class ConversationCache:
+    """Per-user message history bounded by user count (LRU) and idle time (TTL).
+
+    Entries are kept in last-active order, so expired users are always at
+    the front and are dropped lazily on access.
+    """
+
+    def __init__(self, maxsize: int = MAX_CONVERSATIONS, ttl: float = CONVERSATION_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, tuple[float, deque]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._entries)
+
+    def _expire(self, now: float):
+        while self._entries:
+            last_seen, _ = next(iter(self._entries.values()))
+            if now - last_seen < self.ttl:
+                break
+            self._entries.popitem(last=False)
+
+    def get(self, user_id: int, default=None):
+        """Return the user's history without marking them active."""
+        self._expire(time.monotonic())
+        entry = self._entries.get(user_id)
+        return entry[1] if entry is not None else default
+
+    def touch(self, user_id: int, history: Optional[deque] = None) -> deque:
+        """Mark the user active and return their history, creating it if needed.
+
+        ``history`` is re-inserted if the user was evicted while it was in use.
+        """
+        now = time.monotonic()
+        self._expire(now)
+        entry = self._entries.pop(user_id, None)
+        if entry is not None:
+            history = entry[1]
+        elif history is None:
+            history = deque(maxlen=HISTORY_MAXLEN)
+        self._entries[user_id] = (now, history)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return history
@@ -2,13 +2,32 @@
 
 import os
 import sys
+import asyncio
 import logging
 import time
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional
+
+try:
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - optional dependency
+    awatch = None
 
 logger = logging.getLogger(__name__)
 
+# Legacy top-level modules whose edits count as code changes.
+_LEGACY_MODULES = (
+    "mail_reader.py",
+    "email_analyzer.py",
+    "schedule_agent.py",
+    "hpc_monitor.py",
+    "physics_agent.py",
+    "phd_agent.py",
+    "paper_workflow.py",
+    "analyze_paper_v2.py",
+)
+_RUNTIME_SUFFIXES = {".md", ".json", ".yaml", ".yml"}
+
 
 class HotReloader:
     """File-change watcher and runtime component reloader."""
@@ -41,20 +60,27 @@ class HotReloader:
             yield from self.watch_root.glob(pattern)
 
         # Code files (optional auto-restart path)
-        code_patterns = [
-            "polaris/**/*.py",
-            "mail_reader.py",
-            "email_analyzer.py",
-            "schedule_agent.py",
-            "hpc_monitor.py",
-            "physics_agent.py",
-            "phd_agent.py",
-            "paper_workflow.py",
-            "analyze_paper_v2.py",
-        ]
+        code_patterns = ["polaris/**/*.py", *_LEGACY_MODULES]
         for pattern in code_patterns:
             yield from self.watch_root.glob(pattern)
 
+    def is_watched(self, path: Path) -> bool:
+        """Return True if ``path`` is one of the files ``_iter_watch_files`` covers."""
+        try:
+            rel = Path(path).resolve().relative_to(self.watch_root.resolve())
+        except ValueError:
+            return False
+        parts = rel.parts
+        if not parts:
+            return False
+        if parts[0] == "skills":
+            return rel.suffix == ".md"
+        if parts[0] == "polaris":
+            return rel.suffix == ".py"
+        return rel.as_posix() == "data/master_prompt.md" or (
+            len(parts) == 1 and parts[0] in _LEGACY_MODULES
+        )
+
     def refresh_snapshot(self):
         """Capture latest file mtimes for watched files."""
         snapshot: Dict[str, float] = {}
@@ -101,10 +127,45 @@ class HotReloader:
         self._last_check = now
 
         changed = self._detect_changed_files()
-        if not changed:
+        if changed:
+            self.apply_changes(changed)
+
+    async def watch(self, stop_event: Optional[asyncio.Event] = None):
+        """Apply changes as they happen until ``stop_event`` is set.
+
+        Uses kernel file events through ``watchfiles`` when it is installed,
+        otherwise polls every ``check_interval`` seconds in a worker thread.
+        """
+        if not self.auto_reload:
+            return
+        stop_event = stop_event or asyncio.Event()
+
+        if awatch is not None:
+            async for changes in awatch(
+                self.watch_root,
+                watch_filter=lambda _change, path: self.is_watched(Path(path)),
+                stop_event=stop_event,
+            ):
+                changed = sorted({Path(path) for _change, path in changes if Path(path).is_file()})
+                if changed:
+                    await asyncio.to_thread(self.apply_changes, changed)
             return
 
-        runtime_changed = [p for p in changed if p.suffix.lower() in {".md", ".json", ".yaml", ".yml"}]
+        while not stop_event.is_set():
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                break
+            changed = await asyncio.to_thread(self._detect_changed_files)
+            if changed:
+                await asyncio.to_thread(self.apply_changes, changed)
+
+    def apply_changes(self, changed: Iterable[Path]):
+        """Reload runtime data and handle code edits for the given changed files."""
+        changed = list(changed)
+        runtime_changed = [p for p in changed if p.suffix.lower() in _RUNTIME_SUFFIXES]
         code_changed = [p for p in changed if p.suffix.lower() == ".py"]
 
         if runtime_changed:
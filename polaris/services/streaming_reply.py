@@ -0,0 +1,78 @@
+"""Telegram reply that is edited in place as router text deltas arrive."""
+
+import logging
+import re
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between edits of a streaming reply (Telegram rate-limits edits).
+STREAM_EDIT_INTERVAL = 0.5
+
+# Code spans and backslash escapes, which legacy Markdown leaves unparsed.
+_MD_LITERAL = re.compile(r"```.*?```|`[^`\n]*`|\\.", re.DOTALL)
+
+
+def markdown_balanced(text: str) -> bool:
+    """Cheap local check that Telegram (legacy) Markdown entities are paired.
+
+    Text that fails is sent as plain text straight away instead of paying a
+    round-trip for Telegram to reject it.
+    """
+    rest = _MD_LITERAL.sub("", text)
+    return (
+        "`" not in rest
+        and rest.count("*") % 2 == 0
+        and rest.count("_") % 2 == 0
+        and rest.count("[") == rest.count("]")
+    )
+
+
+class StreamingReply:
+    """Reply message that is edited in place as router text deltas arrive."""
+
+    def __init__(self, source, interval: float = STREAM_EDIT_INTERVAL):
+        self._source = source
+        self._interval = interval
+        self._parts: list[str] = []
+        self._sent_text = ""
+        self._last_edit = 0.0
+        self._failed = False
+        self.message = None
+
+    async def feed(self, delta: str):
+        """Router ``on_delta`` callback: append a fragment and maybe flush it."""
+        self._parts.append(delta)
+        if self._failed:
+            return
+        now = time.monotonic()
+        if self.message is None:
+            text = "".join(self._parts)
+            try:
+                self.message = await self._source.reply_text(text)
+            except Exception as e:
+                logger.warning("Streaming reply disabled: %s", e)
+                self._failed = True
+                return
+            self._sent_text = text
+            self._last_edit = now
+        elif now - self._last_edit >= self._interval:
+            self._last_edit = now
+            await self._edit("".join(self._parts))
+
+    async def _edit(self, text: str, parse_mode: Optional[str] = None) -> bool:
+        if parse_mode is None and text == self._sent_text:
+            return True
+        try:
+            await self.message.edit_text(text, parse_mode=parse_mode)
+        except Exception as e:
+            logger.debug("Streaming edit failed: %s", e)
+            return False
+        self._sent_text = text
+        return True
+
+    async def finish(self, text: str):
+        """Replace the streamed text with the final response (Markdown if it parses)."""
+        if not markdown_balanced(text) or not await self._edit(text, parse_mode="Markdown"):
+            await self._edit(text)
@@ -0,0 +1,88 @@
+"""Batched, off-loop writer for TraceLogger records."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from polaris.timestamps import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Trace records are written in batches of up to TRACE_BATCH_MAX, at most
+# TRACE_FLUSH_DELAY seconds after the first record of a batch was queued.
+TRACE_BATCH_MAX = 64
+TRACE_FLUSH_DELAY = 0.25
+
+
+class TraceBatcher:
+    """Queues trace records from handlers and writes them in batches.
+
+    Args:
+        trace_logger: TraceLogger whose ``log_many`` receives each batch.
+        run_io: Coroutine function that runs a blocking call off the event
+            loop; defaults to ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        trace_logger,
+        run_io: Optional[Callable[..., Awaitable[Any]]] = None,
+        batch_max: int = TRACE_BATCH_MAX,
+        flush_delay: float = TRACE_FLUSH_DELAY,
+    ):
+        self.trace_logger = trace_logger
+        self._run_io = run_io or asyncio.to_thread
+        self.batch_max = batch_max
+        self.flush_delay = flush_delay
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def queue(self, **entry):
+        """Queue a trace record (``TraceLogger.log`` keywords) for the flusher.
+
+        Written immediately when the flusher is not running.
+        """
+        entry.setdefault("timestamp", utc_now())
+        if self._task is None:
+            self.trace_logger.log_many([entry])
+            return
+        self._queue.put_nowait(entry)
+
+    def start(self):
+        """Start the background writer on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Flush queued records and stop the writer."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def _flush_loop(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            entry = await self._queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            deadline = loop.time() + self.flush_delay
+            while len(batch) < self.batch_max:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+            try:
+                await self._run_io(self.trace_logger.log_many, batch)
+            except Exception as e:
+                logger.warning("Failed to write %d trace records: %s", len(batch), e)
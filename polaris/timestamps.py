@@ -0,0 +1,17 @@
+"""
+Row timestamps shared by the memory and trace databases.
+"""
+
+import time
+
+
+def utc_now() -> str:
+    """ISO-8601 UTC timestamp in the naive form utcnow().isoformat() wrote.
+
+    Formatted from time.time() with time.strftime, which is cheaper per row
+    than building a datetime. Stored timestamps are compared as strings
+    (e.g. ``BETWEEN``), so every writer must use this one format.
+    """
+    now = time.time()
+    seconds = int(now)
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds)) + f".{int((now - seconds) * 1e6):06d}"
@@ -4,8 +4,14 @@ HPC Tools - Anthropic tool wrappers for hpc_monitor.py and physics_agent.py
 
 import sys
 import json
+import threading
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 # Add project root to path for imports
 _PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
 if _PROJECT_ROOT not in sys.path:
@@ -16,6 +22,12 @@ _PhysicsMonitor = None
 _PhysicsAgent = None
 _import_error = None
 
+# Long-lived monitor instances (reused across tool calls), one per HPC
+# profile so a call for one cluster never retargets another call's monitor.
+# Key None is the default profile (HPC_ACTIVE_PROFILE).
+_monitors = {}
+_monitors_lock = threading.Lock()
+
 try:
     from hpc_monitor import PhysicsMonitor
     _PhysicsMonitor = PhysicsMonitor
@@ -87,14 +99,48 @@ TOOLS = [
 # Handler functions
 # ---------------------------------------------------------------------------
 
+def _dumps(obj) -> str:
+    """Serialize a monitor result (orjson when available, stdlib json otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode("utf-8")
+    return json.dumps(obj, default=str)
+
+
+def _get_monitor(cluster: str = ""):
+    """Return the process-wide PhysicsMonitor for *cluster*, creating it on first use.
+
+    Construction resolves the HPC username (ssh -G / whoami) and sets up
+    logging, so it is done once per profile instead of per tool call.
+    An empty *cluster* means the default profile.
+    """
+    key = cluster or None
+    with _monitors_lock:
+        monitor = _monitors.get(key)
+        if monitor is None:
+            monitor = _PhysicsMonitor()
+            if key is not None:
+                monitor.set_profile(key)  # raises ValueError for unknown profiles
+            _monitors[key] = monitor
+    return monitor
+
+
+def close_monitors() -> None:
+    """Close every cached PhysicsMonitor's SSH master connection and forget it."""
+    with _monitors_lock:
+        monitors = list(_monitors.values())
+        _monitors.clear()
+    for monitor in monitors:
+        monitor.close()
+
+
 def handle_monitor_hpc_job(job_id: str, path: str, cluster: str = "") -> str:
     """Monitor a VASP job on Polaris."""
     if _PhysicsMonitor is None:
         return json.dumps({"error": f"PhysicsMonitor unavailable: {_import_error}"})
     try:
-        monitor = _PhysicsMonitor()
-        result = monitor.monitor_job(job_id, path, cluster=cluster or None)
-        return json.dumps(result, default=str)
+        monitor = _get_monitor(cluster)
+        result = monitor.monitor_job(job_id, path)
+        return _dumps(result)
     except Exception as e:
         return json.dumps({"error": str(e)})
 
@@ -104,7 +150,7 @@ def handle_check_hpc_connection() -> str:
     if _PhysicsMonitor is None:
         return json.dumps({"error": f"PhysicsMonitor unavailable: {_import_error}"})
     try:
-        monitor = _PhysicsMonitor()
+        monitor = _get_monitor()
         alive = monitor.zombie_guard()
         return json.dumps({"alive": alive, "message": "Connection alive" if alive else "Connection failed or timed out"})
     except Exception as e:
@@ -5,10 +5,11 @@ Polaris Trace Logger — SQLite-based audit trail for all agent actions.
 import sqlite3
 import json
 import os
-from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from polaris.timestamps import utc_now
+
 
 class TraceLogger:
     """Records every tool invocation, approval decision, and result to SQLite."""
@@ -59,7 +60,7 @@ class TraceLogger:
             """INSERT INTO traces (timestamp, thought, tool, args, result, approval_level, approved_by, session_id)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
             (
-                datetime.utcnow().isoformat(),
+                utc_now(),
                 thought,
                 tool,
                 json.dumps(args, ensure_ascii=False),
@@ -71,6 +72,34 @@ class TraceLogger:
         )
         self.conn.commit()
 
+    def log_many(self, entries: List[Dict]):
+        """Insert several trace records in one transaction.
+
+        Each entry takes the keyword arguments of :meth:`log`, plus an
+        optional ``timestamp`` (ISO string) for records queued earlier.
+        """
+        if not entries:
+            return
+        rows = [
+            (
+                e.get("timestamp") or utc_now(),
+                e.get("thought", ""),
+                e.get("tool", ""),
+                json.dumps(e.get("args", {}), ensure_ascii=False),
+                e.get("result", ""),
+                e.get("approval_level", ""),
+                e.get("approved_by", ""),
+                e.get("session_id", ""),
+            )
+            for e in entries
+        ]
+        with self.conn:
+            self.conn.executemany(
+                """INSERT INTO traces (timestamp, thought, tool, args, result, approval_level, approved_by, session_id)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+
     def by_session(self, session_id: str, limit: int = 50) -> List[Dict]:
         """Return trace records for a given session."""
         cursor = self.conn.execute(
@@ -70,6 +70,18 @@ class TestAutoLevel:
         assert result["approved"] is True
         assert "test" in result["result"]
 
+    @pytest.mark.asyncio
+    async def test_auto_with_sync_wrapper_returning_coroutine(self, gate, async_executor):
+        def wrapper(**kwargs):
+            return async_executor(**kwargs)
+
+        result = await gate.execute_with_approval(
+            tool_name="arxiv_search",
+            tool_args={"query": "test"},
+            execute_fn=wrapper,
+        )
+        assert result["result"] == "async executed with {'query': 'test'}"
+
 
 class TestConfirmLevel:
     @pytest.mark.asyncio
@@ -176,6 +188,34 @@ class TestTimeout:
         assert result["approved"] is False
         assert result["result"] is None
 
+    @pytest.mark.asyncio
+    async def test_real_timeout_denies_and_notifies(self, gate, mock_bot, sync_executor):
+        with patch.dict("polaris.approval_gate._TIMEOUTS", {RiskLevel.CONFIRM: 0.01}):
+            result = await gate.execute_with_approval(
+                tool_name="analyze_emails",
+                tool_args={"emails": []},
+                execute_fn=sync_executor,
+                bot=mock_bot,
+                chat_id=12345,
+            )
+        assert result["approved"] is False
+        assert gate._pending == {}
+        assert "timed out" in mock_bot.send_message.call_args.kwargs["text"]
+
+
+    @pytest.mark.asyncio
+    async def test_send_failure_releases_pending(self, gate, mock_bot, sync_executor):
+        mock_bot.send_message.side_effect = RuntimeError("telegram down")
+        with pytest.raises(RuntimeError):
+            await gate.execute_with_approval(
+                tool_name="analyze_emails",
+                tool_args={"emails": []},
+                execute_fn=sync_executor,
+                bot=mock_bot,
+                chat_id=12345,
+            )
+        assert gate._pending == {}
+
 
 class TestUnknownTool:
     @pytest.mark.asyncio
@@ -239,3 +279,20 @@ class TestCallbackHandling:
 
         await gate.handle_callback(callback_query)
         callback_query.answer.assert_called_with("This request has expired.")
+
+
+class TestFormatArgs:
+    def test_short_args_unchanged(self):
+        from polaris.approval_gate import _format_args
+        assert _format_args({"query": "MoS2", "max_results": 5}) == "query='MoS2', max_results=5"
+
+    def test_long_args_truncated(self):
+        from polaris.approval_gate import _format_args
+        text = _format_args({f"k{i}": "x" * 60 for i in range(20)}, max_len=200)
+        assert len(text) == 203
+        assert text.endswith("...")
+
+    def test_huge_value_repr_is_bounded(self):
+        from polaris.approval_gate import _format_args
+        text = _format_args({"blob": "x" * 1_000_000})
+        assert len(text) < 200
@@ -0,0 +1,38 @@
+"""Tests for polaris.services.conversation_cache.ConversationCache."""
+
+from unittest.mock import patch
+
+from polaris.services import conversation_cache
+from polaris.services.conversation_cache import ConversationCache
+
+
+class TestConversationCache:
+    def test_touch_creates_bounded_history(self):
+        cache = ConversationCache()
+        history = cache.touch(1)
+        assert history.maxlen == conversation_cache.HISTORY_MAXLEN
+        assert cache.touch(1) is history
+
+    def test_evicts_least_recently_active_user(self):
+        cache = ConversationCache(maxsize=2)
+        cache.touch(1)
+        cache.touch(2)
+        cache.touch(1)
+        cache.touch(3)
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert len(cache) == 2
+
+    def test_idle_users_expire(self):
+        cache = ConversationCache(ttl=10)
+        with patch.object(conversation_cache.time, "monotonic", return_value=100.0):
+            cache.touch(1)
+        with patch.object(conversation_cache.time, "monotonic", return_value=111.0):
+            assert cache.get(1, ()) == ()
+            assert len(cache) == 0
+
+    def test_touch_reinserts_evicted_history(self):
+        cache = ConversationCache(maxsize=1)
+        history = cache.touch(1)
+        cache.touch(2)
+        assert cache.touch(1, history) is history
@@ -99,6 +99,13 @@ class TestShouldExtract:
     def test_none_rejected(self):
         assert FactExtractor.should_extract(None) is False
 
+    def test_long_skip_phrases_rejected(self):
+        for text in ["ㅋㅋㅋㅋㅋㅋㅋㅋㅋㅋ", "  Good   Night!!! ", "Thank you!! ..", "잘    자!!!!!!"]:
+            assert FactExtractor.should_extract(text) is False
+
+    def test_mixed_jamo_accepted(self):
+        assert FactExtractor.should_extract("ㅋㅋㅋㅋㅋㅎㅎㅎㅎㅎ") is True
+
     def test_meaningful_message_accepted(self):
         assert FactExtractor.should_extract("나 ONETEP도 쓰게 됐어") is True
 
@@ -119,6 +126,17 @@ class TestExtractFacts:
         assert facts[0]["category"] == "research"
         assert "ONETEP" in facts[0]["title"]
 
+    def test_repeated_message_served_from_cache(self, extractor):
+        from polaris.memory.fact_extractor import _match_facts
+
+        first = extractor.extract_facts("나 Rust 시작했어 (cache test)")
+        hits = _match_facts.cache_info().hits
+        first[0]["title"] = "mutated"
+        second = extractor.extract_facts("나 Rust 시작했어 (cache test)")
+
+        assert _match_facts.cache_info().hits == hits + 1
+        assert "Rust" in second[0]["title"]
+
     def test_started_learning(self, extractor):
         facts = extractor.extract_facts("나 Julia 배우고 있어")
         assert len(facts) >= 1
@@ -206,6 +224,42 @@ class TestExtractFacts:
         # No exact duplicate titles
         assert len(titles) == len(set(titles))
 
+    def test_fused_gate_agrees_with_patterns(self):
+        from polaris.memory.fact_extractor import FACT_PATTERNS, _ANY_FACT
+
+        for text in ["나 ONETEP도 쓰게 됐어", "안녕? 오늘 뭐 했어?", "MoS2 밴드갭이 얼마야?",
+                     "타이어 교체했어", "band gap은 1.2 eV", "오늘 날씨 좋다"]:
+            expected = any(p.search(text) for p, _, _ in FACT_PATTERNS)
+            assert (_ANY_FACT.search(text) is not None) == expected
+
+    def test_anchors_cover_every_pattern(self):
+        from polaris.memory.fact_extractor import FACT_PATTERNS, _ANCHORS
+
+        samples = [
+            "나 ONETEP도 쓰게 됐어", "나 Julia 배우고 있어", "나 vim 쓰기 시작", "나 Zotero 써보고 있어", "나 Rust도 써",
+            "나 Zig 시작했어", "Quantum ESPRESSO 설치했어", "conda 깔았어", "서버 셋업했어",
+            "Applied Materials 합격했어", "Google 인턴십에 불합격했어", "시험 붙었어", "면접 떨어졌어", "심사 통과했어",
+            "나 맥북 프로 샀어", "나 폰 바꿨어", "나 키보드 질렀어", "시루가 4.5kg이야", "설기 밥 먹었어",
+            "이번 학기 양자역학 TA", "다음학기 휴학", "연구에서 새로운 상전이를 발견했어", "VASP 결과 수렴했어",
+            "dft에서 오류", "Band Gap은 1.8eV야", "인턴십 시작했어", "인턴 끝났어", "회사 옮겼어",
+            "70,000 KM 교체했어", "3000 Mile 체크", "타이어 교체했어", "이사 가", "병원 다녀왔어",
+        ]
+        matched = set()
+        for i, (pattern, _, _) in enumerate(FACT_PATTERNS):
+            for text in samples:
+                m = pattern.search(text)
+                if m:
+                    matched.add(i)
+                    assert any(a in m.group(0).lower() for a in _ANCHORS), (pattern.pattern, text)
+        assert matched == set(range(len(FACT_PATTERNS)))
+
+    def test_title_parts_match_str_format(self):
+        from polaris.memory.fact_extractor import _title_parts
+
+        assert _title_parts("차량 주행거리 {0}{1}", 3) == ("차량 주행거리 ", 0, 1)
+        assert _title_parts("이사 관련", 1) == ("이사 관련",)
+        assert _title_parts("밴드갭 정보: {1}", 1) is None  # not enough groups
+
     def test_band_gap_info(self, extractor):
         facts = extractor.extract_facts("밴드갭이 1.8eV야")
         assert len(facts) >= 1
@@ -115,6 +115,25 @@ class TestDetectCorrection:
         """Normal questions should not be detected as corrections."""
         assert FeedbackManager.detect_correction("MoS2 밴드갭이 얼마야?") is False
 
+    def test_fused_pattern_matches_each_source_pattern(self):
+        import re
+        from polaris.memory.feedback_manager import CORRECTION_PATTERNS
+
+        samples = [
+            "THAT'S WRONG", "정정할게 값은 2야", "no, it's fine", "wrong!", "ACTUALLY, x", "잘 지내?",
+            "That is NOT CORRECT", "Correction: 1.8eV", "아니야, 2eV", "다시 해줘",
+        ]
+        for text in samples:
+            expected = any(re.search(p, text) for p in CORRECTION_PATTERNS)
+            assert FeedbackManager.detect_correction(text) is expected
+
+    def test_repeated_message_is_cached(self):
+        message = "그게 아니라 캐시 테스트야"
+        FeedbackManager.detect_correction(message)
+        hits = FeedbackManager.detect_correction.cache_info().hits
+        assert FeedbackManager.detect_correction(message) is True
+        assert FeedbackManager.detect_correction.cache_info().hits == hits + 1
+
     def test_empty_message(self):
         assert FeedbackManager.detect_correction("") is False
 
@@ -170,6 +189,15 @@ class TestSaveCorrection:
         assert len(rows[0]["original_action"]) <= 200
         assert len(rows[0]["correction"]) <= 200
 
+    def test_save_uses_memory_timestamp_format(self, feedback_mgr):
+        feedback_mgr.memory.save_feedback("action", "plain feedback")
+        feedback_mgr.save_correction("user123", "response", "correction")
+        stamps = [
+            row[0] for row in feedback_mgr.memory.conn.execute("SELECT timestamp FROM feedback")
+        ]
+        assert len(stamps) == 2
+        assert all(len(ts) == 26 and not ts.endswith("+00:00") for ts in stamps)
+
 
 # ==================================================================
 # TestGetRelevantFeedback (4 tests)
@@ -186,6 +214,16 @@ class TestGetRelevantFeedback:
         assert len(results) <= 2
         assert all("correction" in r for r in results)
 
+    def test_correction_saved_after_first_search_is_ranked(self, feedback_mgr):
+        feedback_mgr.save_correction("s1", "orig", "first correction")
+        feedback_mgr.get_relevant_feedback("first correction", top_k=5)
+
+        feedback_mgr.save_correction("s1", "orig", "second correction")
+        results = feedback_mgr.get_relevant_feedback("second correction", top_k=5)
+
+        assert len(results) == 2
+        assert results[0]["correction"] == "second correction"
+
     def test_top_k(self, feedback_mgr):
         for i in range(5):
             feedback_mgr.save_correction("s1", f"orig {i}", f"correction {i}")
@@ -263,7 +301,7 @@ class TestGetCorrectionCount:
 
 
 # ==================================================================
-# TestSchemaMigration (2 tests)
+# TestSchemaMigration (4 tests)
 # ==================================================================
 
 class TestSchemaMigration:
@@ -284,6 +322,35 @@ class TestSchemaMigration:
         fm2 = FeedbackManager(memory_db)  # should not raise
         assert fm2 is not None
 
+    def test_recorded_version_skips_migration(self, memory_db):
+        FeedbackManager(memory_db)
+        assert memory_db.conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+
+        statements = []
+        memory_db.conn.set_trace_callback(statements.append)
+        FeedbackManager(memory_db)
+        memory_db.conn.set_trace_callback(None)
+        assert statements == ["PRAGMA user_version"]
+
+    def test_old_table_migrated_and_versioned(self, tmp_path):
+        import sqlite3
+
+        db_path = str(tmp_path / "old.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE feedback (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL, "
+            "original_action TEXT NOT NULL, correction TEXT NOT NULL, applied BOOLEAN DEFAULT 0)"
+        )
+        conn.commit()
+        conn.close()
+
+        mem = PolarisMemory(db_path=db_path, embedder=FakeEmbedder())
+        FeedbackManager(mem)
+
+        cols = {row[1] for row in mem.conn.execute("PRAGMA table_info(feedback)")}
+        assert {"embedding", "session_id", "category"} <= cols
+        assert mem.conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+
 
 # ==================================================================
 # TestRouterIntegration (3 tests)
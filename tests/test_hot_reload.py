@@ -0,0 +1,89 @@
+"""Tests for polaris.services.hot_reload.HotReloader."""
+
+import asyncio
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polaris.services import hot_reload
+from polaris.services.hot_reload import HotReloader
+
+
+@pytest.fixture
+def watch_root(tmp_path):
+    (tmp_path / "skills").mkdir()
+    (tmp_path / "skills" / "demo.md").write_text("v1")
+    (tmp_path / "polaris").mkdir()
+    (tmp_path / "polaris" / "router.py").write_text("x = 1\n")
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "polaris.db").write_text("")
+    return tmp_path
+
+
+class TestIsWatched:
+    def test_matches_watch_patterns(self, watch_root):
+        reloader = HotReloader(watch_root=watch_root)
+
+        assert reloader.is_watched(watch_root / "skills" / "demo.md")
+        assert reloader.is_watched(watch_root / "polaris" / "router.py")
+        assert reloader.is_watched(watch_root / "data" / "master_prompt.md")
+        assert reloader.is_watched(watch_root / "hpc_monitor.py")
+
+    def test_ignores_other_files(self, watch_root, tmp_path_factory):
+        reloader = HotReloader(watch_root=watch_root)
+
+        assert not reloader.is_watched(watch_root / "data" / "polaris.db")
+        assert not reloader.is_watched(watch_root / "skills" / "notes.txt")
+        assert not reloader.is_watched(watch_root / "scratch.py")
+        assert not reloader.is_watched(tmp_path_factory.mktemp("other") / "router.py")
+
+
+class TestApplyChanges:
+    def test_runtime_change_reloads(self, watch_root):
+        callback = MagicMock()
+        reloader = HotReloader(watch_root=watch_root, on_runtime_reload=callback)
+
+        reloader.apply_changes([watch_root / "skills" / "demo.md"])
+
+        callback.assert_called_once()
+
+    def test_code_change_without_restart_does_not_reload(self, watch_root):
+        callback = MagicMock()
+        reloader = HotReloader(watch_root=watch_root, on_runtime_reload=callback)
+
+        with patch("os.execv") as execv:
+            reloader.apply_changes([watch_root / "polaris" / "router.py"])
+
+        callback.assert_not_called()
+        execv.assert_not_called()
+
+
+class TestWatch:
+    @pytest.mark.asyncio
+    async def test_polling_fallback_reloads_and_stops(self, watch_root):
+        callback = MagicMock()
+        reloader = HotReloader(
+            watch_root=watch_root, on_runtime_reload=callback, check_interval=0.01,
+        )
+        stop = asyncio.Event()
+
+        with patch.object(hot_reload, "awatch", None):
+            task = asyncio.create_task(reloader.watch(stop))
+            skill = watch_root / "skills" / "demo.md"
+            skill.write_text("v2")
+            mtime = skill.stat().st_mtime + 5
+            os.utime(skill, (mtime, mtime))
+            for _ in range(200):
+                if callback.called:
+                    break
+                await asyncio.sleep(0.01)
+            stop.set()
+            await asyncio.wait_for(task, timeout=1)
+
+        callback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_returns_immediately(self, watch_root):
+        reloader = HotReloader(watch_root=watch_root, auto_reload=False)
+        await asyncio.wait_for(reloader.watch(), timeout=1)
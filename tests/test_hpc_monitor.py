@@ -0,0 +1,74 @@
+"""Tests for hpc_monitor's batched remote probe.
+
+The SSH call is replaced by running the probe command in a local shell,
+so the delimiters and redirections are exercised for real.
+"""
+
+import subprocess
+
+import pytest
+
+from hpc_monitor import HPCMonitor, JobStatus
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.delenv("HPC_PROFILES_JSON", raising=False)
+    monkeypatch.setenv("HPC_USERNAME", "tester")
+    mon = HPCMonitor(log_path=tmp_path / "physics.log")
+
+    def _local_shell(command, timeout=30):
+        proc = subprocess.run(["bash", "-c", command], capture_output=True, text=True, timeout=timeout)
+        # What ssh itself prints ends up ahead of the remote output on stderr
+        return proc.returncode == 0, proc.stdout, "ssh: banner\n" + proc.stderr
+
+    monkeypatch.setattr(mon, "run_ssh_command", _local_shell)
+    return mon
+
+
+class TestBatchedProbe:
+    def test_partial_last_line_keeps_sections_apart(self, monitor, tmp_path):
+        outcar = tmp_path / "OUTCAR"
+        outcar.write_text("running\n")
+        oszicar = tmp_path / "OSZICAR"
+        # VASP is still writing: the last line has no trailing newline
+        oszicar.write_text("   1 F= -.10E+02 E0= -.10E+02\n   2 F= -.12E+02 E0= -.12E+02")
+
+        sections, _ = monitor._batched_probe("true", str(outcar), str(oszicar))
+
+        assert sections["heartbeat"][:2] == (True, "heartbeat\n")
+        assert sections["oszicar"][1].endswith("E0= -.12E+02")
+        status, _, progress = monitor._parse_oszicar_progress(*sections["oszicar"])
+        assert status == JobStatus.RUNNING and progress["step"] == 2
+        assert monitor._parse_convergence(*sections["convergence"])[0] == JobStatus.RUNNING
+
+    def test_stderr_attributed_to_its_own_section(self, monitor, tmp_path):
+        oszicar = tmp_path / "OSZICAR"
+        oszicar.write_text("   3 F= -.12E+02 E0= -.12E+02\n")
+
+        sections, _ = monitor._batched_probe("true", str(tmp_path / "missing"), str(oszicar))
+
+        assert sections["heartbeat"][2] == "ssh: banner\n"
+        assert sections["outcar"][0] is False and "missing" in sections["outcar"][2]
+        assert sections["queue"][2] == "" and sections["oszicar"][2] == ""
+        assert sections["oszicar"][0] is True
+
+
+class TestStatusCache:
+    def test_cached_running_result_is_not_shared_with_callers(self, monitor, monkeypatch, tmp_path):
+        calls = []
+
+        def _uncached(*args):
+            calls.append(args)
+            return {"status": JobStatus.RUNNING.value, "details": {"progress": {"step": 2}}}
+
+        monkeypatch.setattr(monitor, "_monitor_job_uncached", _uncached)
+
+        first = monitor.monitor_job("123", str(tmp_path))
+        first["details"]["progress"]["step"] = 99
+        second = monitor.monitor_job("123", str(tmp_path))
+        second["details"]["progress"]["step"] = 100
+        third = monitor.monitor_job("123", str(tmp_path))
+
+        assert len(calls) == 1
+        assert third["details"]["progress"]["step"] == 2
@@ -1,6 +1,13 @@
 """Tests for MailOps R1 modules."""
 
+import asyncio
 import json
+import re
+import sqlite3
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from polaris.mailops.classifier import MailOpsClassifier
 from polaris.mailops.service import MailOpsService
@@ -42,6 +49,49 @@ def test_classifier_categories():
     assert info["category"] == "info"
 
 
+def test_classifier_fused_patterns_match_each_source_pattern():
+    cls = MailOpsClassifier()
+    samples = ["ASAP please", "과제 마감 안내", "rsvp by friday", "무료배송 특가", "hello", "deal"]
+    for fused, patterns in (
+        (cls.URGENT_RE, cls.URGENT_PATTERNS),
+        (cls.ACTION_RE, cls.ACTION_PATTERNS),
+        (cls.PROMO_RE, cls.PROMO_PATTERNS),
+    ):
+        for text in samples:
+            expected = any(re.search(p, text, re.IGNORECASE) for p in patterns)
+            assert (fused.search(text.lower()) is not None) == expected
+    assert cls.classify({"subject": "hi", "sender": "offers@shop.com"})["category"] == "promo"
+
+
+def test_classifier_prefilter_literals_cover_every_pattern():
+    cls = MailOpsClassifier()
+    samples = [
+        "urgent", "asap", "deadline", "due  today", "마감", "긴급", "즉시", "final notice", "payment failed",
+        "reply", "please   review", "rsvp", "필요", "확인해", "요청", "submit",
+        "sale", "deal", "discount", "coupon", "프로모션", "할인", "특가", "무료배송", "limited time",
+    ]
+    for literals, patterns in (
+        (cls.URGENT_LITERALS, cls.URGENT_PATTERNS),
+        (cls.ACTION_LITERALS, cls.ACTION_PATTERNS),
+        (cls.PROMO_LITERALS, cls.PROMO_PATTERNS),
+    ):
+        for pattern in patterns:
+            matches = [m.group(0) for m in (re.search(pattern, text) for text in samples) if m]
+            assert matches, pattern
+            assert all(any(lit in m for lit in literals) for m in matches), pattern
+
+
+def test_classifier_patterns_are_lowercase():
+    cls = MailOpsClassifier()
+    for pattern in (
+        cls.URGENT_PATTERNS + cls.ACTION_PATTERNS + cls.PROMO_PATTERNS + cls.PROMO_SENDER_MARKERS
+        + list(cls.URGENT_LITERALS + cls.ACTION_LITERALS + cls.PROMO_LITERALS)
+    ):
+        assert pattern == pattern.lower()
+    assert cls.classify({"subject": "Final Notice: 긴급 확인", "sender": "a@b.com"})["category"] == "urgent"
+    assert cls.classify({"subject": "주말 특가 SALE", "sender": "a@b.com"})["category"] == "promo"
+
+
 def test_mailops_sync_and_digest(tmp_path):
     store = MailOpsStore(str(tmp_path / "mailops.db"))
     rows = [
@@ -63,6 +113,109 @@ def test_mailops_sync_and_digest(tmp_path):
     assert len(promo) == 1
 
 
+def test_sync_counts_only_new_mail_on_resync(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    rows = [_mail("m1", "URGENT deadline", "prof@uic.edu", "today")]
+    ingestor = _FakeIngestor(rows)
+    service = MailOpsService(store=store, classifier=MailOpsClassifier(), ingestor=ingestor)
+    first = service.sync_unread()
+
+    rows.append(_mail("m2", "Weekly update", "dept@uic.edu", "news"))
+    second = service.sync_unread()
+
+    assert (first["inserted"], first["urgent_new"]) == (1, 1)
+    assert (second["fetched"], second["inserted"], second["urgent_new"]) == (2, 1, 0)
+    assert len(service.get_digest(limit=10)) == 2
+
+
+def test_resync_skips_reclassifying_known_mail(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    rows = [_mail("m1", "URGENT deadline", "prof@uic.edu", "today")]
+    classifier = MailOpsClassifier()
+    service = MailOpsService(store=store, classifier=classifier, ingestor=_FakeIngestor(rows))
+    service.sync_unread()
+
+    rows.append(_mail("m2", "Weekly update", "dept@uic.edu", "news"))
+    with patch.object(classifier, "classify", wraps=classifier.classify) as classify:
+        service.sync_unread()
+
+    assert [c.args[0]["ext_id"] for c in classify.call_args_list] == ["m2"]
+    assert service.get_urgent(limit=10)[0]["ext_id"] == "m1"
+
+
+def test_sync_stamps_batch_with_one_timestamp(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    rows = [_mail(f"m{i}", "Weekly update", "dept@uic.edu", "news") for i in range(3)]
+    service = MailOpsService(store=store, classifier=MailOpsClassifier(), ingestor=_FakeIngestor(rows))
+    service.sync_unread()
+
+    created = {r[0] for r in store.conn.execute("SELECT created_at FROM mail_messages")}
+    updated = {r[0] for r in store.conn.execute("SELECT updated_at FROM mail_classification")}
+    assert len(created) == 1 and created == updated
+    assert next(iter(created)).endswith("+00:00")
+
+
+def test_ingestor_fetches_accounts_concurrently_in_order():
+    from polaris.mailops.ingest import MailOpsIngestor
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _Reader:
+        def __init__(self, keyword):
+            self.keyword = keyword
+
+        def get_unread_mails(self, limit=20):
+            if self.keyword == "bad":
+                raise RuntimeError("Mail.app timeout")
+            barrier.wait()  # both good accounts must be in flight at once
+            return [{"account": self.keyword, "subject": f"hi {self.keyword}", "sender": "a", "content": "", "date": "d"}]
+
+    ingestor = MailOpsIngestor(["uic", "bad", "gmail"], reader_factory=_Reader)
+    mails = ingestor.fetch_unread(limit_per_account=5)
+
+    assert [m["account_id"] for m in mails] == ["uic", "gmail"]
+
+
+def test_ingestor_reuses_reader_per_keyword():
+    from polaris.mailops.ingest import MailOpsIngestor
+
+    reader = MagicMock()
+    reader.get_unread_mails.return_value = []
+    factory = MagicMock(return_value=reader)
+    ingestor = MailOpsIngestor(["uic"], reader_factory=factory)
+
+    ingestor.fetch_unread()
+    ingestor.fetch_unread()
+    assert factory.call_count == 1
+
+    ingestor.close()
+    reader.close.assert_called_once()
+    ingestor.fetch_unread()
+    assert factory.call_count == 2
+
+
+def test_poll_urgent_syncs_and_claims_alerts_once(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    rows = [_mail("m1", "URGENT deadline", "prof@uic.edu", "today")]
+    service = MailOpsService(store=store, classifier=MailOpsClassifier(), ingestor=_FakeIngestor(rows))
+
+    assert [r["ext_id"] for r in service.poll_urgent()] == ["m1"]
+    assert service.poll_urgent() == []
+
+
+def test_execute_actions_logs_batch_in_one_commit(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    service = MailOpsService(store=store, classifier=MailOpsClassifier(), ingestor=_FakeIngestor([]))
+
+    with patch.object(store, "_commit", wraps=store._commit) as commit:
+        result = service.execute_actions("label", ["m1", "m2", "m3"], label="todo")
+
+    assert result["count"] == 3
+    assert commit.call_count == 1
+    rows = store.conn.execute("SELECT ext_id, detail FROM mail_actions_log ORDER BY id").fetchall()
+    assert [tuple(r) for r in rows] == [("m1", "todo"), ("m2", "todo"), ("m3", "todo")]
+
+
 def test_unalerted_urgent_tracking(tmp_path):
     store = MailOpsStore(str(tmp_path / "mailops.db"))
     rows = [_mail("m1", "URGENT deadline", "prof@uic.edu", "today")]
@@ -77,6 +230,18 @@ def test_unalerted_urgent_tracking(tmp_path):
     assert second == []
 
 
+def test_mark_urgent_alerted_bulk(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    rows = [_mail("m1", "URGENT deadline", "prof@uic.edu", "today"), _mail("m2", "urgent: asap", "ta@uic.edu", "")]
+    service = MailOpsService(store=store, classifier=MailOpsClassifier(), ingestor=_FakeIngestor(rows))
+    service.sync_unread()
+
+    service.mark_urgent_alerted_bulk([r["ext_id"] for r in service.list_unalerted_urgent(limit=5)])
+    service.mark_urgent_alerted_bulk(["m1"])  # already alerted: ignored
+
+    assert service.list_unalerted_urgent(limit=5) == []
+
+
 def test_tools_mailops_registered_and_callable(tmp_path, monkeypatch):
     from polaris.tools.mailops_tools import handle_fetch_mail_digest
 
@@ -92,3 +257,100 @@ def test_tools_mailops_registered_and_callable(tmp_path, monkeypatch):
     result = handle_fetch_mail_digest(limit=5, sync_first=True)
     parsed = json.loads(result)
     assert parsed["count"] == 1
+
+
+def test_upsert_many_flags_new_rows(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    store.upsert_message(_mail("m1", "Old", "a@uic.edu", ""))
+
+    flags = store.upsert_many([
+        _mail("m1", "Old", "a@uic.edu", ""),
+        _mail("m2", "New", "b@uic.edu", ""),
+        _mail("m2", "New", "b@uic.edu", ""),
+    ])
+
+    assert flags == [False, True, False]
+    assert len(store.get_digest(limit=10)) == 2
+
+
+def test_raw_json_stores_only_source_mail(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    msg = _mail("m1", "Hello", "a@uic.edu", "body")
+    msg["raw"] = {"subject": "Hello", "account": "UIC"}
+    store.upsert_message(msg)
+
+    raw = store.conn.execute("SELECT raw_json FROM mail_messages WHERE ext_id = 'm1'").fetchone()[0]
+    assert json.loads(raw) == {"subject": "Hello", "account": "UIC"}
+
+
+def test_digest_order_uses_index(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    plan = " ".join(
+        row[3]
+        for row in store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT ext_id FROM mail_messages "
+            "ORDER BY COALESCE(received_at, created_at) DESC LIMIT 5"
+        )
+    )
+    assert "idx_mail_messages_order" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_store_uses_wal_and_rolls_back_failed_batch(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    try:
+        with store.transaction():
+            store.upsert_message(_mail("m1", "hello", "a@uic.edu", ""))
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert store.get_digest(limit=10) == []
+
+    with store.transaction():
+        store.upsert_message(_mail("m2", "hello", "a@uic.edu", ""))
+        store.upsert_message(_mail("m3", "again", "b@uic.edu", ""))
+    assert {row["ext_id"] for row in store.get_digest(limit=10)} == {"m2", "m3"}
+
+
+def test_store_close_releases_every_reader(tmp_path):
+    store = MailOpsStore(str(tmp_path / "mailops.db"))
+    readers = [store._reader()]
+    worker = threading.Thread(target=lambda: readers.append(store._reader()))
+    worker.start()
+    worker.join()
+    assert readers[0] is not readers[1]
+
+    store.close()
+
+    for conn in [store.conn, *readers]:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+@pytest.mark.asyncio
+async def test_poller_polls_on_subscribe_and_alerts_subscribed_chats():
+    from polaris.mailops.poller import MailOpsPoller
+
+    svc = MagicMock()
+    svc.poll_urgent.return_value = [{"ext_id": "m1", "subject": "URGENT", "sender": "prof"}]
+    app = MagicMock()
+    app.bot.send_message = AsyncMock()
+    poller = MailOpsPoller(svc, poll_interval=3600)
+
+    task = asyncio.create_task(poller.run(app))
+    await asyncio.sleep(0)
+    svc.poll_urgent.assert_not_called()
+
+    assert poller.subscribe(42) is True
+    assert poller.subscribe(42) is False
+    for _ in range(100):
+        if app.bot.send_message.called:
+            break
+        await asyncio.sleep(0.01)
+    poller.stop()
+    await asyncio.wait_for(task, timeout=1)
+
+    svc.poll_urgent.assert_called_once_with(20, 5)
+    assert app.bot.send_message.call_args.kwargs["chat_id"] == 42
@@ -7,6 +7,8 @@ so they run without Ollama or any external service.
 import json
 import os
 import tempfile
+import threading
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -142,6 +144,13 @@ class TestKnowledge:
         )
         assert rid >= 1
 
+    def test_tags_stored_as_compact_unicode_json_text(self, memory):
+        rid = memory.save_knowledge("research", "MoS2", "bandgap", tags=["DFT", "밴드갭"])
+        row = memory.conn.execute(
+            "SELECT tags, typeof(tags) FROM knowledge WHERE id = ?", (rid,)
+        ).fetchone()
+        assert tuple(row) == ('["DFT","밴드갭"]', "text")
+
     def test_semantic_search(self, memory):
         memory.save_knowledge("research", "MoS2 bandgap", "MoS2 has 1.8 eV bandgap", source="arxiv")
         memory.save_knowledge("daily", "Gym schedule", "Workout at 6pm every Tuesday", source="manual")
@@ -163,6 +172,149 @@ class TestKnowledge:
         assert "knowledge" in sources
 
 
+    def test_embeddings_written_in_background_batches(self, memory):
+        gate = threading.Event()
+        calls = []
+        real_batch = memory.embedder.batch_embed
+
+        def slow_batch(texts):
+            gate.wait(5)
+            calls.append(list(texts))
+            return real_batch(texts)
+
+        memory.embedder.batch_embed = slow_batch
+        first = memory.save_conversation("s1", "user", "first message")
+        second = memory.save_knowledge("research", "DFT", "second message")
+        third = memory.save_conversation("s1", "assistant", "third message")
+        assert memory.conn.execute(
+            "SELECT embedding FROM conversations WHERE id = ?", (first,)
+        ).fetchone()[0] is None
+
+        gate.set()
+        memory.flush()
+
+        assert sum(len(c) for c in calls) == 3 and len(calls) <= 2
+        for table, rid in (("conversations", first), ("knowledge", second), ("conversations", third)):
+            row = memory.conn.execute(f"SELECT embedding FROM {table} WHERE id = ?", (rid,)).fetchone()
+            assert row[0] is not None
+
+
+    def test_semantic_search_reuses_loaded_embeddings(self, memory):
+        memory.save_knowledge("research", "MoS2 bandgap", "MoS2 has 1.8 eV bandgap")
+        memory.search_memory("MoS2", top_k=3)
+
+        with patch.object(memory.embedder, "from_bytes", wraps=memory.embedder.from_bytes) as decode:
+            memory.save_conversation("s1", "user", "MoS2 again")
+            results = memory.search_memory("MoS2", top_k=3)
+
+        # Only the new row's stored vector is decoded; the knowledge index is not reloaded
+        assert decode.call_count == 1
+        assert {r["source_table"] for r in results} == {"conversation", "knowledge"}
+
+    def test_index_holds_stored_int8_vector(self, memory):
+        memory.save_knowledge("research", "MoS2 bandgap", "MoS2 has 1.8 eV bandgap")
+        memory.search_memory("MoS2", top_k=3)
+        index = memory._indexes["knowledge"]
+
+        with patch.object(index, "add", wraps=index.add) as add:
+            row_id = memory.save_knowledge("research", "WSe2 bandgap", "WSe2 has 1.6 eV bandgap")
+            memory.flush()
+
+        blob = memory.conn.execute("SELECT embedding FROM knowledge WHERE id = ?", (row_id,)).fetchone()[0]
+        add.assert_called_once_with(row_id, memory.embedder.from_bytes(blob))
+
+
+    def test_semantic_search_merges_tables_best_first(self, memory):
+        for i in range(4):
+            memory.save_conversation("s1", "user", "c" * (i + 3))
+            memory.save_knowledge("research", f"note {i}", "k" * (i + 3))
+
+        results = memory.search_memory("query text", top_k=3)
+
+        scores = [r["score"] for r in results]
+        assert len(results) == 3
+        assert scores == sorted(scores, reverse=True)
+
+    def test_large_tables_scored_in_parallel_match_serial(self, memory):
+        for i in range(3):
+            memory.save_conversation("s1", "user", f"turn {i} about MoS2")
+            memory.save_knowledge("research", f"note {i}", "x" * (i + 5))
+        serial = memory.search_memory("MoS2", top_k=4)
+        assert memory._score_pool is None
+
+        with patch("polaris.memory.memory._PARALLEL_SCORE_ROWS", 1):
+            parallel = memory.search_memory("MoS2", top_k=4)
+        assert memory._score_pool is not None
+        assert parallel == serial
+
+    def test_embeddings_reload_from_sidecar_matrix(self, tmp_db):
+        pytest.importorskip("numpy")
+        first = PolarisMemory(db_path=tmp_db, embedder=FakeEmbedder())
+        first.save_knowledge("research", "MoS2 bandgap", "MoS2 has 1.8 eV bandgap")
+        first.search_memory("MoS2", top_k=3)
+        assert os.path.exists(tmp_db + ".knowledge.vec.npy")
+
+        second = PolarisMemory(db_path=tmp_db, embedder=FakeEmbedder())
+        with patch.object(second.embedder, "from_bytes", side_effect=AssertionError("decoded")):
+            assert second.search_memory("MoS2", top_k=3)[0]["source_table"] == "knowledge"
+        second.save_knowledge("research", "WS2", "WS2 monolayer")
+        second.flush()
+
+        third = PolarisMemory(db_path=tmp_db, embedder=FakeEmbedder())
+        with patch.object(third.embedder, "from_bytes", wraps=OllamaEmbedder.from_bytes) as decode:
+            results = third.search_memory("MoS2", top_k=3)
+        assert decode.call_count == 1  # only the row embedded after the sidecar was written
+        assert len(results) == 2
+
+    def test_quantize_embeddings_converts_float_blobs(self, memory):
+        rid = memory.save_knowledge("research", "DFT", "Density functional theory")
+        memory.flush()
+        memory.conn.execute(
+            "UPDATE knowledge SET embedding = ? WHERE id = ?",
+            (OllamaEmbedder.to_bytes([0.5, -1.0, 2.0], quantize=False), rid),
+        )
+        memory.conn.commit()
+
+        assert memory.quantize_embeddings() == 1
+        assert memory.quantize_embeddings() == 0
+        blob = memory.conn.execute("SELECT embedding FROM knowledge WHERE id = ?", (rid,)).fetchone()[0]
+        assert OllamaEmbedder.is_quantized(blob)
+
+    def test_quantize_embeddings_invalidates_feedback_index(self, memory):
+        from polaris.memory.feedback_manager import FeedbackManager
+
+        fm = FeedbackManager(memory)
+        fm.save_correction("s1", "message", "correction")
+        memory.conn.execute(
+            "UPDATE feedback SET embedding = ?",
+            (OllamaEmbedder.to_bytes([0.5, -1.0, 2.0], quantize=False),),
+        )
+        memory.conn.commit()
+        fm._semantic_feedback_search([0.5, -1.0, 2.0], 1)
+        assert fm._index is not None
+
+        assert memory.quantize_embeddings() == 1
+        assert fm._index is None
+
+
+# ================================================================
+# Schema / connection tests
+# ================================================================
+
+class TestSchema:
+    def test_wal_and_lookup_indexes(self, memory):
+        from polaris.memory.feedback_manager import FeedbackManager
+
+        FeedbackManager(memory)
+        assert memory.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        for sql, index in (
+            ("SELECT COUNT(*) FROM feedback WHERE category = 'x'", "idx_feedback_category"),
+            ("SELECT id FROM knowledge WHERE source = 'obsidian'", "idx_knowledge_source"),
+        ):
+            plan = " ".join(r[3] for r in memory.conn.execute("EXPLAIN QUERY PLAN " + sql))
+            assert index in plan
+
+
 # ================================================================
 # Keyword fallback search tests
 # ================================================================
@@ -178,6 +330,31 @@ class TestKeywordFallback:
         contents = [r["content"] for r in results]
         assert any("DFT" in c for c in contents)
 
+    def test_keyword_search_matches_korean_substring(self, memory_no_embed):
+        memory_no_embed.save_conversation("s1", "user", "MoS2 밴드갭이 1.8eV야")
+        memory_no_embed.save_knowledge("research", "WSe2 노트", "밴드갭 측정 결과", source="manual")
+
+        results = memory_no_embed.search_memory("밴드갭", top_k=5)
+        assert [r["source_table"] for r in results] == ["conversation", "knowledge"]
+        assert memory_no_embed.search_memory("mos2 밴드", top_k=5)[0]["id"] == results[0]["id"]
+
+    def test_keyword_index_covers_rows_from_before_it_existed(self, tmp_db):
+        import sqlite3
+        from pathlib import Path
+
+        import polaris.memory.memory as memory_mod
+
+        conn = sqlite3.connect(tmp_db)
+        conn.executescript((Path(memory_mod.__file__).parent / "schema.sql").read_text())
+        conn.execute(
+            "INSERT INTO conversations (timestamp, session_id, role, content) VALUES ('t', 's1', 'user', 'legacy DFT note')"
+        )
+        conn.commit()
+        conn.close()
+
+        memory = PolarisMemory(db_path=tmp_db, embedder=NoEmbedder())
+        assert [r["content"] for r in memory.search_memory("DFT", top_k=5)] == ["legacy DFT note"]
+
     def test_keyword_search_no_results(self, memory_no_embed):
         memory_no_embed.save_conversation("s1", "user", "Hello world")
         results = memory_no_embed.search_memory("quantum_xyz_nonexistent", top_k=5)
@@ -263,11 +440,48 @@ class TestMigration:
 class TestEmbedder:
     def test_to_from_bytes_roundtrip(self):
         vec = [1.0, 2.5, -3.14, 0.0, 99.99]
+        blob = OllamaEmbedder.to_bytes(vec, quantize=False)
+        restored = OllamaEmbedder.from_bytes(blob)
+        norm = sum(x * x for x in vec) ** 0.5
+        assert len(blob) == 1 + 2 * len(vec)  # float16 + dtype byte
+        assert restored == pytest.approx([x / norm for x in vec], rel=1e-3, abs=1e-4)
+        assert OllamaEmbedder.cosine_similarity(restored, vec) == pytest.approx(1.0, abs=1e-4)
+
+    def test_from_bytes_reads_unnormalized_float16(self):
+        import struct
+
+        vec = [0.5, -2.0, 4.0]
+        blob = b"\x10" + struct.pack("<3e", *vec)
+        assert OllamaEmbedder.from_bytes(blob) == vec
+
+    def test_from_bytes_reads_legacy_float32(self):
+        import struct
+
+        vec = [0.25, -1.5, 3.0]
+        assert OllamaEmbedder.from_bytes(struct.pack("3f", *vec)) == vec
+
+    def test_to_bytes_without_numpy_matches(self):
+        import polaris.memory.embedder as embedder_mod
+
+        vec = [0.1, -0.2, 0.3]
+        with patch.object(embedder_mod, "np", None):
+            blob = OllamaEmbedder.to_bytes(vec, quantize=False)
+            restored = OllamaEmbedder.from_bytes(blob)
+            quantized = OllamaEmbedder.from_bytes(OllamaEmbedder.to_bytes(vec))
+        assert blob == OllamaEmbedder.to_bytes(vec, quantize=False)
+        assert restored == OllamaEmbedder.from_bytes(blob)
+        assert quantized == pytest.approx(OllamaEmbedder.from_bytes(OllamaEmbedder.to_bytes(vec)), abs=1e-6)
+
+    @pytest.mark.parametrize("dims", [4, 5])
+    def test_int8_roundtrip_keeps_direction(self, dims):
+        vec = [0.3, -1.2, 2.0, 0.05, -0.7][:dims]
         blob = OllamaEmbedder.to_bytes(vec)
         restored = OllamaEmbedder.from_bytes(blob)
-        assert len(restored) == len(vec)
-        for a, b in zip(vec, restored):
-            assert abs(a - b) < 1e-5
+        norm = sum(x * x for x in vec) ** 0.5
+        assert OllamaEmbedder.is_quantized(blob)
+        assert len(blob) % 2 == 1 and len(blob) <= 1 + 4 + dims + 1
+        assert restored == pytest.approx([x / norm for x in vec], abs=max(abs(x) for x in vec) / norm / 254 + 1e-7)
+        assert not OllamaEmbedder.is_quantized(OllamaEmbedder.to_bytes(vec, quantize=False))
 
     def test_cosine_similarity_identical(self):
         vec = [1.0, 2.0, 3.0]
@@ -292,13 +506,69 @@ class TestEmbedder:
         sim = OllamaEmbedder.cosine_similarity(a, b)
         assert sim == 0.0
 
-    @patch("polaris.memory.embedder.requests.post")
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_embedding_index_top_k_matches_cosine(self, use_numpy):
+        import polaris.memory.embedder as embedder_mod
+        from polaris.memory.embedder import EmbeddingIndex
+
+        if use_numpy and embedder_mod.np is None:
+            pytest.skip("numpy not installed")
+        query = [1.0, 2.0, 3.0]
+        rows = {10: [2.0, 4.0, 6.1], 11: [-3.0, 0.5, 1.0], 12: [0.0, 0.0, 0.0], 13: [1.0, 0.0, 0.0]}
+        np_mod = embedder_mod.np if use_numpy else None
+        with patch.object(embedder_mod, "np", np_mod):
+            index = EmbeddingIndex()
+            for row_id, vec in rows.items():
+                index.add(row_id, vec)
+            hits = index.top_k(query, 2)
+            everything = index.top_k(query, 10)
+        expected = sorted(
+            ((rid, OllamaEmbedder.cosine_similarity(query, v)) for rid, v in rows.items()),
+            key=lambda h: h[1], reverse=True,
+        )
+        assert [rid for rid, _ in hits] == [10, 13]
+        assert [rid for rid, _ in everything] == [rid for rid, _ in expected]
+        assert [s for _, s in everything] == pytest.approx([s for _, s in expected], abs=1e-5)
+
+    def test_embedding_index_grows_and_handles_mixed_lengths(self):
+        from polaris.memory.embedder import EmbeddingIndex
+
+        index = EmbeddingIndex()
+        for i in range(200):
+            index.add(i, [1.0, float(i)])
+        assert len(index) == 200
+        assert index.top_k([0.0, 1.0], 1)[0][0] == 199
+
+        index.add(200, [0.0, 0.0, 5.0])
+        hits = dict(index.top_k([0.0, 0.0, 1.0], 3))
+        assert hits[200] == pytest.approx(1.0)
+
+    @patch("polaris.memory.embedder.requests.Session.post")
     def test_embed_ollama_unavailable(self, mock_post):
         mock_post.side_effect = Exception("Connection refused")
         embedder = OllamaEmbedder()
         assert embedder.available is False
         assert embedder.embed("test") is None
 
+    @patch("polaris.memory.embedder.requests.Session.post")
+    def test_availability_probed_lazily_and_failures_cached(self, mock_post):
+        import requests
+
+        mock_post.side_effect = requests.ConnectionError("refused")
+        embedder = OllamaEmbedder()
+        mock_post.assert_not_called()
+
+        assert embedder.embed("a") is None
+        assert embedder.embed("b") is None
+        assert mock_post.call_count == 1  # one probe, then cached
+
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"embedding": [1.0]}
+        mock_post.side_effect = None
+        mock_post.return_value = ok
+        embedder._last_probe -= 61
+        assert embedder.embed("c") == [1.0]
+
 
 # ================================================================
 # get_relevant_context tests
@@ -495,7 +765,7 @@ class TestMasterPrompt:
 # ================================================================
 
 class TestBatchEmbed:
-    @patch("polaris.memory.embedder.requests.post")
+    @patch("polaris.memory.embedder.requests.Session.post")
     def test_batch_embed_calls_embed_for_each(self, mock_post):
         # Make availability check fail so available=False
         mock_post.side_effect = Exception("Connection refused")
@@ -505,6 +775,35 @@ class TestBatchEmbed:
         # All None because embedder is unavailable
         assert all(r is None for r in results)
 
+    @patch("polaris.memory.embedder.requests.Session.post")
+    def test_batch_embed_sends_one_request(self, mock_post):
+        probe = MagicMock(status_code=200)
+        probe.json.return_value = {"embedding": [0.1]}
+        batch = MagicMock(status_code=200)
+        batch.json.return_value = {"embeddings": [[1.0], [2.0]]}
+        mock_post.side_effect = [probe, batch]
+
+        embedder = OllamaEmbedder()
+        results = embedder.batch_embed(["a", "b"])
+
+        assert results == [[1.0], [2.0]]
+        assert mock_post.call_args.args[0].endswith("/api/embed")
+        assert mock_post.call_args.kwargs["json"]["input"] == ["a", "b"]
+
+    @patch("polaris.memory.embedder.requests.Session.post")
+    def test_batch_embed_falls_back_when_endpoint_missing(self, mock_post):
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"embedding": [0.5]}
+        missing = MagicMock(status_code=404)
+        mock_post.side_effect = [ok, missing, ok, ok]
+
+        embedder = OllamaEmbedder()
+        results = embedder.batch_embed(["a", "b"])
+
+        assert results == [[0.5], [0.5]]
+        assert embedder._batch_supported is False
+        assert mock_post.call_count == 4
+
     def test_batch_embed_with_fake_embedder(self):
         embedder = FakeEmbedder()
         results = embedder.batch_embed(["hello", "world"])
@@ -5,7 +5,7 @@ Default backend is Ollama (OpenAI-compatible). Tests mock the OpenAI client.
 
 import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 
 # ---------- helpers for building mock OpenAI responses ----------
@@ -150,6 +150,119 @@ class TestRouteWithToolUse:
         assert "get_calendar_briefing" in result["tools_used"]
         assert len(result["tools_used"]) == 2
 
+    @patch("polaris.router.PolarisRouter._init_ollama")
+    @patch("polaris.router.PolarisRouter._load_tools")
+    def test_tool_calls_in_one_turn_run_concurrently(self, mock_load, mock_init):
+        import threading
+        from polaris.router import PolarisRouter
+
+        router = PolarisRouter()
+        mock_client = MagicMock()
+        router.client = mock_client
+
+        tool_resp = _make_response([_make_choice(
+            "tool_calls",
+            tool_calls=[
+                _make_tool_call("tc_1", "search_arxiv", {"query": "MoS2"}),
+                _make_tool_call("tc_2", "get_calendar_briefing", {}),
+            ],
+        )])
+        final_resp = _make_response([_make_choice("stop", content="Both done.")])
+        mock_client.chat.completions.create.side_effect = [tool_resp, final_resp]
+
+        # Each tool waits for the other; a sequential loop would break the barrier.
+        barrier = threading.Barrier(2, timeout=2)
+
+        def fake_execute(name, args):
+            barrier.wait()
+            return f'{{"tool": "{name}"}}'
+
+        with patch.object(router, "_execute_tool", side_effect=fake_execute):
+            result = router.route("Search papers and check schedule")
+
+        assert result["response"] == "Both done."
+        assert result["tools_used"] == ["search_arxiv", "get_calendar_briefing"]
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        tool_msgs = [m for m in messages if isinstance(m, dict) and m.get("role") == "tool"]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["tc_1", "tc_2"]
+        assert tool_msgs[0]["content"] == '{"tool": "search_arxiv"}'
+
+
+class TestAsyncRoute:
+    @pytest.mark.asyncio
+    @patch("polaris.router.PolarisRouter._init_ollama")
+    @patch("polaris.router.PolarisRouter._load_tools")
+    async def test_aroute_uses_async_client(self, mock_load, mock_init):
+        from polaris.router import PolarisRouter
+
+        router = PolarisRouter()
+        router.client = MagicMock()
+        router.async_client = MagicMock()
+
+        tool_resp = _make_response([_make_choice(
+            "tool_calls",
+            tool_calls=[_make_tool_call("tc_1", "search_arxiv", {"query": "MoS2"})],
+        )])
+        final_resp = _make_response([_make_choice("stop", content="Done.")])
+        router.async_client.chat.completions.create = AsyncMock(
+            side_effect=[tool_resp, final_resp]
+        )
+
+        with patch.object(router, "_execute_tool", return_value='{"papers": []}'):
+            result = await router.aroute("Search MoS2 papers")
+
+        assert result["response"] == "Done."
+        assert result["tools_used"] == ["search_arxiv"]
+        assert router.async_client.chat.completions.create.await_count == 2
+        router.client.chat.completions.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("polaris.router.PolarisRouter._init_ollama")
+    @patch("polaris.router.PolarisRouter._load_tools")
+    async def test_aroute_streams_tool_free_answer(self, mock_load, mock_init):
+        from polaris.router import PolarisRouter
+
+        router = PolarisRouter()
+        router.async_client = MagicMock()
+
+        def _chunk(text):
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = text
+            return chunk
+
+        async def _stream():
+            for text in ("Hel", "lo", None, "!"):
+                yield _chunk(text)
+
+        router.async_client.chat.completions.create = AsyncMock(return_value=_stream())
+        deltas = []
+
+        async def on_delta(text):
+            deltas.append(text)
+
+        result = await router.aroute("Hi", on_delta=on_delta)
+
+        assert deltas == ["Hel", "lo", "!"]
+        assert result == {"response": "Hello!", "tools_used": []}
+        assert router.async_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    @patch("polaris.router.PolarisRouter._init_ollama")
+    @patch("polaris.router.PolarisRouter._load_tools")
+    async def test_awarmup_loads_model_with_one_token(self, mock_load, mock_init):
+        from polaris.router import PolarisRouter
+
+        router = PolarisRouter()
+        router.async_client = MagicMock()
+        router.async_client.chat.completions.create = AsyncMock()
+
+        with patch.object(router, "_build_system_prompt") as build:
+            await router.awarmup()
+
+        build.assert_called_once()
+        assert router.async_client.chat.completions.create.call_args.kwargs["max_tokens"] == 1
+
 
 class TestMaxIterations:
     @patch("polaris.router.PolarisRouter._init_ollama")
@@ -306,3 +419,18 @@ class TestAnthropicBackendBlocked:
 
         assert "paid API" in result["response"]
         assert result["tools_used"] == []
+
+    @pytest.mark.asyncio
+    @patch("polaris.router.PolarisRouter._init_anthropic")
+    @patch("polaris.router.PolarisRouter._load_tools")
+    @patch.dict("os.environ", {"POLARIS_LLM_BACKEND": "anthropic", "POLARIS_ALLOW_PAID_API": "true"})
+    async def test_awarmup_never_calls_paid_api(self, mock_load, mock_init):
+        from polaris.router import PolarisRouter
+
+        router = PolarisRouter()
+        router.async_client = MagicMock()
+
+        with patch.object(router, "_build_system_prompt"):
+            await router.awarmup()
+
+        assert router.async_client.mock_calls == []
@@ -0,0 +1,45 @@
+"""Tests for polaris.services.streaming_reply."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from polaris.services.streaming_reply import StreamingReply, markdown_balanced
+
+
+class TestMarkdownBalanced:
+    def test_paired_entities(self):
+        assert markdown_balanced("*bold* and _italic_ [link](x)")
+
+    def test_unpaired_entities(self):
+        assert not markdown_balanced("a*b")
+        assert not markdown_balanced("snake_case")
+
+    def test_code_spans_are_ignored(self):
+        assert markdown_balanced("`a*b` and ```x_y```")
+
+
+class TestStreamingReply:
+    @pytest.mark.asyncio
+    async def test_first_delta_sends_then_finish_edits(self):
+        message = MagicMock(edit_text=AsyncMock())
+        source = MagicMock(reply_text=AsyncMock(return_value=message))
+        stream = StreamingReply(source, interval=3600)
+
+        await stream.feed("Hel")
+        await stream.feed("lo")
+        await stream.finish("Hello *world*")
+
+        source.reply_text.assert_awaited_once_with("Hel")
+        message.edit_text.assert_awaited_once_with("Hello *world*", parse_mode="Markdown")
+
+    @pytest.mark.asyncio
+    async def test_send_failure_disables_streaming(self):
+        source = MagicMock(reply_text=AsyncMock(side_effect=RuntimeError("boom")))
+        stream = StreamingReply(source)
+
+        await stream.feed("a")
+        await stream.feed("b")
+
+        assert stream.message is None
+        source.reply_text.assert_awaited_once()
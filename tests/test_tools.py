@@ -55,6 +55,14 @@ class TestToolSchemaFormat:
 
 
 class TestExecuteTool:
+    @pytest.fixture(autouse=True)
+    def _fresh_monitors(self):
+        """Drop cached PhysicsMonitors so each test builds its own (mocked) one."""
+        import polaris.tools.hpc_tools as hpc_mod
+        hpc_mod._monitors.clear()
+        yield
+        hpc_mod._monitors.clear()
+
     def test_unknown_tool_returns_error(self):
         from polaris.tools import execute_tool
         result = execute_tool("nonexistent_tool_xyz", {})
@@ -88,6 +96,26 @@ class TestExecuteTool:
         finally:
             hpc_mod._PhysicsMonitor = original
 
+    def test_cluster_call_does_not_retarget_default_monitor(self):
+        import polaris.tools.hpc_tools as hpc_mod
+
+        monitors = []
+
+        def _make():
+            monitor = MagicMock(profile_name="polaris")
+            monitor.set_profile.side_effect = lambda name: setattr(monitor, "profile_name", name)
+            monitor.monitor_job.return_value = {"status": "RUNNING"}
+            monitor.zombie_guard.side_effect = lambda: monitor.profile_name == "polaris"
+            monitors.append(monitor)
+            return monitor
+
+        with patch.object(hpc_mod, "_PhysicsMonitor", MagicMock(side_effect=_make)):
+            hpc_mod.handle_monitor_hpc_job("1", "/p", cluster="carbon")
+            hpc_mod.handle_monitor_hpc_job("2", "/p", cluster="carbon")
+            assert json.loads(hpc_mod.handle_check_hpc_connection())["alive"] is True
+
+        assert [m.profile_name for m in monitors] == ["carbon", "polaris"]
+
     def test_execute_tool_with_extra_args(self):
         """Tools should handle kwargs properly."""
         from polaris.tools import execute_tool
@@ -97,3 +125,15 @@ class TestExecuteTool:
             result = execute_tool("search_arxiv", {"query": "test", "max_results": 5})
             parsed = json.loads(result)
             mock.assert_called_once_with("test", 5)
+
+    def test_close_monitors_closes_and_forgets_cached_monitors(self):
+        import polaris.tools.hpc_tools as hpc_mod
+
+        with patch.object(hpc_mod, "_PhysicsMonitor", MagicMock(side_effect=lambda: MagicMock())):
+            default = hpc_mod._get_monitor()
+            carbon = hpc_mod._get_monitor("carbon")
+            hpc_mod.close_monitors()
+
+        default.close.assert_called_once_with()
+        carbon.close.assert_called_once_with()
+        assert hpc_mod._monitors == {}
@@ -46,6 +46,25 @@ class TestLogInsertion:
         assert "T" in rows[0]["timestamp"]  # ISO format
 
 
+class TestLogMany:
+    def test_inserts_batch_in_order(self, logger):
+        logger.log_many([
+            {"thought": "t", "tool": "tool_a", "args": {"q": 1}, "result": "ok",
+             "approval_level": "AUTO", "session_id": "s1"},
+            {"thought": "t", "tool": "tool_b", "args": {}, "result": "ok",
+             "approval_level": "AUTO", "session_id": "s1",
+             "timestamp": "2026-01-01T00:00:00"},
+        ])
+        rows = logger.get_recent(limit=10)
+        assert [r["tool"] for r in rows] == ["tool_b", "tool_a"]
+        assert rows[0]["timestamp"] == "2026-01-01T00:00:00"
+        assert json.loads(rows[1]["args"]) == {"q": 1}
+
+    def test_empty_batch_is_noop(self, logger):
+        logger.log_many([])
+        assert logger.get_recent(limit=10) == []
+
+
 class TestBySession:
     def test_filter_by_session(self, logger):
         _insert_sample(logger, session_id="sess-A")
@@ -94,6 +113,13 @@ class TestByDateRange:
         results = logger.by_date_range("2000-01-01", "2000-01-02")
         assert len(results) == 0
 
+    def test_log_and_log_many_share_timestamp_format(self, logger):
+        _insert_sample(logger)
+        logger.log_many([{"tool": "batched"}])
+        stamps = [r["timestamp"] for r in logger.get_recent(limit=10)]
+        assert len(stamps) == 2
+        assert all(len(ts) == 26 and not ts.endswith("+00:00") for ts in stamps)
+
 
 class TestExportJson:
     def test_export_all(self, logger):
@@ -0,0 +1,48 @@
+"""Tests for polaris.services.trace_batcher.TraceBatcher."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from polaris.services.trace_batcher import TraceBatcher
+
+
+class TestTraceBatcher:
+    def test_queue_writes_immediately_when_not_started(self):
+        trace_logger = MagicMock()
+        batcher = TraceBatcher(trace_logger)
+
+        batcher.queue(tool="search_arxiv")
+
+        (entries,), _ = trace_logger.log_many.call_args
+        assert entries[0]["tool"] == "search_arxiv"
+        assert "timestamp" in entries[0]
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_queued_records_in_one_batch(self):
+        trace_logger = MagicMock()
+        run_io = AsyncMock()
+        batcher = TraceBatcher(trace_logger, run_io=run_io, flush_delay=60)
+
+        batcher.start()
+        batcher.queue(tool="a")
+        batcher.queue(tool="b")
+        await batcher.stop()
+
+        run_io.assert_awaited_once()
+        fn, batch = run_io.await_args.args
+        assert fn == trace_logger.log_many
+        assert [e["tool"] for e in batch] == ["a", "b"]
+        trace_logger.log_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_failure_does_not_stop_the_flusher(self):
+        run_io = AsyncMock(side_effect=[RuntimeError("locked"), None])
+        batcher = TraceBatcher(MagicMock(), run_io=run_io, batch_max=1)
+
+        batcher.start()
+        batcher.queue(tool="a")
+        batcher.queue(tool="b")
+        await batcher.stop()
+
+        assert run_io.await_count == 2
@@ -8,6 +8,7 @@ import json
 import os
 import time
 import pytest
+from unittest.mock import patch
 
 from polaris.memory.embedder import OllamaEmbedder
 from polaris.memory.memory import PolarisMemory
@@ -150,6 +151,16 @@ class TestScanVault:
         results = reader.scan_vault()
         assert len(results) == 1
 
+    def test_scan_never_opens_skipped_dirs(self, reader, vault_dir):
+        _create_note(vault_dir, "a/.git/objects/x.md", "git internals")
+        _create_note(vault_dir, "a/b/deep.md", "# Deep\nNested note.")
+
+        with patch("polaris.memory.vault_reader.os.scandir", wraps=os.scandir) as scandir:
+            results = reader.scan_vault()
+
+        assert [r["title"] for r in results] == ["deep"]
+        assert not any(".git" in str(c.args[0]) for c in scandir.call_args_list)
+
     def test_scan_skips_small_files(self, reader, vault_dir):
         # Create small file (no padding)
         _create_note(vault_dir, "tiny.md", "# Tiny", size_pad=False)
@@ -258,6 +269,13 @@ class TestParseNote:
         assert "[[" not in parsed["content"]
         assert "display" in parsed["content"]
 
+    def test_strip_markdown_single_pass(self):
+        text = (
+            "## Title\n**[x](http://a)** and [<b>y</b>](u) and [[Note]]\n"
+            "![diagram](a.png) ![](b.png)\n<br>\n\n\n\nend"
+        )
+        assert VaultReader._strip_markdown(text) == "Title\nx and y and Note\n \n\nend"
+
     def test_parse_nonexistent_file(self, reader):
         parsed = reader.parse_note("/nonexistent/file.md")
         assert parsed["content"] == ""
@@ -341,6 +359,24 @@ class TestIndexVault:
         assert stats["new"] == 2
         assert stats["errors"] == 0
 
+    def test_large_reindex_parses_in_worker_processes(self, reader, vault_dir, monkeypatch):
+        import polaris.memory.vault_reader as vault_reader_mod
+
+        for i in range(3):
+            _create_note(vault_dir, f"note{i}.md", f"# Note {i}\n**Physics** [[Link{i}]] content.")
+        monkeypatch.setattr(vault_reader_mod, "PARSE_PROCESSES", 2)
+        monkeypatch.setattr(vault_reader_mod, "_PROCESS_PARSE_MIN_NOTES", 1)
+
+        with patch.object(reader, "parse_note", side_effect=AssertionError("thread path")):
+            stats = reader.index_vault()
+
+        assert (stats["new"], stats["errors"]) == (3, 0)
+        rows = reader.memory.conn.execute(
+            "SELECT title, content FROM knowledge WHERE source = 'obsidian' ORDER BY title"
+        ).fetchall()
+        assert [r["title"] for r in rows] == ["note0", "note1", "note2"]
+        assert "**" not in rows[0]["content"] and "Link0" in rows[0]["content"]
+
     def test_incremental_skips_unchanged(self, reader, vault_dir):
         _create_note(vault_dir, "note1.md", "# Note 1\nPhysics content.")
 
@@ -353,6 +389,20 @@ class TestIndexVault:
         assert stats2["skipped"] == 1
         assert stats2["new"] == 0
 
+    def test_touched_but_unedited_note_not_reembedded(self, reader, vault_dir):
+        path = _create_note(vault_dir, "note1.md", "# Note 1\nPhysics content.")
+        reader.index_vault()
+
+        future = time.time() + 60
+        os.utime(path, (future, future))
+        with patch.object(reader, "index_note", side_effect=AssertionError("re-embedded")):
+            stats = reader.index_vault()
+        assert stats["skipped"] == 1
+
+        path.write_text(path.read_text(encoding="utf-8") + "\nEdited.", encoding="utf-8")
+        os.utime(path, (future + 120, future + 120))
+        assert reader.index_vault()["updated"] == 1
+
     def test_force_reindexes_all(self, reader, vault_dir):
         _create_note(vault_dir, "note1.md", "# Note 1\nPhysics content.")
 